@@ -5,13 +5,8 @@
 cd /home/scipost/SciPost/scipost_django
 source ../venv-3.13/bin/activate
 
-python manage.py organization_update_cf_associated_publication_ids --settings=SciPost_v1.settings.production_do1
-
-python manage.py organization_update_cf_nr_associated_publications --settings=SciPost_v1.settings.production_do1
-
-python manage.py organization_update_cf_expenditure_for_publication --settings=SciPost_v1.settings.production_do1
-
-python manage.py organization_update_cf_balance_info --settings=SciPost_v1.settings.production_do1
+# Update all Organization calculated fields in one batch
+python manage.py organization_update_cfs --settings=SciPost_v1.settings.production_do1
 
 python manage.py affiliatejournal_update_publications_from_Crossref --settings=SciPost_v1.settings.production_do1
 
@@ -19,6 +14,9 @@ python manage.py affiliatejournal_update_publications_from_Crossref --settings=S
 # Update the fellowship of submissions for new fellows
 python manage.py update_submission_fellowships --settings=SciPost_v1.settings.production_do1
 
+# Refresh the pools of the fellows (e.g. for expired conflicts of interest)
+python manage.py refresh_pool_visibilities --settings=SciPost_v1.settings.production_do1
+
 # Update the users' groups 
 python manage.py update_user_permission_groups --settings=SciPost_v1.settings.production_do1
 
@@ -9,8 +9,11 @@ source ../venv-3.13/bin/activate
 python manage.py check_celery --settings=SciPost_v1.settings.production_do1
 python manage.py advance_git_repos --settings=SciPost_v1.settings.production_do1
 
-# Do a update_index of the last hour
-python manage.py update_index -r -v 0 -a 1 --settings=SciPost_v1.settings.production_do1
-
 # Run PubFrac compensations algorithm
-python manage.py compensate_pubfracs --settings=SciPost_v1.settings.production_do1
\ No newline at end of file
+python manage.py compensate_pubfracs --since_hours 1 --settings=SciPost_v1.settings.production_do1
+
+# Update calculated fields of Organizations touched in the last hour
+python manage.py organization_update_cfs --since_hours 1 --settings=SciPost_v1.settings.production_do1
+
+# Refresh the required actions of Submissions (e.g. for deadlines which passed)
+python manage.py refresh_required_actions --settings=SciPost_v1.settings.production_do1
\ No newline at end of file
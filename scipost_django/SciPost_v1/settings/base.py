@@ -186,7 +186,7 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.CountOptionalLimitOffsetPagination",
     "PAGE_SIZE": 25,
 }
 
@@ -407,6 +407,11 @@ MEDIA_ROOT_SECURE = "local_files/secure/media/"
 APIMAIL_MEDIA_ROOT_SECURE = "local_files/secure/apimail/"
 APIMAIL_MEDIA_URL_SECURE = "/apimail/files/secure/"
 
+# Directories whose files are served by the front proxy (nginx) with X-Accel-Redirect,
+# mapped to the proxy's internal locations, e.g. {MEDIA_ROOT: "/protected/media/"}.
+# Files outside of these are streamed by the workers (see common.utils.files).
+FILE_SERVING_ACCEL_REDIRECT = {}
+
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = "/static/"
 STATIC_ROOT = "local_files/static/"
@@ -425,7 +430,9 @@ WEBPACK_LOADER = {
 }
 
 # Email
-BULK_EMAIL_THROTTLE = 5
+# Mails sent per claimed batch, and per second, by the send_mails dispatcher
+MAIL_DISPATCH_BATCH_SIZE = 100
+MAIL_DISPATCH_MAX_RATE = 10
 EMAIL_BACKEND = "mails.backends.filebased.EmailBackend"
 EMAIL_FILE_PATH = "local_files/email/"
 EMAIL_SUBJECT_PREFIX = "[SciPost Server] "
@@ -443,11 +450,15 @@ ITHENTICATE_PASSWORD = "test_ithenticate_password"
 # Own settings
 JOURNALS_DIR = "journals"
 
+# Lifetime (in seconds) of the cached public pages served to anonymous visitors
+PAGE_CACHE_TIMEOUT = 60 * 60
+
 CROSSREF_LOGIN_ID = ""
 CROSSREF_LOGIN_PASSWORD = ""
 CROSSREF_DEBUG = True
 CROSSREF_DEPOSIT_EMAIL = "techsupport@scipost.org"
 CROSSREF_SCHEMA_FILE = "crossref/schemas/crossref5.4.0.xsd"
+CROSSREF_FORWARD_LINKS_URL = "http://doi.crossref.org/servlet/getForwardLinks"
 DOAJ_API_KEY = ""
 
 # Google reCaptcha with Google's global test keys
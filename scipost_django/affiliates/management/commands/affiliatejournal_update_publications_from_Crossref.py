@@ -5,7 +5,7 @@ __license__ = "AGPL v3"
 from django.core.management.base import BaseCommand
 
 from affiliates.models import AffiliateJournal
-from affiliates.services import get_affiliatejournal_publications_from_Crossref
+from affiliates.services import AffiliatePublicationsHarvester
 
 
 class Command(BaseCommand):
@@ -14,9 +14,23 @@ class Command(BaseCommand):
         "fetch recent publications from Crossref."
     )
 
-    def handle(self, *args, **kwargs):
-        for journal in AffiliateJournal.objects.all():
-            get_affiliatejournal_publications_from_Crossref(journal)
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of journals to harvest concurrently.",
+        )
+
+    def handle(self, *args, **options):
+        journals = AffiliateJournal.objects.all()
+        nr_created = AffiliatePublicationsHarvester(
+            max_workers=options["workers"]
+        ).harvest(journals)
         self.stdout.write(
-            self.style.SUCCESS("Successfully updated AffiliateJournal publications.")
+            self.style.SUCCESS(
+                "Successfully updated AffiliateJournal publications "
+                f"({sum(nr_created.values())} created, "
+                f"{len(journals) - len(nr_created)} journals failed)."
+            )
         )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("affiliates", "0013_affiliatejournal_description"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="affiliatejournal",
+            name="latest_crossref_harvest",
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
@@ -58,6 +58,9 @@ class AffiliateJournal(models.Model):
     # Cost per publication information
     cost_info = models.JSONField(default=cost_default_value)
 
+    # Works updated at Crossref from this date on are harvested next
+    latest_crossref_harvest = models.DateField(blank=True, null=True)
+
     class Meta:
         ordering = ["publisher", "name"]
         permissions = (("manage_journal_content", "Manage Journal content"),)
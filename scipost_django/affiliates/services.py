@@ -3,15 +3,128 @@ __license__ = "AGPL v3"
 
 
 import logging
-import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 
+from django.utils import timezone
+
+from preprints.servers.crossref import CrossrefQuery, CrossrefServer
 from scipost.services import extract_publication_date_from_Crossref_data
 
-from .models import AffiliatePublication
+from .models import AffiliateJournal, AffiliatePublication
 
 doi_logger = logging.getLogger("scipost.services.doi")
 
 
+class AffiliatePublicationsHarvester:
+    """
+    Harvest the publications of AffiliateJournals from Crossref.
+
+    For each journal, the works updated since its `latest_crossref_harvest`
+    (all of them for the first harvest) are fetched with cursor-based deep paging.
+    Up to `max_workers` journals are fetched concurrently, one page at a time,
+    while the new publications are created from the calling thread, in bulk for
+    each page as it arrives. At most a page per worker is thus held in memory.
+    """
+
+    def __init__(self, max_workers: int = 4, rows: int = 1000):
+        self.max_workers = max_workers
+        self.rows = rows
+
+    @staticmethod
+    def get_query(journal: AffiliateJournal) -> CrossrefQuery:
+        """Return the Crossref query for the works of the journal to harvest."""
+        query = CrossrefQuery().filter(container_title=journal.name)
+        if journal.latest_crossref_harvest:
+            query = query.filter(
+                from_update_date=journal.latest_crossref_harvest.isoformat()
+            )
+        return query
+
+    def fetch_page(
+        self, query: CrossrefQuery, cursor: str = "*"
+    ) -> tuple[list[dict], str | None]:
+        """Return a page of Crossref works, and the cursor of the next page, if any."""
+        message = CrossrefServer.request(query.cursor(cursor, self.rows))["message"]
+        items = message.get("items", [])
+        # The last page is either short or empty
+        next_cursor = message.get("next-cursor") if len(items) == self.rows else None
+        return items, next_cursor
+
+    @staticmethod
+    def create_publications(journal: AffiliateJournal, items: list[dict]) -> int:
+        """Create the publications of the works which are not known yet."""
+        items_by_doi = {item["DOI"]: item for item in items if item.get("DOI")}
+        existing_dois = set(
+            AffiliatePublication.objects.filter(doi__in=items_by_doi).values_list(
+                "doi", flat=True
+            )
+        )
+        new_publications = [
+            AffiliatePublication(
+                doi=doi,
+                _metadata_crossref=item,
+                journal=journal,
+                publication_date=extract_publication_date_from_Crossref_data(item)
+                or None,
+            )
+            for doi, item in items_by_doi.items()
+            if doi not in existing_dois
+        ]
+        AffiliatePublication.objects.bulk_create(
+            new_publications, ignore_conflicts=True
+        )
+        return len(new_publications)
+
+    def harvest(self, journals) -> dict[AffiliateJournal, int]:
+        """
+        Harvest the journals, returning the number of publications created for each.
+        A journal whose harvest fails is logged and skipped, keeping its watermark
+        (and the publications created from its pages fetched until then).
+        """
+        harvest_date = timezone.now().date()
+        journals = iter(journals)
+        nr_created = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # The page being fetched for each journal in progress
+            futures = {}
+
+            def fetch_next(journal, query, cursor="*"):
+                future = executor.submit(self.fetch_page, query, cursor)
+                futures[future] = (journal, query)
+
+            for journal in islice(journals, self.max_workers):
+                fetch_next(journal, self.get_query(journal))
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    journal, query = futures.pop(future)
+                    try:
+                        items, cursor = future.result()
+                    except Exception as e:
+                        doi_logger.error(
+                            "Crossref harvest failed for affiliate journal %s: %s",
+                            journal.name,
+                            e,
+                        )
+                    else:
+                        nr_created[journal] = nr_created.get(journal, 0)
+                        if items:
+                            nr_created[journal] += self.create_publications(
+                                journal, items
+                            )
+                        if cursor:
+                            fetch_next(journal, query, cursor)
+                            continue
+                        journal.latest_crossref_harvest = harvest_date
+                        journal.save(update_fields=["latest_crossref_harvest"])
+                    # This journal is done, start the next one
+                    if (journal := next(journals, None)) is not None:
+                        fetch_next(journal, self.get_query(journal))
+        return nr_created
+
+
 def get_affiliatejournal_publications_from_Crossref(journal):
     """
     For the given journal, get publication items via the Crossref API.
@@ -21,55 +134,4 @@ def get_affiliatejournal_publications_from_Crossref(journal):
     journal :
         An instance of AffiliateJournal
     """
-    rows = 20  # we get results in packs of 20 (Crossref default)
-    offset = 0  # we keep querying until we hit known publications
-    nr_created = 20
-    total_nr_created = 0
-    # Check number of available results:
-    response = requests.get(
-        ("http://api.crossref.org/works/" "?filter=container-title:%s&rows=0")
-        % journal.name,
-    ).json()
-    try:
-        total_results = response["message"]["total-results"]
-    except KeyError:
-        return
-    if not (type(total_results) == int and total_results > 0):
-        doi_logger.error(
-            (
-                "Incorrect total_results in "
-                "affiliates.get_affiliatejournal_publications_from_Crossref "
-                "for journal %s: total_results = %s"
-            )
-            % (journal.name, str(total_results))
-        )
-        return
-
-    while nr_created > 0 and total_nr_created < total_results:
-        nr_created = 0
-        response = requests.get(
-            (
-                "http://api.crossref.org/works/"
-                "?filter=container-title:%s&sort=issued&order=desc"
-                "&offset=%d"
-            )
-            % (journal.name, offset),
-        ).json()
-        try:
-            items = response["message"]["items"]
-            for item in items:
-                if not AffiliatePublication.objects.filter(doi=item["DOI"]).exists():
-                    publication_date = extract_publication_date_from_Crossref_data(item)
-                    afp = AffiliatePublication(
-                        doi=item["DOI"],
-                        _metadata_crossref=item,
-                        journal=journal,
-                        publication_date=publication_date,
-                    )
-                    afp.save()
-                    nr_created += 1
-            total_nr_created += nr_created
-            offset += rows
-        except KeyError:
-            pass
-    return total_nr_created
+    return AffiliatePublicationsHarvester(max_workers=1).harvest([journal]).get(journal)
@@ -0,0 +1,106 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..factories import AffiliateJournalFactory, AffiliatePublicationFactory
+from ..models import AffiliatePublication
+from ..services import AffiliatePublicationsHarvester
+
+
+def crossref_work(doi):
+    return {"DOI": doi, "title": [doi], "issued": {"date-parts": [[2024, 5]]}}
+
+
+class AffiliatePublicationsHarvesterTest(TestCase):
+    def setUp(self):
+        self.journal = AffiliateJournalFactory(name="Journal A")
+        self.other_journal = AffiliateJournalFactory(name="Journal B")
+        AffiliatePublicationFactory(journal=self.journal, doi="10.1234/a.2")
+        self.works = {
+            "Journal A": [crossref_work(f"10.1234/a.{i}") for i in range(1, 6)],
+            "Journal B": [],
+        }
+        self.queries = []
+        patcher = mock.patch(
+            "affiliates.services.CrossrefServer.request", side_effect=self.request
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request(self, query):
+        """Stub the Crossref API, paging with numbered cursors."""
+        params = {
+            key: value[0] for key, value in parse_qs(urlparse(query.url).query).items()
+        }
+        self.queries.append(params)
+        journal = params["filter"].split(",")[0].removeprefix("container-title:")
+        cursor = 0 if params["cursor"] == "*" else int(params["cursor"])
+        rows = int(params["rows"])
+        return {
+            "message": {
+                "items": self.works[journal][cursor : cursor + rows],
+                "next-cursor": str(cursor + rows),
+            }
+        }
+
+    def test_harvest(self):
+        harvester = AffiliatePublicationsHarvester(max_workers=2, rows=2)
+        with self.assertNumQueries(3 * 2 + 2):
+            # A lookup and an insert per page, and the watermarks
+            nr_created = harvester.harvest([self.journal, self.other_journal])
+        self.assertEqual(nr_created, {self.journal: 4, self.other_journal: 0})
+        # Three pages for Journal A, including the last short one
+        self.assertEqual(len(self.queries), 4)
+        self.assertCountEqual(
+            self.journal.publications.values_list("doi", flat=True),
+            [f"10.1234/a.{i}" for i in range(1, 6)],
+        )
+        self.assertEqual(
+            AffiliatePublication.objects.get(doi="10.1234/a.1").publication_date,
+            datetime.date(2024, 5, 1),
+        )
+
+        # The next harvest only asks for the works updated since
+        self.journal.refresh_from_db()
+        today = timezone.now().date()
+        self.assertEqual(self.journal.latest_crossref_harvest, today)
+        self.queries = []
+        self.works["Journal A"] = [crossref_work("10.1234/a.6")]
+        self.assertEqual(harvester.harvest([self.journal]), {self.journal: 1})
+        self.assertIn(
+            f"from-update-date:{today.isoformat()}", self.queries[0]["filter"]
+        )
+
+    def test_harvest_failure(self):
+        self.works.pop("Journal B")
+        nr_created = AffiliatePublicationsHarvester(rows=10).harvest(
+            [self.journal, self.other_journal]
+        )
+        self.assertEqual(nr_created, {self.journal: 4})
+        self.other_journal.refresh_from_db()
+        self.assertIsNone(self.other_journal.latest_crossref_harvest)
+
+    def test_harvest_failure_on_later_page(self):
+        request = self.request
+
+        def failing_request(query):
+            if "cursor=4" in query.url:
+                raise ConnectionError("Crossref unavailable")
+            return request(query)
+
+        harvester = AffiliatePublicationsHarvester(max_workers=1, rows=2)
+        with mock.patch(
+            "affiliates.services.CrossrefServer.request", side_effect=failing_request
+        ):
+            nr_created = harvester.harvest([self.journal, self.other_journal])
+        # The pages fetched before the failure are written as they arrive
+        self.assertEqual(nr_created, {self.journal: 3, self.other_journal: 0})
+        self.assertEqual(self.journal.publications.count(), 4)
+        self.journal.refresh_from_db()
+        self.assertIsNone(self.journal.latest_crossref_harvest)
@@ -0,0 +1,80 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CountOptionalLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination, for which the total count can be skipped
+    by passing `count=false`, avoiding a full scan of the filtered queryset.
+
+    Without the count, one extra row is fetched to determine whether
+    there is a next page, and the `count` key is left out of the response.
+    """
+
+    count_query_param = "count"
+
+    def count_requested(self, request):
+        return request.query_params.get(self.count_query_param, "").lower() not in [
+            "false",
+            "0",
+        ]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.count_requested(request):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.count = None
+        self.offset = self.get_offset(request)
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        # Page links need the count
+        self.display_page_controls = False
+        return results[: self.limit]
+
+    def get_next_link(self):
+        if self.count is not None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
+
+    def get_paginated_response(self, data):
+        if self.count is not None:
+            return super().get_paginated_response(data)
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination on the view's `cursor_ordering`, for walking through
+    large listings with a constant cost per page, and without counting.
+
+    The ordering is fixed by the view (its first field should be indexed, and the
+    last one unique); the `ordering` query parameter is ignored.
+    """
+
+    page_size_query_param = "limit"
+    max_page_size = 1000
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(getattr(view, "cursor_ordering", ("-id",)))
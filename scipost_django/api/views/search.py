@@ -5,10 +5,27 @@ __license__ = "AGPL v3"
 import json
 
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.filters import SearchFilter
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 
+class FullTextSearchFilter(SearchFilter):
+    """
+    Search filter using the ranked full text search of the queryset
+    (see `common.utils.search.FullTextSearchQuerySetMixin`) instead of
+    `icontains` lookups on each of the view's `search_fields`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not hasattr(queryset, "search"):
+            return super().filter_queryset(request, queryset, view)
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+        return queryset.search(" ".join(search_terms))
+
+
 @api_view()
 @permission_classes(
     [
@@ -2,28 +2,88 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
 
 from rest_framework import viewsets
 
 
+def lookup_spans_multivalued_relation(model, lookup):
+    """
+    Whether filtering `model` on `lookup` joins a reverse foreign key or a
+    many-to-many relation, which may duplicate the rows of the queryset.
+    """
+    opts = model._meta
+    for part in lookup.split(LOOKUP_SEP):
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            # A transform or lookup
+            return False
+        if not field.is_relation:
+            return False
+        if field.many_to_many or field.one_to_many:
+            return True
+        opts = field.related_model._meta
+    return False
+
+
 class ExtraFilteredReadOnlyModelViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         """
         Filter queryset according to `extra_filterset_fields` attribute.
         """
         queryset = super().get_queryset()
-        if hasattr(self, "extra_filters"):
-            for label, queryspec in self.extra_filters.items():
-                for lookup in queryspec["lookups"]:
-                    param = self.request.query_params.get(
-                        "%s__%s" % (label, lookup), None
-                    )
-                    if param:
-                        query = Q()
-                        for field in queryspec["fields"]:
-                            querydict = {}
-                            querydict["%s__%s" % (field, lookup)] = param
-                            query = query | Q(**querydict)
-                        queryset = queryset.filter(query)
-        return queryset.distinct()
+        for label, queryspec in self.get_extra_filters_in_request():
+            for lookup in queryspec["lookups"]:
+                param = self.request.query_params.get("%s__%s" % (label, lookup), None)
+                if param:
+                    query = Q()
+                    for field in queryspec["fields"]:
+                        querydict = {}
+                        querydict["%s__%s" % (field, lookup)] = param
+                        query = query | Q(**querydict)
+                    queryset = queryset.filter(query)
+        return queryset
+
+    def get_extra_filters_in_request(self):
+        return [
+            (label, queryspec)
+            for label, queryspec in getattr(self, "extra_filters", {}).items()
+            if any(
+                self.request.query_params.get("%s__%s" % (label, lookup))
+                for lookup in queryspec["lookups"]
+            )
+        ]
+
+    def get_filtered_lookups(self):
+        """
+        Return the field lookups of the extra and filterset filters used in the request.
+        """
+        lookups = [
+            field
+            for _, queryspec in self.get_extra_filters_in_request()
+            for field in queryspec["fields"]
+        ]
+        filterset_class = getattr(self, "filterset_class", None)
+        if filterset_class is not None:
+            lookups += [
+                filter.field_name
+                for name, filter in filterset_class.base_filters.items()
+                if self.request.query_params.get(name)
+            ]
+        return lookups
+
+    def filter_queryset(self, queryset):
+        """
+        Only make the filtered queryset distinct if a filter may duplicate its rows,
+        since `DISTINCT` forces the database to go through the whole filtered set.
+        """
+        queryset = super().filter_queryset(queryset)
+        if any(
+            lookup_spans_multivalued_relation(queryset.model, lookup)
+            for lookup in self.get_filtered_lookups()
+        ):
+            queryset = queryset.distinct()
+        return queryset
@@ -5,6 +5,8 @@ __license__ = "AGPL v3"
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from api.pagination import KeysetCursorPagination
+
 
 class FilteringOptionsActionMixin:
     """
@@ -39,3 +41,28 @@ class FilteringOptionsActionMixin:
             ],
         }
         return Response(filtering_options)
+
+
+class CursorPaginationMixin:
+    """
+    Mixin for letting clients page through a viewset with a cursor on `cursor_ordering`
+    (by passing a `cursor` query parameter, empty for the first page)
+    instead of the default limit/offset pagination.
+    """
+
+    cursor_ordering = ("-id",)
+    cursor_pagination_class = KeysetCursorPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            request = getattr(self, "request", None)
+            if (
+                request is not None
+                and self.cursor_pagination_class.cursor_query_param
+                in request.query_params
+            ):
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
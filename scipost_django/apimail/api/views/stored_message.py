@@ -4,7 +4,8 @@ __license__ = "AGPL v3"
 
 import datetime
 
-from django.db.models import Q
+from django.contrib.postgres.search import SearchRank
+from django.db.models import F, Q
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
@@ -13,6 +14,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import filters
 
+from common.utils.search import TSFilter, search_query
 
 from ...models import StoredMessage, UserTag
 from ..serializers import StoredMessageSerializer
@@ -64,35 +66,31 @@ class StoredMessageFilterBackend(filters.BaseFilterBackend):
         if tagpklist:
             queryset = queryset.filter(tags__pk__in=tagpklist)
 
-        _from = request.query_params.get("from", None)
-        if _from is not None:
-            queryfilter = queryfilter | Q(data__from__icontains=_from)
-        subject = request.query_params.get("subject", None)
-        if subject is not None:
-            queryfilter = queryfilter | Q(data__subject__icontains=subject)
-        recipients = request.query_params.get("recipients", None)
-        if recipients is not None:
-            queryfilter = queryfilter | Q(data__recipients__icontains=recipients)
-
-        # For full-text searches through body-plain / body-html, we use a
-        # raw SQL query since Django ORM does not support hyphenated lookups,
-        # and since Mailgun uses hyphenated keys in its JSON responses.
-        body = request.query_params.get("body", None)
-        if body is not None:
-            query_raw = (
-                "SELECT apimail_storedmessage.id FROM apimail_storedmessage "
-                "WHERE UPPER((apimail_storedmessage.data ->> %s)::text) LIKE UPPER(%s) "
-                "OR UPPER((apimail_storedmessage.data ->> %s)::text) LIKE UPPER(%s) "
-                "ORDER BY apimail_storedmessage.datetimestamp DESC;"
-            )
-            sm_ids = [
-                sm.id
-                for sm in StoredMessage.objects.raw(
-                    query_raw,
-                    ["body-plain", "%%%s%%" % body, "body-html", "%%%s%%" % body],
+        # Ranked full text search in the fields given (usually with the same text),
+        # restricted to these fields' lexemes in the search vector
+        search_texts = {}
+        for field in StoredMessage.SEARCH_VECTOR_WEIGHTS:
+            text = request.query_params.get(field, None)
+            if text:
+                search_texts.setdefault(text, []).append(field)
+        search_ranks = []
+        for n, (text, fields) in enumerate(search_texts.items()):
+            query = search_query(text)
+            vector = F("search_vector")
+            textfilter = Q(search_vector=query)
+            if len(fields) < len(StoredMessage.SEARCH_VECTOR_WEIGHTS):
+                vector = TSFilter(
+                    vector, [StoredMessage.SEARCH_VECTOR_WEIGHTS[f] for f in fields]
                 )
-            ]
-            queryfilter = queryfilter | Q(pk__in=sm_ids)
+                # The unfiltered match is kept to use the index
+                queryset = queryset.alias(**{f"search_vector_{n}": vector})
+                textfilter &= Q(**{f"search_vector_{n}": query})
+            # Addresses are moreover matched as substrings
+            for field in StoredMessage.SEARCH_ADDRESS_FIELDS:
+                if field in fields:
+                    textfilter |= Q(**{f"data__{field}__icontains": text})
+            queryfilter = queryfilter | textfilter
+            search_ranks.append(SearchRank(vector, query))
 
         attachment_filename = request.query_params.get("attachment", None)
         if attachment_filename is not None:
@@ -100,7 +98,13 @@ class StoredMessageFilterBackend(filters.BaseFilterBackend):
                 attachment_files__data__name__icontains=attachment_filename
             )
 
-        return queryset.filter(queryfilter).filter_for_user(
+        queryset = queryset.filter(queryfilter)
+        if search_ranks:
+            queryset = queryset.annotate(
+                search_rank=sum(search_ranks[1:], search_ranks[0])
+            )
+            queryset = queryset.order_by("-search_rank", "-datetimestamp")
+        return queryset.filter_for_user(
             request.user, request.query_params.get("account")
         )
 
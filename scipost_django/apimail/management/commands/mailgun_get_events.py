@@ -39,11 +39,13 @@ def get_and_save_events(url=None, domain_name=None, nr_minutes=2):
     try:
         events = response["items"]
         print("Retrieved %d events" % len(response["items"]))
+        # Known events are skipped through the unique mailgun_id and timestamp
+        new_events = []
         for item in events:
-            if not Event.objects.filter(
-                data__timestamp=item["timestamp"], data__id=item["id"]
-            ).exists():
-                Event.objects.create(data=item)
+            event = Event(data=item)
+            event.set_ids_from_data()
+            new_events.append(event)
+        Event.objects.bulk_create(new_events, ignore_conflicts=True)
         info = {"nitems": len(events)}
         if "paging" in response:
             info["paging"] = response["paging"]
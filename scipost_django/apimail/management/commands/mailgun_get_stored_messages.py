@@ -11,7 +11,6 @@ from django.conf import settings
 from django.core.files import File
 from django.core.management import BaseCommand
 
-from ...exceptions import APIMailError
 from ...models import AttachmentFile, Event, StoredMessage
 
 
@@ -24,58 +23,44 @@ class Command(BaseCommand):
     help = "Gets stored messages from the Mailgun API and saves them to the DB."
 
     def handle(self, *args, **kwargs):
-        orphaned_events = Event.objects.filter(stored_message__isnull=True)
-        for orphan in orphaned_events.all():
-            if orphan.stored_message:
-                # FK link to message created through other event in this loop
-                continue
-
-            try:
-                sm = StoredMessage.objects.get(
-                    # Careful: Mailgun annoyingly uses different formats for message id:
-                    # message-id: [id] in Event, Message-Id: <[id]> in Message
-                    data__contains={
-                        "Message-Id": "<%s>"
-                        % orphan.data["message"]["headers"]["message-id"]
-                    }
-                )
-                # Message found, simply add pk
-                orphan.stored_message = sm
-                orphan.save()
+        # Link the orphaned Events to the messages already stored
+        Event.objects.link_stored_messages()
 
-            except StoredMessage.DoesNotExist:
-                # Need to get and create the message
-                try:
-                    storage_url = orphan.data["storage"]["url"]
-                except KeyError:
-                    continue
-                response = requests.get(
-                    storage_url, auth=("api", settings.MAILGUN_API_KEY)
-                )
-                if not response.status_code == 200:
-                    continue
-                response = response.json()
-                sm = StoredMessage.objects.create(
-                    data=response, datetimestamp=parsedate_to_datetime(response["Date"])
-                )
+        # Get the other messages, once per message id
+        orphaned_messages = (
+            Event.objects.filter(
+                stored_message__isnull=True, data__storage__has_key="url"
+            )
+            .exclude(message_id="")
+            .order_by("message_id")
+            .distinct("message_id")
+            .values_list("message_id", "data__storage__url")
+        )
+        for message_id, storage_url in orphaned_messages:
+            response = requests.get(storage_url, auth=("api", settings.MAILGUN_API_KEY))
+            if not response.status_code == 200:
+                continue
+            response = response.json()
+            sm = StoredMessage.objects.create(
+                data=response, datetimestamp=parsedate_to_datetime(response["Date"])
+            )
 
-                # Now deal with attachments
-                for att_item in response["attachments"]:
-                    with TemporaryFile() as tf:
-                        r = requests.get(
-                            att_item["url"],
-                            auth=("api", settings.MAILGUN_API_KEY),
-                            stream=True,
-                        )
-                        for chunk in r.iter_content(chunk_size=8192):
-                            tf.write(chunk)
-                        tf.seek(0)
-                        af = AttachmentFile.objects.create(data=att_item)
-                        af.file.save(att_item["name"], File(tf))
-                        sm.attachment_files.add(af)
+            # Now deal with attachments
+            for att_item in response["attachments"]:
+                with TemporaryFile() as tf:
+                    r = requests.get(
+                        att_item["url"],
+                        auth=("api", settings.MAILGUN_API_KEY),
+                        stream=True,
+                    )
+                    for chunk in r.iter_content(chunk_size=8192):
+                        tf.write(chunk)
+                    tf.seek(0)
+                    af = AttachmentFile.objects.create(data=att_item)
+                    af.file.save(att_item["name"], File(tf))
+                    sm.attachment_files.add(af)
 
-                # Finally add a FK relation to any event associated to this new message
-                msgid = (sm.data["Message-Id"].lstrip("<")).rstrip(">")
-                Event.objects.filter(
-                    data__message__headers__contains={"message-id": msgid}
-                ).update(stored_message=sm)
+            # Finally add a FK relation to any event associated to this new message
+            Event.objects.filter(
+                message_id=message_id, stored_message__isnull=True
+            ).update(stored_message=sm)
@@ -14,6 +14,24 @@ class DomainQuerySet(models.QuerySet):
         return self.filter(status=Domain.STATUS_ACTIVE)
 
 
+class EventQuerySet(models.QuerySet):
+    def link_stored_messages(self):
+        """
+        Link the Events without StoredMessage to the StoredMessage
+        with the same message id, if present, in a single update.
+        """
+        from apimail.models import StoredMessage
+
+        stored_messages = StoredMessage.objects.filter(
+            message_id=models.OuterRef("message_id")
+        )
+        return (
+            self.filter(stored_message__isnull=True)
+            .filter(models.Exists(stored_messages))
+            .update(stored_message=models.Subquery(stored_messages.values("id")[:1]))
+        )
+
+
 class EmailAccountAccessQuerySet(models.QuerySet):
     def current(self):
         today = datetime.date.today()
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("apimail", "0033_alter_storedmessage_read_by"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="mailgun_id",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="timestamp",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="message_id",
+            field=models.CharField(blank=True, db_index=True, max_length=512),
+        ),
+        migrations.AddField(
+            model_name="storedmessage",
+            name="message_id",
+            field=models.CharField(blank=True, max_length=512, null=True),
+        ),
+        migrations.RunSQL(
+            sql=[
+                """
+                UPDATE apimail_event SET
+                    mailgun_id = data->>'id',
+                    timestamp = (data->>'timestamp')::double precision,
+                    message_id = COALESCE(data->'message'->'headers'->>'message-id', '');
+                """,
+                """
+                UPDATE apimail_storedmessage SET
+                    message_id = NULLIF(TRIM(BOTH '<>' FROM data->>'Message-Id'), '');
+                """,
+                # Only the first of any duplicates keeps its id
+                """
+                UPDATE apimail_event SET mailgun_id = NULL
+                WHERE id NOT IN (
+                    SELECT MIN(id) FROM apimail_event GROUP BY mailgun_id, timestamp
+                );
+                """,
+                """
+                UPDATE apimail_storedmessage SET message_id = NULL
+                WHERE id NOT IN (
+                    SELECT MIN(id) FROM apimail_storedmessage GROUP BY message_id
+                );
+                """,
+            ],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.UniqueConstraint(
+                fields=("mailgun_id", "timestamp"),
+                name="unique_together_mailgun_id_timestamp",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="storedmessage",
+            name="message_id",
+            field=models.CharField(blank=True, max_length=512, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,124 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:00
+
+import common.utils.lookups
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.fields.json
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_add_immutable_unaccent_function"),
+        ("apimail", "0034_event_storedmessage_message_ids"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="storedmessage",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector(
+                                common.utils.lookups.ImmutableUnaccent(
+                                    django.db.models.fields.json.KeyTextTransform(
+                                        "subject", "data"
+                                    )
+                                ),
+                                config="english",
+                                weight="A",
+                            ),
+                            "||",
+                            django.contrib.postgres.search.SearchVector(
+                                common.utils.lookups.ImmutableUnaccent(
+                                    django.db.models.fields.json.KeyTextTransform(
+                                        "from", "data"
+                                    )
+                                ),
+                                config="english",
+                                weight="B",
+                            ),
+                            django.contrib.postgres.search.SearchConfig("english"),
+                        ),
+                        "||",
+                        django.contrib.postgres.search.SearchVector(
+                            common.utils.lookups.ImmutableUnaccent(
+                                django.db.models.fields.json.KeyTextTransform(
+                                    "recipients", "data"
+                                )
+                            ),
+                            config="english",
+                            weight="C",
+                        ),
+                        django.contrib.postgres.search.SearchConfig("english"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        common.utils.lookups.ImmutableUnaccent(
+                            django.db.models.functions.text.Left(
+                                django.db.models.fields.json.KeyTextTransform(
+                                    "body-plain", "data"
+                                ),
+                                100000,
+                            )
+                        ),
+                        config="english",
+                        weight="D",
+                    ),
+                    django.contrib.postgres.search.SearchConfig("english"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="storedmessage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="apimail_sto_search__065351_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="storedmessage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.fields.json.KeyTextTransform("from", "data")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="apimail_sm_from_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="storedmessage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.fields.json.KeyTextTransform("sender", "data")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="apimail_sm_sender_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="storedmessage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.fields.json.KeyTextTransform(
+                            "recipients", "data"
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="apimail_sm_recipients_trgm_idx",
+            ),
+        ),
+    ]
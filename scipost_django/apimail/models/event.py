@@ -7,6 +7,8 @@ import uuid as uuid_lib
 from django.db import models
 from django.urls import reverse
 
+from ..managers import EventQuerySet
+
 
 class Event(models.Model):
     """
@@ -35,10 +37,24 @@ class Event(models.Model):
         "apimail.StoredMessage", blank=True, null=True, on_delete=models.CASCADE
     )
 
+    # Extracted from the data, for lookups
+    mailgun_id = models.CharField(max_length=64, blank=True, null=True)
+    timestamp = models.FloatField(blank=True, null=True)
+    message_id = models.CharField(max_length=512, blank=True, db_index=True)
+
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = [
             "-data__timestamp",
         ]
+        constraints = [
+            # Mailgun event ids are only guaranteed to be unique within a day
+            models.UniqueConstraint(
+                fields=["mailgun_id", "timestamp"],
+                name="unique_together_mailgun_id_timestamp",
+            ),
+        ]
 
     def __str__(self):
         return "%s: %s -- %s" % (
@@ -47,5 +63,20 @@ class Event(models.Model):
             self.data["event"],
         )
 
+    def save(self, *args, **kwargs):
+        self.set_ids_from_data()
+        return super().save(*args, **kwargs)
+
+    def set_ids_from_data(self):
+        """
+        Set the Mailgun event id and timestamp, and the message id
+        (without angle brackets) from the data (to be called before `bulk_create`).
+        """
+        self.mailgun_id = self.data.get("id")
+        self.timestamp = self.data.get("timestamp")
+        self.message_id = (
+            self.data.get("message", {}).get("headers", {}).get("message-id", "")
+        )
+
     def get_absolute_url(self):
         return reverse("apimail:event_detail", kwargs={"uuid": self.uuid})
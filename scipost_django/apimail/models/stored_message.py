@@ -5,10 +5,16 @@ import pytz
 import uuid as uuid_lib
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.fields.json import KT
+from django.db.models.functions import Left, Upper
 from django.urls import reverse
 from django.utils import timezone
 
+from common.utils.search import weighted_search_vector
+
 from ..managers import StoredMessageQuerySet
 from ..storage import APIMailSecureFileStorage
 from ..validators import validate_max_email_mime_file_size
@@ -34,6 +40,15 @@ class StoredMessage(models.Model):
     Storage class for an email message stored at Mailgun.
     """
 
+    SEARCH_VECTOR_WEIGHTS = {
+        "subject": "A",
+        "from": "B",
+        "recipients": "C",
+        "body": "D",
+    }
+    # Searched as substrings (with the trigram indexes) besides full text
+    SEARCH_ADDRESS_FIELDS = ["from", "recipients"]
+
     uuid = models.UUIDField(  # Used by the API to look up the record
         db_index=True, default=uuid_lib.uuid4, editable=False
     )
@@ -42,6 +57,9 @@ class StoredMessage(models.Model):
 
     datetimestamp = models.DateTimeField(default=timezone.now)
 
+    # Extracted from data["Message-Id"], without angle brackets as in Events
+    message_id = models.CharField(max_length=512, unique=True, blank=True, null=True)
+
     read_by = models.ManyToManyField(
         settings.AUTH_USER_MODEL, blank=True, related_name="+"
     )
@@ -62,12 +80,45 @@ class StoredMessage(models.Model):
         null=True,
     )
 
+    # Full text search, maintained by the database
+    search_vector = models.GeneratedField(
+        expression=weighted_search_vector(
+            SEARCH_VECTOR_WEIGHTS,
+            expressions={
+                "subject": KT("data__subject"),
+                "from": KT("data__from"),
+                "recipients": KT("data__recipients"),
+                # Truncated, since a tsvector cannot exceed 1MB
+                "body": Left(KT("data__body-plain"), 100000),
+            },
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     objects = StoredMessageQuerySet.as_manager()
 
     class Meta:
         ordering = [
             "-datetimestamp",
         ]
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            # For the case-insensitive substring lookups on addresses,
+            # as in `data__sender__icontains`
+            GinIndex(
+                OpClass(Upper(KT("data__from")), name="gin_trgm_ops"),
+                name="apimail_sm_from_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper(KT("data__sender")), name="gin_trgm_ops"),
+                name="apimail_sm_sender_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper(KT("data__recipients")), name="gin_trgm_ops"),
+                name="apimail_sm_recipients_trgm_idx",
+            ),
+        ]
 
     def __str__(self):
         return "%s: %s (from %s to %s)" % (
@@ -77,6 +128,10 @@ class StoredMessage(models.Model):
             self.data["To"],
         )
 
+    def save(self, *args, **kwargs):
+        self.message_id = self.data.get("Message-Id", "").strip("<>") or None
+        return super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         return reverse("apimail:message_detail", kwargs={"uuid": self.uuid})
 
@@ -0,0 +1,83 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from ..api.views.stored_message import StoredMessageFilterBackend
+from ..models import StoredMessage
+
+
+def message(subject, sender, recipients, body, message_id):
+    return StoredMessage.objects.create(
+        data={
+            "Message-Id": f"<{message_id}>",
+            "subject": subject,
+            "from": sender,
+            "sender": sender,
+            "recipients": recipients,
+            "body-plain": body,
+        }
+    )
+
+
+class StoredMessageSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="staff", email="staff@example.org", is_staff=True
+        )
+        cls.proofs = message(
+            "Proofs of your manuscript",
+            "Production Team <production@scipost.org>",
+            "author@university.edu",
+            "Please find the proofs of your manuscript attached.",
+            "1@scipost.org",
+        )
+        cls.invitation = message(
+            "Invitation to referee",
+            "Editorial Office <edadmin@scipost.org>",
+            "referee@institute.org",
+            "We would like to invite you to referee a manuscript.",
+            "2@scipost.org",
+        )
+        cls.newsletter = message(
+            "Newsletter",
+            "News <news@example.com>",
+            "subscribers@example.com",
+            "Nothing about referees here.",
+            "3@example.com",
+        )
+
+    def search(self, **params):
+        request = Request(APIRequestFactory().get("/", params))
+        request.user = self.user
+        return list(
+            StoredMessageFilterBackend().filter_queryset(
+                request, StoredMessage.objects.all(), None
+            )
+        )
+
+    def test_search_fields(self):
+        fields = ["from", "recipients", "subject", "body"]
+        # Stemmed words, ranked higher in the subject than in the body
+        self.assertEqual(
+            self.search(**{field: "referees" for field in fields}),
+            [self.invitation, self.newsletter],
+        )
+        self.assertEqual(self.search(subject="referee"), [self.invitation])
+        self.assertEqual(
+            self.search(body="manuscripts"), [self.invitation, self.proofs]
+        )
+        # Matching in the second of the fields only
+        self.assertEqual(
+            self.search(subject="attached", body="attached"), [self.proofs]
+        )
+        # Addresses are matched as substrings
+        self.assertEqual(self.search(recipients="univers"), [self.proofs])
+        self.assertEqual(
+            self.search(**{"from": "scipost.org"}), [self.invitation, self.proofs]
+        )
+        self.assertEqual(self.search(subject="scipost"), [])
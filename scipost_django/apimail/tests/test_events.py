@@ -0,0 +1,67 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+from unittest import mock
+
+from django.test import TestCase
+
+from ..management.commands.mailgun_get_events import get_and_save_events
+from ..models import Event, StoredMessage
+
+
+def event_data(mailgun_id, message_id, timestamp=1700000000.0):
+    return {
+        "id": mailgun_id,
+        "event": "delivered",
+        "timestamp": timestamp,
+        "message": {"headers": {"message-id": message_id}},
+        "storage": {"url": f"https://storage.example.org/{message_id}"},
+    }
+
+
+class EventIngestionTest(TestCase):
+    @mock.patch("apimail.management.commands.mailgun_get_events.requests")
+    def test_get_and_save_events(self, mock_requests):
+        Event.objects.create(data=event_data("known", "a@example.org"))
+        items = [
+            event_data("known", "a@example.org"),
+            event_data("new-1", "a@example.org", timestamp=1700000001.0),
+            event_data("new-2", "b@example.org", timestamp=1700000002.0),
+            # Mailgun event ids may repeat on another day
+            event_data("known", "c@example.org", timestamp=1700100000.0),
+        ]
+        mock_requests.get.return_value.json.return_value = {
+            "items": items,
+            "paging": {"next": "https://api.example.org/next"},
+        }
+        with self.assertNumQueries(1):
+            info = get_and_save_events(url="https://api.example.org/events")
+        self.assertEqual(info["nitems"], 4)
+        self.assertCountEqual(
+            Event.objects.values_list("mailgun_id", "message_id"),
+            [
+                ("known", "a@example.org"),
+                ("new-1", "a@example.org"),
+                ("new-2", "b@example.org"),
+                ("known", "c@example.org"),
+            ],
+        )
+
+    def test_link_stored_messages(self):
+        linked = [
+            Event.objects.create(data=event_data(f"event-{i}", "a@example.org"))
+            for i in range(2)
+        ]
+        unlinked = Event.objects.create(data=event_data("event-2", "b@example.org"))
+        message = StoredMessage.objects.create(
+            data={"Message-Id": "<a@example.org>", "From": "", "To": ""}
+        )
+        self.assertEqual(message.message_id, "a@example.org")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(Event.objects.link_stored_messages(), 2)
+        for event in linked:
+            event.refresh_from_db()
+            self.assertEqual(event.stored_message, message)
+        unlinked.refresh_from_db()
+        self.assertIsNone(unlinked.stored_message)
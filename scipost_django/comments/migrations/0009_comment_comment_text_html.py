@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0008_alter_comment_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="comment_text_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
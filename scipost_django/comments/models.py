@@ -12,6 +12,7 @@ from django.urls import reverse
 
 from guardian.shortcuts import assign_perm
 
+from markup.mixins import MarkupHTMLFieldsMixin
 from scipost.behaviors import TimeStampedModel
 from scipost.models import Contributor
 from commentaries.constants import COMMENTARY_PUBLISHED
@@ -41,7 +42,7 @@ WARNING_TEXT = (
 US_NOTICE = "Warning: This field is out of service and will be removed in the future."
 
 
-class Comment(TimeStampedModel):
+class Comment(MarkupHTMLFieldsMixin, TimeStampedModel):
     """A Comment is an unsollicited note, submitted by a Contributor.
 
     A Comment is pointed to a particular Publication, Report or in reply
@@ -103,6 +104,8 @@ class Comment(TimeStampedModel):
         default=False, verbose_name="suggestion for further work"
     )
     comment_text = models.TextField()
+    comment_text_html = models.TextField(blank=True, editable=False)
+    markup_html_fields = {"comment_text": "comment_text_html"}
     remarks_for_editors = models.TextField(
         blank=True, verbose_name="optional remarks for the Editors only"
     )
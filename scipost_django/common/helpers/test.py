@@ -2,10 +2,92 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import scipost.management.commands.add_groups_and_permissions
+from journals.constants import PUBLICATION_PUBLISHED
+from journals.models import Publication, PublicationAuthorsTable
+from preprints.factories import PreprintFactory
+from scipost.models import Contributor
+from submissions.models import Submission
 
 
 def add_groups_and_permissions():
     scipost.management.commands.add_groups_and_permissions.Command().handle(
         verbose=False
     )
+
+
+def create_publication(journal, paper_nr, affiliations, publication_date):
+    """Create a bare published Publication with one author per affiliation list."""
+    acad_field = journal.college.acad_field
+    submission = Submission.objects.create(
+        preprint=PreprintFactory(),
+        author_list="A. Uthor",
+        acad_field=acad_field,
+        submitted_by=Contributor.objects.create(),
+        submitted_to=journal,
+        title=f"Title {paper_nr}",
+        abstract="Abstract",
+    )
+    publication = Publication.objects.create(
+        accepted_submission=submission,
+        in_journal=journal,
+        paper_nr=paper_nr,
+        status=PUBLICATION_PUBLISHED,
+        title=submission.title,
+        author_list=submission.author_list,
+        abstract=submission.abstract,
+        acad_field=acad_field,
+        doi_label=f"{journal.doi_label}.{paper_nr}",
+        submission_date=publication_date,
+        acceptance_date=publication_date,
+        publication_date=publication_date,
+    )
+    for order, orgs in enumerate(affiliations, start=1):
+        author = PublicationAuthorsTable.objects.create(
+            publication=publication, order=order
+        )
+        author.affiliations.add(*orgs)
+    return publication
+
+
+@contextmanager
+def stub_http_server(respond):
+    """
+    Run a local HTTP server for the duration of the context.
+
+    Each request is answered by `respond(method, path)`, which returns
+    a (status, body) tuple. The yielded server has the base `url` to query,
+    and records the (method, path) of the received `requests`.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def handle_request(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            server.requests.append((self.command, self.path))
+            status, body = respond(self.command, self.path)
+            body = body.encode() if isinstance(body, str) else body
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = handle_request
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
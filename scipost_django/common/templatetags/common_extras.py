@@ -112,3 +112,42 @@ def default_if_none(value, default):
     if value is None:
         return default
     return value
+
+
+class PageCacheNode(template.Node):
+    def __init__(self, nodelist, page_cache, fragment):
+        self.nodelist = nodelist
+        self.page_cache = page_cache
+        self.fragment = fragment
+
+    def render(self, context):
+        page_cache = self.page_cache.resolve(context)
+        if page_cache is None:
+            return self.nodelist.render(context)
+        fragment = self.fragment.resolve(context)
+        content = page_cache.fragments.get(fragment)
+        if content is None:
+            content = self.nodelist.render(context)
+            page_cache.set(fragment, content)
+        return content
+
+
+@register.tag
+def pagecache(parser, token):
+    """
+    Render the enclosed fragment from the PageCache, caching it on a miss
+    (or render it directly if the PageCache is None):
+
+    {% pagecache page_cache "content" %} ... {% endpagecache %}
+    """
+    try:
+        tag_name, page_cache, fragment = token.split_contents()
+    except ValueError:
+        raise template.TemplateSyntaxError(
+            "%r tag requires a PageCache and a fragment name" % token.contents
+        )
+    nodelist = parser.parse(("endpagecache",))
+    parser.delete_first_token()
+    return PageCacheNode(
+        nodelist, parser.compile_filter(page_cache), parser.compile_filter(fragment)
+    )
@@ -0,0 +1,83 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+from typing import Iterable
+
+
+class PageCache:
+    """
+    Versioned cache of the fragments of a public page about some objects,
+    to be served to anonymous visitors.
+
+    Each object has a version in the cache, which is bumped by `invalidate`
+    (e.g. from signals) when the object changes. The fragments are keyed by
+    the versions of all the page's objects, so that changing any of them
+    makes the page miss the cache. Fragments also expire after `timeout` seconds,
+    for the changes not covered by invalidation.
+
+    All fragments are fetched at once on creation, such that the view can skip
+    building the context they need if `hit`. They are rendered within the template
+    with the `pagecache` tag (see `common_extras`).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *objects: models.Model,
+        fragments: Iterable[str] = ("content",),
+        timeout: int | None = None,
+    ):
+        self.name = name
+        self.timeout = timeout or settings.PAGE_CACHE_TIMEOUT
+        fragments = list(fragments)
+        versions = self.get_versions(*objects)
+        self.prefix = ":".join(
+            [f"page_cache:{name}"] + [versions[self.version_key(o)] for o in objects]
+        )
+        cached = cache.get_many([self.key(fragment) for fragment in fragments])
+        self.fragments = {
+            fragment: cached[self.key(fragment)]
+            for fragment in fragments
+            if self.key(fragment) in cached
+        }
+        self.hit = len(self.fragments) == len(fragments)
+
+    def key(self, fragment: str) -> str:
+        return f"{self.prefix}:{fragment}"
+
+    def set(self, fragment: str, content: str) -> None:
+        self.fragments[fragment] = content
+        cache.set(self.key(fragment), content, self.timeout)
+
+    @staticmethod
+    def version_key(obj: models.Model) -> str:
+        return f"page_cache_version:{obj._meta.label_lower}:{obj.pk}"
+
+    @classmethod
+    def get_versions(cls, *objects: models.Model) -> dict[str, str]:
+        keys = [cls.version_key(obj) for obj in objects]
+        versions = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                cache.add(key, str(time.time_ns()), None)
+                versions[key] = cache.get(key)
+        return versions
+
+    @classmethod
+    def invalidate(cls, *objects: models.Model | None) -> None:
+        """Bump the versions of the (non-None) objects."""
+        cache.set_many(
+            {
+                cls.version_key(obj): str(time.time_ns())
+                for obj in objects
+                if obj is not None
+            },
+            None,
+        )
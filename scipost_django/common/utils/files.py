@@ -0,0 +1,157 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response
+from django.utils.http import (
+    content_disposition_header,
+    http_date,
+    parse_http_date_safe,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def get_byte_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """
+    Return the (first, last) bytes requested by a single-range `Range` header,
+    or None if the whole file is to be served (for missing, malformed or
+    multiple ranges, which may be ignored according to RFC 9110).
+    """
+    match = BYTE_RANGE_RE.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last bytes of the file
+        if int(last) == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - int(last), 0), size - 1
+    if last and int(last) < int(first):
+        return None
+    if int(first) >= size:
+        raise RangeNotSatisfiable
+    return int(first), min(int(last), size - 1) if last else size - 1
+
+
+def get_accel_redirect(path: str) -> str | None:
+    """
+    Return the internal location of the front proxy (nginx) serving the file,
+    if its directory is mapped in `settings.FILE_SERVING_ACCEL_REDIRECT`.
+    """
+    path = os.path.abspath(path)
+    for root, location in getattr(settings, "FILE_SERVING_ACCEL_REDIRECT", {}).items():
+        root = os.path.join(os.path.abspath(root), "")
+        if path.startswith(root):
+            return location.rstrip("/") + "/" + quote(path[len(root) :])
+    return None
+
+
+def iter_file_range(file, first: int, last: int):
+    with file:
+        file.seek(first)
+        remaining = last - first + 1
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def serve_file(
+    request: HttpRequest,
+    field_file: FieldFile,
+    content_type: str | None = None,
+    filename: str | None = None,
+    as_attachment: bool = False,
+) -> HttpResponse:
+    """
+    Serve the file stored in a FileField without loading it in memory.
+
+    Conditional requests (by ETag or modification date) are answered with
+    304 Not Modified. The file is then either handed off to the front proxy
+    via `X-Accel-Redirect` (see `get_accel_redirect`), or streamed from
+    the worker, honouring single byte-range requests.
+    """
+    try:
+        stat = os.stat(field_file.path)
+    except (FileNotFoundError, ValueError):
+        raise Http404("File not found")
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return response
+
+    encoding = None
+    if content_type is None:
+        content_type, encoding = mimetypes.guess_type(field_file.name)
+        content_type = content_type or "application/octet-stream"
+    filename = filename or os.path.basename(field_file.name)
+    headers = {
+        "Content-Disposition": content_disposition_header(as_attachment, filename),
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        "Accept-Ranges": "bytes",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    if accel_redirect := get_accel_redirect(field_file.path):
+        headers["X-Accel-Redirect"] = accel_redirect
+        return HttpResponse(content_type=content_type, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("If-Range")
+    if "Range" in request.headers and (
+        if_range is None
+        or if_range == etag
+        or parse_http_date_safe(if_range) == last_modified
+    ):
+        try:
+            byte_range = get_byte_range(request.headers["Range"], stat.st_size)
+        except RangeNotSatisfiable:
+            return HttpResponse(
+                status=416, headers={"Content-Range": f"bytes */{stat.st_size}"}
+            )
+
+    file = field_file.storage.open(field_file.name, "rb")
+    if byte_range is None:
+        return FileResponse(
+            file,
+            as_attachment=as_attachment,
+            filename=filename,
+            content_type=content_type,
+            headers=headers,
+        )
+    first, last = byte_range
+    headers["Content-Range"] = f"bytes {first}-{last}/{stat.st_size}"
+    headers["Content-Length"] = str(last - first + 1)
+    return StreamingHttpResponse(
+        iter_file_range(file, first, last),
+        status=206,
+        content_type=content_type,
+        headers=headers,
+    )
@@ -0,0 +1,127 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+from django.core.cache import caches
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket, allowing on average `rate` calls per second
+    (with bursts of at most `burst` calls). A `rate` of None disables the limit.
+    """
+
+    def __init__(self, rate: float | None, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.timestamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        if not self.rate:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.timestamp) * self.rate
+            )
+            self.timestamp = now
+            # Tokens can go negative: the call then reserves a future slot
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class SharedRateLimiter:
+    """
+    Rate limiter shared by all processes using the same (e.g. memcached) cache,
+    allowing `rate` calls per second over all of them.
+    A `rate` of None disables the limit.
+
+    Time is divided into slots of 1 / `rate` seconds, each of which can be reserved
+    by a single call (atomically, with `cache.add`). Calls reserve the earliest
+    free slot and sleep until it starts.
+    """
+
+    def __init__(self, key: str, rate: float | None, cache_alias: str = "default"):
+        self.key = f"rate_limiter:{key}"
+        self.rate = rate
+        self.cache_alias = cache_alias
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        if not self.rate:
+            return
+        cache = caches[self.cache_alias]
+        now = time.time()
+        # The last reserved slot is only a hint, saving attempts at taken slots
+        slot = max(int(now * self.rate), cache.get(f"{self.key}:last", -1) + 1)
+        timeout = int(slot / self.rate - now) + 60
+        while not cache.add(f"{self.key}:{slot}", True, timeout=timeout):
+            slot += 1
+            timeout = int(slot / self.rate - now) + 60
+        cache.set(f"{self.key}:last", slot, timeout=timeout)
+
+        wait_time = slot / self.rate - time.time()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def retry_delay(
+    response: requests.Response, attempt: int, backoff_factor: float = 0.5
+) -> float:
+    """
+    Return the number of seconds to wait before retrying a throttled or failing
+    request: as asked by the response's Retry-After header if any, otherwise
+    backing off exponentially with the number of the (failed) `attempt`.
+    """
+    if retry_after := response.headers.get("Retry-After"):
+        try:
+            return Retry().parse_retry_after(retry_after)
+        except InvalidHeader:
+            pass
+    return backoff_factor * 2**attempt
+
+
+def pooled_session(
+    pool_size: int = 10,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    headers: dict[str, str] | None = None,
+    retry_statuses: tuple[int, ...] = RETRY_STATUSES,
+) -> requests.Session:
+    """
+    Return a requests Session keeping up to `pool_size` connections alive per host,
+    retrying failed connections and responses with the `retry_statuses`
+    (by default, throttled or failing ones) with exponential backoff
+    (honouring Retry-After headers).
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
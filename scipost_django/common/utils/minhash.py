@@ -0,0 +1,86 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import hashlib
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+def _stable_hash(text: str, digest_size: int = 8) -> int:
+    """
+    Hash a string to a signed integer which is stable across processes
+    (unlike the builtin `hash`), so that it can be persisted.
+    """
+    digest = hashlib.blake2b(text.encode(), digest_size=digest_size).digest()
+    return int.from_bytes(digest, signed=True)
+
+
+@lru_cache
+def _permutations(num_perm: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Deterministic coefficients (a, b) of the hash functions `(a * x + b) mod p`.
+    """
+    coefficients = np.array(
+        [
+            [_stable_hash(f"minhash:{i}:{j}", 4) % MERSENNE_PRIME for j in (0, 1)]
+            for i in range(num_perm)
+        ],
+        dtype=np.uint64,
+    )
+    # a must be nonzero for the function to be a permutation
+    coefficients[:, 0] = np.maximum(coefficients[:, 0], 1)
+    return coefficients[:, 0], coefficients[:, 1]
+
+
+def shingles(text: str, size: int, words: bool = False) -> set[str]:
+    """
+    Return the set of shingles of the normalized (lowercased, alphanumeric) text:
+    overlapping sequences of `size` characters, or of `size` words if `words` is True.
+    """
+    normalized = " ".join(re.findall(r"\w+", text.lower()))
+    if words:
+        tokens = normalized.split()
+        return {
+            " ".join(tokens[i : i + size])
+            for i in range(max(len(tokens) - size + 1, 1 if tokens else 0))
+        }
+    return {
+        normalized[i : i + size]
+        for i in range(max(len(normalized) - size + 1, 1 if normalized else 0))
+    }
+
+
+def minhash_signature(shingle_set: set[str], num_perm: int) -> list[int]:
+    """
+    Return the MinHash signature of a (nonempty) set of shingles.
+
+    The fraction of equal entries in the signatures of two sets
+    estimates the Jaccard similarity of these sets.
+    """
+    a, b = _permutations(num_perm)
+    hashes = np.array(
+        [zlib.crc32(shingle.encode()) % MERSENNE_PRIME for shingle in shingle_set],
+        dtype=np.uint64,
+    )
+    return ((np.outer(a, hashes) + b[:, None]) % MERSENNE_PRIME).min(axis=1).tolist()
+
+
+def lsh_band_hashes(
+    signature: list[int], band_size: int, prefix: str = ""
+) -> list[int]:
+    """
+    Split a MinHash signature into bands of `band_size` rows and hash each band.
+
+    Two signatures sharing at least one band hash are candidate near-duplicates.
+    The `prefix` allows to distinguish the band hashes of different fields.
+    """
+    return [
+        _stable_hash(f"{prefix}:{start}:{signature[start : start + band_size]}")
+        for start in range(0, len(signature), band_size)
+    ]
@@ -0,0 +1,128 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from functools import reduce
+from operator import add, or_
+from typing import Iterable
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+    TrigramWordSimilarity,
+)
+from django.db import models
+from django.db.models import Expression, F, Func, Q, Value
+from django.db.models.functions import Greatest
+
+from common.utils.lookups import ImmutableUnaccent
+
+SEARCH_CONFIG = "english"
+
+
+def weighted_search_vector(
+    weights: dict[str, str], expressions: dict[str, Expression] | None = None
+) -> SearchVector:
+    """
+    Combined (unaccented) search vector of the given fields, weighted as given
+    in the `weights` dict {field: weight}. Suitable for a stored GeneratedField.
+
+    The `expressions` dict {name: expression} gives the (immutable) expressions
+    to index instead of the fields of those names, e.g. the keys of a JSONField.
+    """
+    expressions = expressions or {}
+    return reduce(
+        add,
+        (
+            SearchVector(
+                ImmutableUnaccent(expressions.get(field, field)),
+                config=SEARCH_CONFIG,
+                weight=weight,
+            )
+            for field, weight in weights.items()
+        ),
+    )
+
+
+def search_query(text: str) -> SearchQuery:
+    """
+    Full text query for the given user input (web search syntax, unaccented).
+    """
+    return SearchQuery(
+        ImmutableUnaccent(Value(text)), config=SEARCH_CONFIG, search_type="websearch"
+    )
+
+
+class TSFilter(Func):
+    """Keep only the lexemes of a tsvector carrying the given weights."""
+
+    function = "ts_filter"
+    template = '%(function)s(%(expressions)s::"char"[])'
+    output_field = SearchVectorField()
+
+    def __init__(self, expression, weights: Iterable[str], **extra):
+        weights = Value(
+            [weight.lower() for weight in weights],
+            output_field=ArrayField(models.CharField(max_length=1)),
+        )
+        super().__init__(expression, weights, **extra)
+
+
+class FullTextSearchQuerySetMixin:
+    """
+    Ranked full text search on the model's stored `search_vector`, built from the
+    fields (and weights) in the model's `SEARCH_VECTOR_WEIGHTS`.
+
+    If the full text search yields no results, fall back to trigram word similarity
+    on the `SEARCH_TRIGRAM_FIELDS`, to accommodate misspellings.
+    """
+
+    def search(self, text: str, fields: list[str] | None = None):
+        """
+        Return the objects matching the search `text`, ordered by relevance.
+        If `fields` are given, only these fields (of the search vector) are matched.
+        """
+        query = search_query(text)
+        vector = F("search_vector")
+        results = self.filter(search_vector=query)
+        if fields:
+            vector = TSFilter(
+                vector, [self.model.SEARCH_VECTOR_WEIGHTS[f] for f in fields]
+            )
+            # The unfiltered match is kept to use the index
+            results = results.alias(search_filtered=vector).filter(
+                search_filtered=query
+            )
+        results = results.annotate(search_rank=SearchRank(vector, query))
+        if results.exists():
+            return results.order_by("-search_rank")
+
+        trigram_fields = [
+            field
+            for field in self.model.SEARCH_TRIGRAM_FIELDS
+            if not fields or field in fields
+        ]
+        if not trigram_fields:
+            return results
+        return (
+            self.filter(
+                reduce(
+                    or_,
+                    (
+                        Q(**{f"{field}__trigram_word_similar": text})
+                        for field in trigram_fields
+                    ),
+                )
+            )
+            .annotate(
+                search_rank=Greatest(
+                    *(TrigramWordSimilarity(text, field) for field in trigram_fields),
+                    Value(0.0),
+                    output_field=models.FloatField(),
+                )
+            )
+            .order_by("-search_rank")
+        )
@@ -11,7 +11,8 @@ from django_celery_results.models import TaskResult
 class Command(BaseCommand):
     """Compare submission fellows and authors for potential coauthorships."""
 
-    SUBMISSIONS_PROCESSED_PER_RUN = 1
+    # Works of the fellows are mostly cached, so several submissions fit in a run
+    SUBMISSIONS_PROCESSED_PER_RUN = 5
 
     def handle(self, *args, **options):
 
@@ -16,7 +16,12 @@ from common.utils.models import queryset_annotation
 if TYPE_CHECKING:
     from submissions.models.submission import Submission
     from profiles.models import Profile
-    from .models import ConflictOfInterest, Coauthorship, CoauthoredWork
+    from .models import (
+        ConflictOfInterest,
+        Coauthorship,
+        CoauthoredWork,
+        ProfileWorksListing,
+    )
 
 
 class CoauthorshipExclusionPurpose(enum.Enum):
@@ -220,3 +225,9 @@ class CoauthoredWorkQuerySet(QuerySet["CoauthoredWork"]):
             default=CountChars("authors_str", char=";") + 1,
             output_field=fields.IntegerField(),
         )
+
+
+class ProfileWorksListingQuerySet(QuerySet["ProfileWorksListing"]):
+    def fresh(self, max_age: datetime.timedelta):
+        """Filter for listings fetched less than `max_age` ago."""
+        return self.filter(date_fetched__gte=timezone.now() - max_age)
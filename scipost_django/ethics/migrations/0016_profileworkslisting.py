@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ethics", "0015_alter_coauthoredwork_work_type"),
+        ("profiles", "0052_alter_profile_full_name_normalized"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileWorksListing",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("server_source", models.CharField(max_length=64)),
+                (
+                    "date_fetched",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("truncated", models.BooleanField(default=False)),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="works_listings",
+                        to="profiles.profile",
+                    ),
+                ),
+                (
+                    "works",
+                    models.ManyToManyField(
+                        blank=True,
+                        related_name="profile_listings",
+                        to="ethics.coauthoredwork",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("profile", "server_source"),
+                        name="unique_together_profile_server_source",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -15,6 +15,7 @@ from ethics.managers import (
     CoauthoredWorkQuerySet,
     CoauthorshipQuerySet,
     ConflictOfInterestQuerySet,
+    ProfileWorksListingQuerySet,
 )
 from preprints.servers.server import PreprintServer
 from preprints.servers.utils import (
@@ -375,6 +376,42 @@ class CoauthoredWork(models.Model):
             return f"https://doi.org/{self.doi}"
 
 
+class ProfileWorksListing(models.Model):
+    """
+    The recent works of a Profile found on a preprint server.
+    Cached such that coauthorships can be detected locally, by comparing the works
+    of both Profiles, instead of querying the server for each pair of Profiles.
+    """
+
+    profile = models.ForeignKey["Profile"](
+        "profiles.Profile",
+        on_delete=models.CASCADE,
+        related_name="works_listings",
+    )
+    server_source = models.CharField(max_length=64)
+    works = models.ManyToManyField[CoauthoredWork, "ProfileWorksListing"](
+        "ethics.CoauthoredWork",
+        blank=True,
+        related_name="profile_listings",
+    )
+    date_fetched = models.DateTimeField(default=timezone.now)
+    # Whether more works were found than fetched (see `MAX_WORKS_PER_PROFILE`)
+    truncated = models.BooleanField(default=False)
+
+    objects = ProfileWorksListingQuerySet.as_manager()
+
+    class Meta:
+        constraints: list["BaseConstraint"] = [
+            models.UniqueConstraint(
+                fields=["profile", "server_source"],
+                name="unique_together_profile_server_source",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.server_source} works of {self.profile}"
+
+
 class Coauthorship(models.Model):
     """
     An instance of a (potential) coauthorship between two Profiles. The profiles may
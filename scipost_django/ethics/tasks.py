@@ -6,10 +6,17 @@ import itertools
 
 from celery import chord, group
 
+from django.utils import timezone
+
 from SciPost_v1.celery import app
 from common.utils.db import postgres_lock
 
-from ethics.models import CoauthoredWork, Coauthorship, PreprintServer
+from ethics.models import (
+    CoauthoredWork,
+    Coauthorship,
+    PreprintServer,
+    ProfileWorksListing,
+)
 from preprints.servers.server import BasePreprintServer
 from profiles.models import Profile
 from submissions.models.submission import Submission
@@ -21,51 +28,23 @@ from typing import Any, Iterable
 # and any CoIs would be likely exempted anyway.
 MAX_AUTHORS_TO_CONSIDER_COIS = 20
 
+# The works of a profile fetched from a preprint server are cached for this long,
+# coauthorships being detected by comparing the cached works of both profiles.
+PROFILE_WORKS_CACHE_TTL = datetime.timedelta(days=7)
+MAX_WORKS_PER_PROFILE = 100
+RECENT_WORKS_PERIOD = datetime.timedelta(days=5 * 365)
+
 
 PREPRINT_SERVER_CLASS_INSTANCES = {
     name: klass() for name, klass in PreprintServer.mapping().items()
 }
 
 
-def query_coauthorships(
-    author: Profile,
-    coauthor: Profile,
-    preprint_server: BasePreprintServer,
-    **kwargs: dict[str, Any],
-):
-    nr_total_works_found = 0
-    nr_works_matching_all = 0
-    nr_coauthorships_created = 0
-
-    if author == coauthor:
-        return {
-            "nr_total_works_found": 0,
-            "nr_works_matching_all": 0,
-            "nr_coauthorships_created": 0,
-        }
-
-    # Maintain consistent ordering to avoid duplicates
-    if author.id > coauthor.id:
-        author, coauthor = coauthor, author
-
-    coauthorships_to_create: list[Coauthorship] = []
-    five_years_ago = datetime.date.today() - datetime.timedelta(days=5 * 365)
-
-    found_works = preprint_server.find_common_works_between(
-        author,
-        coauthor,
-        published_after=five_years_ago,
-        **kwargs,
-    )
-    found_works.sort(key=lambda w: (w.server_source, w.identifier))
-    nr_total_works_found += len(found_works)
-
-    works_to_create = [
-        work
-        for work in found_works
-        if work.nr_authors <= MAX_AUTHORS_TO_CONSIDER_COIS
-        and work.contains_authors(author, coauthor)
-    ]
+def save_works(
+    works: list[CoauthoredWork], preprint_server: BasePreprintServer
+) -> list[CoauthoredWork]:
+    """Upsert the works, returning the saved ones."""
+    works = sorted(works, key=lambda w: (w.server_source, w.identifier or ""))
 
     # Use a lock to avoid race conditions when upserting works
     with postgres_lock(
@@ -77,7 +56,7 @@ def query_coauthorships(
         # and updated with the newly fetched values. The function returns them such that
         # Coauthorships can be created for them in the next step.
         works_created = CoauthoredWork.objects.bulk_create(
-            works_to_create,
+            works,
             update_conflicts=True,
             update_fields=[
                 "work_type",
@@ -90,25 +69,125 @@ def query_coauthorships(
             unique_fields=["server_source", "identifier"],
         )
 
-    coauthorships_to_create.extend(
-        Coauthorship(work=work, profile=author, coauthor=coauthor)
-        for work in works_created
-        if work.pk is not None  # Make sure works were created successfully
+    # Make sure works were created successfully
+    return [work for work in works_created if work.pk is not None]
+
+
+def recent_works(
+    works: Iterable[CoauthoredWork], *profiles: Profile
+) -> list[CoauthoredWork]:
+    """Filter the works of the profiles to consider for coauthorships."""
+    return [
+        work
+        for work in works
+        if work.nr_authors <= MAX_AUTHORS_TO_CONSIDER_COIS
+        and work.contains_authors(*profiles)
+    ]
+
+
+def get_profile_works_listing(
+    profile: Profile,
+    preprint_server: BasePreprintServer,
+    **kwargs: Any,
+) -> ProfileWorksListing:
+    """
+    Return the listing of the recent works of the profile on the preprint server,
+    reusing the cached one if fetched within `PROFILE_WORKS_CACHE_TTL`.
+    """
+    server_source = str(PreprintServer.from_name(preprint_server.name))
+    listings = ProfileWorksListing.objects.filter(
+        profile=profile, server_source=server_source
+    ).prefetch_related("works")
+    if listing := listings.fresh(PROFILE_WORKS_CACHE_TTL).first():
+        return listing
+
+    published_after = datetime.date.today() - RECENT_WORKS_PERIOD
+    found_works = preprint_server.find_works_of(
+        profile,
+        published_after=published_after,
+        max_results=MAX_WORKS_PER_PROFILE,
+        **kwargs,
     )
+    works = save_works(recent_works(found_works, profile), preprint_server)
+
+    listing, _ = ProfileWorksListing.objects.update_or_create(
+        profile=profile,
+        server_source=server_source,
+        defaults={
+            "date_fetched": timezone.now(),
+            "truncated": len(found_works) >= MAX_WORKS_PER_PROFILE,
+        },
+    )
+    listing.works.set(works)
+    return listings.get(pk=listing.pk)
+
+
+def query_coauthorships(
+    author: Profile,
+    coauthor: Profile,
+    preprint_server: BasePreprintServer,
+    listings: dict[int, ProfileWorksListing] | None = None,
+    **kwargs: Any,
+):
+    """
+    Create the Coauthorships of the two profiles on the works they share,
+    found among the (cached) works of either profile on the preprint server.
+    The works listings of the profiles can be passed in `listings`, keyed by profile id.
+    """
+    if author == coauthor:
+        return {
+            "nr_total_works_found": 0,
+            "nr_works_matching_all": 0,
+            "nr_coauthorships_created": 0,
+        }
+
+    # Maintain consistent ordering to avoid duplicates
+    if author.id > coauthor.id:
+        author, coauthor = coauthor, author
+
+    if listings is None:
+        listings = {}
+    for profile in (author, coauthor):
+        if profile.id not in listings:
+            listings[profile.id] = get_profile_works_listing(
+                profile, preprint_server, **kwargs
+            )
+
+    found_works = {
+        work.pk: work
+        for profile in (author, coauthor)
+        for work in listings[profile.id].works.all()
+    }
+    # A complete listing of either profile contains all the works they share,
+    # but these may be missing from both listings if truncated: query them instead
+    if listings[author.id].truncated and listings[coauthor.id].truncated:
+        published_after = datetime.date.today() - RECENT_WORKS_PERIOD
+        common_works = preprint_server.find_common_works_between(
+            author, coauthor, published_after=published_after, **kwargs
+        )
+        for work in save_works(
+            recent_works(common_works, author, coauthor), preprint_server
+        ):
+            found_works[work.pk] = work
+    found_works = found_works.values()
+
+    coauthorships_to_create = [
+        Coauthorship(work=work, profile=author, coauthor=coauthor)
+        for work in found_works
+        if work.contains_authors(author, coauthor)
+    ]
 
-    nr_works_matching_all = len(coauthorships_to_create)
     #! Will have conflicts if the work is already linked to the profiles,
     #! so double check it works as intended
     coauthorships_created = Coauthorship.objects.bulk_create(
         coauthorships_to_create, ignore_conflicts=True
     )
-    nr_coauthorships_created = len(
-        list(c for c in coauthorships_created if c.pk is not None)
-    )
     return {
-        "nr_total_works_found": nr_total_works_found,
-        "nr_works_matching_all": nr_works_matching_all,
-        "nr_coauthorships_created": nr_coauthorships_created,
+        "nr_total_works_found": len(found_works),
+        "nr_works_matching_all": len(coauthorships_to_create),
+        "nr_coauthorships_created": len(
+            list(c for c in coauthorships_created if c.pk is not None)
+        ),
     }
 
 
@@ -135,6 +214,12 @@ def task_query_coauthorships_in_server(
     authors = [p for author_id in author_ids if (p := profiles.get(author_id))]
     coauthors = [p for coauthor_id in coauthor_ids if (p := profiles.get(coauthor_id))]
 
+    # Fetch (or reuse) the works of each profile once, instead of once per pair
+    listings = {
+        profile.id: get_profile_works_listing(profile, preprint_server_class)
+        for profile in profiles.values()
+    }
+
     profile_pairs = list(itertools.product(authors, coauthors))
     total_pairs = len(profile_pairs)
 
@@ -152,6 +237,7 @@ def task_query_coauthorships_in_server(
             author=author,
             coauthor=coauthor,
             preprint_server=preprint_server_class,
+            listings=listings,
         )
         results.append(result)
 
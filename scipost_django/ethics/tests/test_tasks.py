@@ -0,0 +1,144 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from nameparser import HumanName
+
+from preprints.servers.server import BasePreprintServer
+from profiles.factories import ProfileFactory
+
+from ..models import CoauthoredWork, Coauthorship, ProfileWorksListing
+from ..tasks import (
+    PROFILE_WORKS_CACHE_TTL,
+    get_profile_works_listing,
+    task_query_coauthorships_in_server,
+)
+
+WORKS = {
+    "2401.00001": ["Alice Anderson", "Frank Fellow"],
+    "2401.00002": ["Bob Brown", "Frank Fellow", "Grace Greene"],
+    "2401.00003": ["Alice Anderson", "Somebody Else"],
+}
+
+
+class StubServer(BasePreprintServer):
+    name = "arXiv"
+    queried: list[str] = []
+
+    @classmethod
+    def identifier_to_url(cls, identifier):
+        return identifier
+
+    @classmethod
+    def parse_work(cls, data):
+        return None
+
+    @classmethod
+    def find_common_works_between(cls, *people, **kwargs):
+        cls.queried.append(" & ".join(person.full_name for person in people))
+        works = []
+        for identifier, authors in WORKS.items():
+            work = CoauthoredWork(
+                server_source="arxiv", identifier=identifier, title=identifier
+            )
+            work.authors = [HumanName(author) for author in authors]
+            if work.contains_authors(*people):
+                works.append(work)
+        return works[: kwargs.get("max_results", 20)]
+
+
+class CoauthorshipTasksTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice, cls.bob, cls.frank, cls.grace, cls.henry = [
+            ProfileFactory(first_name=first_name, last_name=last_name)
+            for first_name, last_name in [
+                ("Alice", "Anderson"),
+                ("Bob", "Brown"),
+                ("Frank", "Fellow"),
+                ("Grace", "Greene"),
+                ("Henry", "Hill"),
+            ]
+        ]
+
+    def setUp(self):
+        StubServer.queried = []
+        patcher = mock.patch.dict(
+            "ethics.tasks.PREPRINT_SERVER_CLASS_INSTANCES", {"arxiv": StubServer()}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def query(self, authors, coauthors):
+        return task_query_coauthorships_in_server.apply(
+            args=(
+                [author.id for author in authors],
+                [coauthor.id for coauthor in coauthors],
+                "arxiv",
+            )
+        ).get()
+
+    def test_query_coauthorships(self):
+        result = self.query(
+            [self.alice, self.bob], [self.frank, self.grace, self.henry]
+        )
+        # A single query per profile, instead of one per pair
+        self.assertEqual(len(StubServer.queried), 5)
+        self.assertEqual(result["nr_works_matching_all"], 3)
+        self.assertCountEqual(
+            Coauthorship.objects.values_list(
+                "profile__last_name", "coauthor__last_name", "work__identifier"
+            ),
+            [
+                ("Anderson", "Fellow", "2401.00001"),
+                ("Brown", "Fellow", "2401.00002"),
+                ("Brown", "Greene", "2401.00002"),
+            ],
+        )
+        self.assertEqual(
+            list(
+                ProfileWorksListing.objects.get(profile=self.alice)
+                .works.values_list("identifier", flat=True)
+                .order_by("identifier")
+            ),
+            ["2401.00001", "2401.00003"],
+        )
+
+        # The cached works are reused for the fellows of other submissions
+        self.query([self.henry], [self.frank, self.grace])
+        self.assertEqual(len(StubServer.queried), 5)
+
+    @mock.patch("ethics.tasks.MAX_WORKS_PER_PROFILE", 1)
+    def test_query_coauthorships_beyond_truncated_listings(self):
+        with mock.patch.dict(WORKS, {"2401.00004": ["Alice Anderson", "Grace Greene"]}):
+            result = self.query([self.alice], [self.grace])
+        # The shared work is in neither truncated listing, so it is queried per pair
+        self.assertEqual(
+            StubServer.queried,
+            ["Alice Anderson", "Grace Greene", "Alice Anderson & Grace Greene"],
+        )
+        self.assertEqual(result["nr_works_matching_all"], 1)
+        self.assertEqual(
+            list(Coauthorship.objects.values_list("work__identifier", flat=True)),
+            ["2401.00004"],
+        )
+
+    def test_profile_works_cache_expiry(self):
+        get_profile_works_listing(self.frank, StubServer())
+        get_profile_works_listing(self.frank, StubServer())
+        self.assertEqual(StubServer.queried, ["Frank Fellow"])
+
+        ProfileWorksListing.objects.update(
+            date_fetched=timezone.now()
+            - PROFILE_WORKS_CACHE_TTL
+            - datetime.timedelta(minutes=1)
+        )
+        listing = get_profile_works_listing(self.frank, StubServer())
+        self.assertEqual(len(StubServer.queried), 2)
+        self.assertEqual(listing.works.count(), 2)
+        self.assertEqual(ProfileWorksListing.objects.count(), 1)
+        self.assertEqual(CoauthoredWork.objects.count(), 2)
@@ -7,7 +7,7 @@ from rest_framework.settings import api_settings
 from rest_framework_csv import renderers as r
 
 from api.viewsets.base import ExtraFilteredReadOnlyModelViewSet
-from api.viewsets.mixins import FilteringOptionsActionMixin
+from api.viewsets.mixins import CursorPaginationMixin, FilteringOptionsActionMixin
 
 from finances.models import Subsidy, SubsidyPayment
 from finances.api.filtersets import (
@@ -35,7 +35,9 @@ def at_least_one_permission(*permissions: str):
 
 
 class SubsidyPrivateAPIViewSet(
-    FilteringOptionsActionMixin, ExtraFilteredReadOnlyModelViewSet
+    CursorPaginationMixin,
+    FilteringOptionsActionMixin,
+    ExtraFilteredReadOnlyModelViewSet,
 ):
     queryset = Subsidy.objects.all()
     permission_classes = [
@@ -56,6 +58,7 @@ class SubsidyPrivateAPIViewSet(
         "date",
         "date_until",
     ]
+    cursor_ordering = ("-date_from", "-id")
     filterset_class = SubsidyAPIFilterSet
     default_filtering_fields = [
         "organization__name__icontains",
@@ -2,16 +2,49 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 
-from django.core.management.base import BaseCommand
+import datetime
 
-from finances.models import Subsidy
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from finances.utils.allocation import PubFracCompensationAllocator
 
 
 class Command(BaseCommand):
-    help = "Applies compensations from Subsidies to PubFracs"
+    help = (
+        "Applies compensations from Subsidies to PubFracs. "
+        "By default all PubFracs are reallocated; use --since_hours to only "
+        "reallocate those of recently modified Publications and Subsidies."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--since_hours",
+            type=int,
+            required=False,
+            help=(
+                "Only reallocate the PubFracs of Publications and Subsidies "
+                "modified in the last given number of hours."
+            ),
+        )
 
-    def handle(self, *args, **kwargs):
-        nr_updated = Subsidy.compensate_pubfracs()
+    def handle(self, *args, **options):
+        since = None
+        if options["since_hours"] is not None:
+            since = timezone.now() - datetime.timedelta(hours=options["since_hours"])
+
+        allocator = PubFracCompensationAllocator(since=since)
+        nr_updated = allocator.run()
+        self.stdout.write(
+            "Timings: "
+            + ", ".join(
+                f"{phase} {duration:.2f}s"
+                for phase, duration in allocator.timings.items()
+            )
+        )
         self.stdout.write(
-            self.style.SUCCESS(f"Successfully compensated {nr_updated} PubFracs.")
+            self.style.SUCCESS(
+                f"Successfully compensated {nr_updated} PubFracs "
+                f"({allocator.nr_changed} changed)."
+            )
         )
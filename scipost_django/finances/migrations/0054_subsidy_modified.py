@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finances", "0053_alter_subsidy_compensation_strategies_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subsidy",
+            name="modified",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -3,11 +3,10 @@ __license__ = "AGPL v3"
 
 
 from collections import OrderedDict
-from itertools import groupby
 import datetime
 
 from django.db import models
-from django.db.models import F, Q, QuerySet, Sum
+from django.db.models import QuerySet, Sum
 from django.db.models.functions import ExtractYear
 from django.urls import reverse
 
@@ -16,15 +15,13 @@ from finances.models import PubFrac
 from scipost.fields import ChoiceArrayField
 
 from ..constants import (
-    SUBSIDY_RECEIVED,
     SUBSIDY_TYPES,
     SUBSIDY_TYPE_SPONSORSHIPAGREEMENT,
     SUBSIDY_STATUS,
-    SUBSIDY_UPTODATE,
 )
 from ..managers import SubsidyQuerySet, PubFracQuerySet
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -90,6 +87,8 @@ class Subsidy(models.Model):
     )
     compensation_strategies_details = models.JSONField(blank=True, default=dict)
 
+    modified = models.DateTimeField(auto_now=True)
+
     if TYPE_CHECKING:
         collectives: RelatedManager["SubsidyCollective"]
         compensated_pubfracs: RelatedManager["PubFrac"]
@@ -172,55 +171,11 @@ class Subsidy(models.Model):
         """
         Compute pubfrac compensations for the provided subsidies.
         If no subsidies are specified, all subsidies are considered.
-        Returns the number of PubFracs updated.
+        Returns the number of PubFracs compensated.
         """
-        if subsidies is None:
-            subsidies = Subsidy.objects.all()
-            PubFrac.objects.update(compensated_by=None)
-        else:
-            PubFrac.objects.filter(compensated_by__in=subsidies).update(
-                compensated_by=None
-            )
-        subsidies = subsidies.filter(
-            Q(status=SUBSIDY_RECEIVED) | Q(status=SUBSIDY_UPTODATE)
-        )
-
-        subsidy_pubfrac_table: list[dict[str, Any]] = []
-        for subsidy in subsidies.annotate(remaining=F("amount")):
-            for strategy in subsidy.compensation_strategies:
-                for pubfrac in PubFrac.objects.filter(strategy.get_filter(subsidy)):
-                    subsidy_pubfrac_table.append(
-                        {
-                            "subsidy": subsidy,
-                            "pubfrac": pubfrac,
-                            "priority": strategy.priority,
-                        }
-                    )
-
-        subsidy_pubfrac_table.sort(
-            key=lambda x: (
-                x["pubfrac"].id,  # PubFrac ID for grouping later
-                x["priority"],  # Priority of the compensation strategy
-                x["subsidy"].date_from.year,  # Year of the subsidy
-                -x["subsidy"].remaining,  # Remaining amount (descending)
-            )
-        )
+        from finances.utils.allocation import PubFracCompensationAllocator
 
-        pubfracs_to_update: list[PubFrac] = []
-        for pubfrac, group_table in groupby(
-            subsidy_pubfrac_table, key=lambda x: x["pubfrac"]
-        ):
-            for row in group_table:
-                subsidy = row["subsidy"]
-                # Only if the subsidy has enough remaining amount,
-                # assign it to the PubFrac and break out of the loop
-                if subsidy.remaining >= pubfrac.cf_value:
-                    pubfrac.compensated_by = subsidy
-                    subsidy.remaining -= pubfrac.cf_value
-                    pubfracs_to_update.append(pubfrac)
-                    break
-
-        return PubFrac.objects.bulk_update(pubfracs_to_update, ["compensated_by"])
+        return PubFracCompensationAllocator(subsidies=subsidies).run()
 
     def allocate(self):
         """
@@ -0,0 +1,135 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from common.helpers.test import create_publication
+from finances.constants import (
+    SUBSIDY_RECEIVED,
+    SUBSIDY_TYPE_SPONSORSHIPAGREEMENT,
+    SUBSIDY_WITHDRAWN,
+)
+from finances.models import PubFrac, Subsidy
+from finances.utils.allocation import PubFracCompensationAllocator
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from journals.models import Publication
+from ontology.factories import AcademicFieldFactory
+from organizations.factories import OrganizationFactory
+
+
+class PubFracCompensationAllocatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.year = timezone.now().year
+        cls.date = datetime.date(cls.year, 2, 1)
+        cls.journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS,
+            cost_info={"default": 1000},
+            college__acad_field=AcademicFieldFactory(),
+        )
+        cls.parent = OrganizationFactory(name="Parent", acronym="P")
+        cls.child = OrganizationFactory(name="Child", acronym="C", parent=cls.parent)
+        cls.other = OrganizationFactory(name="Other", acronym="O")
+
+        cls.pub_child = cls.create_publication(1, [[cls.child]])
+        cls.pub_shared = cls.create_publication(2, [[cls.parent], [cls.other]])
+        cls.pub_parent = cls.create_publication(3, [[cls.parent]])
+
+        # Default strategies: self, parent, children
+        cls.subsidy_parent = cls.create_subsidy(cls.parent, 1500)
+        cls.subsidy_other = cls.create_subsidy(
+            cls.other, 10000, compensation_strategies_keys=["any"]
+        )
+
+    @classmethod
+    def create_publication(cls, paper_nr, affiliations):
+        publication = create_publication(cls.journal, paper_nr, affiliations, cls.date)
+        publication.recalculate_pubfracs()
+        return publication
+
+    @classmethod
+    def create_subsidy(cls, organization, amount, **kwargs):
+        return Subsidy.objects.create(
+            organization=organization,
+            subsidy_type=SUBSIDY_TYPE_SPONSORSHIPAGREEMENT,
+            description="Test",
+            amount=amount,
+            status=SUBSIDY_RECEIVED,
+            date_from=datetime.date(cls.year, 1, 1),
+            date_until=datetime.date(cls.year, 12, 31),
+            **kwargs,
+        )
+
+    def compensations(self):
+        return {
+            (pubfrac.publication_id, pubfrac.organization_id): pubfrac.compensated_by_id
+            for pubfrac in PubFrac.objects.all()
+        }
+
+    def test_allocate_all(self):
+        nr_compensated = Subsidy.compensate_pubfracs()
+        self.assertEqual(nr_compensated, 4)
+        self.assertEqual(
+            self.compensations(),
+            {
+                (self.pub_child.id, self.child.id): self.subsidy_parent.id,
+                (self.pub_shared.id, self.parent.id): self.subsidy_parent.id,
+                (self.pub_shared.id, self.other.id): self.subsidy_other.id,
+                # Parent's subsidy is depleted, fall back to the "any" strategy
+                (self.pub_parent.id, self.parent.id): self.subsidy_other.id,
+            },
+        )
+
+    def test_allocate_single_subsidy_does_not_take_compensated_pubfracs(self):
+        Subsidy.compensate_pubfracs()
+        expected = self.compensations()
+        self.subsidy_other.allocate()
+        self.assertEqual(self.compensations(), expected)
+
+    def test_unchanged_compensations_are_not_rewritten(self):
+        Subsidy.compensate_pubfracs()
+        allocator = PubFracCompensationAllocator()
+        self.assertEqual(allocator.run(), 4)
+        self.assertEqual(allocator.nr_changed, 0)
+        self.assertEqual(set(allocator.timings), {"load", "allocate", "save"})
+
+    def test_incremental_allocation(self):
+        Subsidy.compensate_pubfracs()
+        past = timezone.now() - datetime.timedelta(days=1)
+        Publication.objects.update(latest_activity=past)
+        Subsidy.objects.update(modified=past)
+        expected = self.compensations()
+
+        pub_new = self.create_publication(4, [[self.child]])
+        allocator = PubFracCompensationAllocator(
+            since=timezone.now() - datetime.timedelta(hours=1)
+        )
+        self.assertEqual(allocator.run(), 1)
+        self.assertEqual(allocator.nr_changed, 1)
+        expected[(pub_new.id, self.child.id)] = self.subsidy_other.id
+        self.assertEqual(self.compensations(), expected)
+
+        # Releasing a modified Subsidy reallocates its PubFracs
+        self.subsidy_other.status = SUBSIDY_WITHDRAWN
+        self.subsidy_other.save()
+        PubFracCompensationAllocator(
+            since=timezone.now() - datetime.timedelta(hours=1)
+        ).run()
+        self.assertNotIn(self.subsidy_other.id, self.compensations().values())
+        self.assertEqual(
+            self.compensations()[(self.pub_child.id, self.child.id)],
+            self.subsidy_parent.id,
+        )
+
+    def test_number_of_queries_independent_of_number_of_pubfracs(self):
+        with self.assertNumQueries(9):
+            Subsidy.compensate_pubfracs()
+        for paper_nr in range(10, 20):
+            self.create_publication(paper_nr, [[self.child], [self.other]])
+        PubFrac.objects.update(compensated_by=None)
+        with self.assertNumQueries(9):
+            Subsidy.compensate_pubfracs()
@@ -0,0 +1,295 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import datetime
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from decimal import Decimal
+
+import numpy as np
+from django.db import transaction
+from django.db.models import F, Q, QuerySet, Sum
+
+from finances.constants import SUBSIDY_RECEIVED, SUBSIDY_UPTODATE
+from finances.models import PubFrac, Subsidy
+from finances.utils.compensations import CompensationStrategy
+
+# Strategies which only depend on the Organization tree can be resolved for all
+# subsidies at once, by matching a key of the PubFrac against a key of the Subsidy:
+# strategy: (PubFrac key lookup, Subsidy key attribute)
+# A key of None means that all PubFracs matching the strategy's filter are candidates.
+STRATEGY_KEYS = {
+    CompensationStrategy.SELF: ("organization_id", "organization_id"),
+    CompensationStrategy.CHILDREN: ("organization__parent_id", "organization_id"),
+    CompensationStrategy.PARENT: ("organization_id", "parent_id"),
+    CompensationStrategy.SIBLINGS: ("organization__parent_id", "parent_id"),
+    CompensationStrategy.ANY: (None, None),
+    CompensationStrategy.NONE: (None, None),
+}
+
+
+class PubFracCompensationAllocator:
+    """
+    Allocate the amounts of Subsidies to PubFracs (setting their ``compensated_by``).
+
+    For each PubFrac, the candidate Subsidies are tried in order of
+    (strategy priority, year of the Subsidy, amount of the Subsidy [descending]),
+    and the first one with a sufficient remaining amount compensates it.
+
+    Three modes are available:
+
+    * all Subsidies (default): all PubFracs are (re)allocated,
+    * ``subsidies``: the PubFracs compensated by these Subsidies are released,
+      and the Subsidies are allocated to uncompensated PubFracs,
+    * ``since``: the PubFracs of Publications modified since this datetime, and
+      those compensated by Subsidies modified since then, are released; all
+      uncompensated PubFracs are then allocated to the remaining Subsidy amounts.
+
+    Candidates are loaded with one query per strategy as (pubfrac, subsidy, priority)
+    rows, without instantiating PubFracs. Only PubFracs whose compensation changes
+    are written to the database. The duration of each phase is recorded in ``timings``.
+    """
+
+    def __init__(
+        self,
+        subsidies: "QuerySet[Subsidy] | None" = None,
+        since: datetime.datetime | None = None,
+    ):
+        if subsidies is not None and since is not None:
+            raise ValueError("Cannot restrict to both given subsidies and a date.")
+        self.subsidies = subsidies
+        self.since = since
+        self.timings: dict[str, float] = {}
+        self.nr_compensated = 0
+        self.nr_changed = 0
+
+    @contextmanager
+    def _timed(self, phase: str):
+        start = time.perf_counter()
+        yield
+        self.timings[phase] = time.perf_counter() - start
+
+    @property
+    def released(self) -> Q | None:
+        """
+        Filter for the PubFracs whose compensation is up for reallocation,
+        in addition to the uncompensated ones (None means all PubFracs).
+        """
+        if self.subsidies is not None:
+            return Q(compensated_by__in=self.subsidies)
+        if self.since is not None:
+            return Q(publication__latest_activity__gte=self.since) | Q(
+                compensated_by__modified__gte=self.since
+            )
+        return None
+
+    def run(self) -> int:
+        """
+        Perform the allocation. Returns the number of PubFracs compensated.
+        """
+        with transaction.atomic():
+            with self._timed("load"):
+                self.load()
+            with self._timed("allocate"):
+                self.allocate()
+            with self._timed("save"):
+                self.save()
+        return self.nr_compensated
+
+    def load(self):
+        subsidies = self.subsidies if self.subsidies is not None else Subsidy.objects
+        self.active_subsidies = list(
+            subsidies.filter(Q(status=SUBSIDY_RECEIVED) | Q(status=SUBSIDY_UPTODATE))
+            .annotate(parent_id=F("organization__parent_id"))
+            .only(
+                "id",
+                "organization_id",
+                "amount",
+                "date_from",
+                "compensation_strategies_keys",
+                "compensation_strategies_details",
+            )
+        )
+
+        released = self.released
+        compensated = PubFrac.objects.filter(compensated_by__isnull=False)
+        if released is not None:
+            compensated = compensated.filter(released)
+        self.current = dict(
+            compensated.values_list("id", "compensated_by_id").order_by().iterator()
+        )
+
+        # Amounts are handled in thousandths (PubFrac.cf_value has 3 decimal places)
+        self.remaining = np.array(
+            [1000 * subsidy.amount for subsidy in self.active_subsidies],
+            dtype=np.int64,
+        )
+        if released is not None:
+            retained = dict(
+                PubFrac.objects.filter(
+                    compensated_by__in=[s.id for s in self.active_subsidies]
+                )
+                .exclude(released)
+                .values("compensated_by_id")
+                .annotate(total=Sum("cf_value"))
+                .values_list("compensated_by_id", "total")
+                .order_by()
+            )
+            for index, subsidy in enumerate(self.active_subsidies):
+                self.remaining[index] -= _to_thousandths(retained.get(subsidy.id, 0))
+
+        candidates = PubFrac.objects.filter(cf_value__isnull=False)
+        if released is not None:
+            candidates = candidates.filter(Q(compensated_by__isnull=True) | released)
+
+        rows: list[tuple[np.ndarray, ...]] = []
+        for strategy, subsidy_indices in self._subsidies_per_strategy().items():
+            if strategy in STRATEGY_KEYS:
+                rows.append(
+                    self._load_keyed_candidates(candidates, strategy, subsidy_indices)
+                )
+            else:
+                for index in subsidy_indices:
+                    rows.append(
+                        self._load_candidates(
+                            candidates.filter(
+                                strategy.get_filter(self.active_subsidies[index])
+                            ).distinct(),
+                            [index],
+                            strategy.priority,
+                        )
+                    )
+
+        self.pubfrac_ids, self.subsidy_indices, self.priorities, self.values = (
+            np.concatenate(column) for column in zip(*rows, _columns([], [], 0, []))
+        )
+
+    def _subsidies_per_strategy(self) -> dict[CompensationStrategy, list[int]]:
+        per_strategy = defaultdict(list)
+        for index, subsidy in enumerate(self.active_subsidies):
+            for strategy in subsidy.compensation_strategies:
+                per_strategy[strategy].append(index)
+        return per_strategy
+
+    def _load_keyed_candidates(
+        self,
+        candidates: "QuerySet[PubFrac]",
+        strategy: CompensationStrategy,
+        subsidy_indices: list[int],
+    ):
+        """
+        Load the candidates of all subsidies using a strategy in a single query.
+        """
+        pubfrac_key, subsidy_key = STRATEGY_KEYS[strategy]
+        if pubfrac_key is None:
+            return self._load_candidates(
+                candidates.filter(strategy.base_Q), subsidy_indices, strategy.priority
+            )
+
+        subsidies_per_key = defaultdict(list)
+        for index in subsidy_indices:
+            key = getattr(self.active_subsidies[index], subsidy_key)
+            if key is not None:
+                subsidies_per_key[key].append(index)
+
+        pubfrac_ids, indices, values = [], [], []
+        for pubfrac_id, key, value in (
+            candidates.filter(**{f"{pubfrac_key}__in": list(subsidies_per_key)})
+            .values_list("id", pubfrac_key, "cf_value")
+            .order_by()
+            .iterator()
+        ):
+            for index in subsidies_per_key[key]:
+                pubfrac_ids.append(pubfrac_id)
+                indices.append(index)
+                values.append(_to_thousandths(value))
+        return _columns(pubfrac_ids, indices, strategy.priority, values)
+
+    def _load_candidates(
+        self,
+        candidates: "QuerySet[PubFrac]",
+        subsidy_indices: list[int],
+        priority: int,
+    ):
+        """
+        Load PubFracs which are candidates for all the given subsidies.
+        """
+        pubfrac_ids, indices, values = [], [], []
+        for pubfrac_id, value in (
+            candidates.values_list("id", "cf_value").order_by().iterator()
+        ):
+            for index in subsidy_indices:
+                pubfrac_ids.append(pubfrac_id)
+                indices.append(index)
+                values.append(_to_thousandths(value))
+        return _columns(pubfrac_ids, indices, priority, values)
+
+    def allocate(self):
+        """
+        Greedily assign to each candidate PubFrac the first suitable Subsidy.
+        """
+        self.assignments: dict[int, int] = {}
+        if not self.active_subsidies:
+            return
+
+        years = np.array(
+            [subsidy.date_from.year for subsidy in self.active_subsidies],
+            dtype=np.int64,
+        )
+        amounts = np.array(
+            [subsidy.amount for subsidy in self.active_subsidies], dtype=np.int64
+        )
+        order = np.lexsort(
+            (
+                -amounts[self.subsidy_indices],
+                years[self.subsidy_indices],
+                self.priorities,
+                self.pubfrac_ids,
+            )
+        )
+
+        remaining = self.remaining.tolist()
+        for pubfrac_id, index, value in zip(
+            self.pubfrac_ids[order].tolist(),
+            self.subsidy_indices[order].tolist(),
+            self.values[order].tolist(),
+        ):
+            if pubfrac_id in self.assignments:
+                continue
+            if remaining[index] >= value:
+                remaining[index] -= value
+                self.assignments[pubfrac_id] = self.active_subsidies[index].id
+        self.nr_compensated = len(self.assignments)
+
+    def save(self, batch_size: int = 1000):
+        """
+        Write the compensations which differ from the current ones.
+        """
+        changes = defaultdict(list)
+        for pubfrac_id, subsidy_id in self.assignments.items():
+            if self.current.get(pubfrac_id) != subsidy_id:
+                changes[subsidy_id].append(pubfrac_id)
+        for pubfrac_id in self.current.keys() - self.assignments.keys():
+            changes[None].append(pubfrac_id)
+
+        self.nr_changed = 0
+        for subsidy_id, pubfrac_ids in changes.items():
+            for start in range(0, len(pubfrac_ids), batch_size):
+                self.nr_changed += PubFrac.objects.filter(
+                    id__in=pubfrac_ids[start : start + batch_size]
+                ).update(compensated_by_id=subsidy_id)
+
+
+def _to_thousandths(value: Decimal | int) -> int:
+    return int(value * 1000)
+
+
+def _columns(pubfrac_ids, subsidy_indices, priority, values):
+    return (
+        np.array(pubfrac_ids, dtype=np.int64),
+        np.array(subsidy_indices, dtype=np.int64),
+        np.full(len(pubfrac_ids), priority, dtype=np.int64),
+        np.array(values, dtype=np.int64),
+    )
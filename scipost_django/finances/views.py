@@ -4,7 +4,6 @@ __license__ = "AGPL v3"
 
 import datetime
 from itertools import accumulate, chain
-import mimetypes
 from typing import Any
 from dal import autocomplete
 
@@ -26,6 +25,7 @@ from django.views.generic import FormView
 import matplotlib
 
 from common.utils.attachments import RelatedAttachment, attach_related
+from common.utils.files import serve_file
 from common.views import HXDynselAutocomplete, HXDynselSelectOptionView
 from finances.constants import SUBSIDY_TYPE_SPONSORSHIPAGREEMENT, SUBSIDY_PROMISED
 from finances.models.account import Account
@@ -44,7 +44,7 @@ from django.core.exceptions import PermissionDenied
 from django.core.paginator import Paginator
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
-from django.http import Http404, HttpResponse
+from django.http import Http404
 from django.shortcuts import get_object_or_404, render, redirect
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, UpdateView, DeleteView
@@ -193,6 +193,7 @@ def finances(request):
 
     plot_svg = io.StringIO()
     fig.savefig(plot_svg, format="svg")
+    plt.close(fig)
     subsidies_plot_svg = plot_svg.getvalue()
     # Manipulate the SVG to make it display properly in the browser
     # Add the classes `w-100` and `h-100` to make the SVG responsive
@@ -799,13 +800,7 @@ def subsidy_attachment(request, attachment_id):
     attachment = get_object_or_404(SubsidyAttachment.objects, id=attachment_id)
     if not (request.user.is_authenticated and attachment.visible_to_user(request.user)):
         raise PermissionDenied
-    content_type, encoding = mimetypes.guess_type(attachment.attachment.path)
-    content_type = content_type or "application/octet-stream"
-    response = HttpResponse(attachment.attachment.read(), content_type=content_type)
-    if encoding:
-        response["Content-Encoding"] = encoding
-        response["Content-Disposition"] = "filename=%s" % attachment.attachment.name
-    return response
+    return serve_file(request, attachment.attachment)
 
 
 ############################
@@ -906,10 +901,7 @@ def periodicreport_file(request, pk):
         content_type = "application/pdf"
     else:
         raise Http404
-    response = HttpResponse(periodicreport._file.read(), content_type=content_type)
-    filename = periodicreport._file.name
-    response["Content-Disposition"] = f"filename={filename}"
-    return response
+    return serve_file(request, periodicreport._file, content_type=content_type)
 
 
 #######################
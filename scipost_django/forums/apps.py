@@ -13,12 +13,13 @@ class ForumsConfig(AppConfig):
         super().ready()
 
         from . import signals
-        from forums.models import Post
+        from forums.models import Motion, Post
 
-        post_save.connect(
-            signals.post_save_update_cfs_in_post_hierarchy,
-            sender=Post,
-        )
+        for sender in [Post, Motion]:
+            post_save.connect(
+                signals.post_save_update_cfs_in_post_hierarchy,
+                sender=sender,
+            )
         post_delete.connect(
             signals.post_delete_update_cfs_in_post_hierarchy,
             sender=Post,
@@ -11,8 +11,7 @@ class Command(BaseCommand):
     help = "For all Forum instances, this updates the calculated fields."
 
     def handle(self, *args, **kwargs):
-        for forum in Forum.objects.all():
-            forum.update_cfs()
+        Forum.objects.all().update_cfs()
         self.stdout.write(
             self.style.SUCCESS("Successfully updated Forum calculated fields")
         )
@@ -11,8 +11,7 @@ class Command(BaseCommand):
     help = "For all Post instances, this updates the calculated fields."
 
     def handle(self, *args, **kwargs):
-        for post in Post.objects.all():
-            post.update_cfs()
+        Post.objects.all().update_cfs()
         self.stdout.write(
             self.style.SUCCESS("Successfully updated Post calculated fields")
         )
@@ -2,6 +2,10 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
 from django.db import models
 
 
@@ -10,6 +14,14 @@ class ForumQuerySet(models.QuerySet):
         """Return only the Forums which do not have a parent."""
         return self.filter(parent_object_id__isnull=True)
 
+    def update_cfs(self):
+        """Recompute the number of posts of these Forums (one count per Forum)."""
+        forums = list(self)
+        for forum in forums:
+            forum.cf_nr_posts = forum.nr_posts
+        self.model.objects.bulk_update(forums, ["cf_nr_posts"])
+        return len(forums)
+
 
 class PostQuerySet(models.QuerySet):
     def anchors(self):
@@ -23,3 +35,33 @@ class PostQuerySet(models.QuerySet):
     def motions_excluded(self):
         """Filter all Motions out of the Post queryset."""
         return self.filter(motion__isnull=True)
+
+    def update_cfs(self):
+        """
+        Recompute the calculated fields of these Posts, from the materialized paths
+        of all the Posts of their Forums (fetched in a single query).
+        """
+        posts = list(self.only("id", "path"))
+        forum_paths = {post.path.split("/")[0] + "/" for post in posts if post.path}
+        nr_followups = defaultdict(int)
+        latest_followup = {}
+        if forum_paths:
+            for id, path in (
+                self.model.objects.filter(
+                    reduce(or_, [models.Q(path__startswith=p) for p in forum_paths])
+                )
+                .order_by("posted_on", "id")
+                .values_list("id", "path")
+            ):
+                for ancestor_id in self.model.ancestor_ids_in_path(path):
+                    nr_followups[ancestor_id] += 1
+                    latest_followup[ancestor_id] = id
+        for post in posts:
+            post.cf_nr_followups = nr_followups[post.id]
+            post.cf_latest_followup_in_hierarchy_id = latest_followup.get(post.id)
+        self.model.objects.bulk_update(
+            posts,
+            ["cf_nr_followups", "cf_latest_followup_in_hierarchy"],
+            batch_size=1000,
+        )
+        return len(posts)
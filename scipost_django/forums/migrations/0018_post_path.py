@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:34
+
+from django.db import migrations, models
+
+
+def populate_post_paths(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Post = apps.get_model("forums", "Post")
+
+    forum_types = ContentType.objects.filter(
+        app_label="forums", model__in=["forum", "meeting"]
+    ).values_list("id", flat=True)
+    post_types = ContentType.objects.filter(
+        app_label="forums", model__in=["post", "motion"]
+    ).values_list("id", flat=True)
+    parents = {
+        id: (parent_type, parent_id)
+        for id, parent_type, parent_id in Post.objects.values_list(
+            "id", "parent_content_type_id", "parent_object_id"
+        )
+    }
+
+    paths = {}
+
+    def get_path(id):
+        if id not in paths:
+            parent_type, parent_id = parents[id]
+            if parent_type in forum_types:
+                paths[id] = f"{parent_id}/{id}/"
+            elif parent_type in post_types and parent_id in parents:
+                parent_path = get_path(parent_id)
+                paths[id] = f"{parent_path}{id}/" if parent_path else ""
+            else:
+                paths[id] = ""
+        return paths[id]
+
+    posts = list(Post.objects.only("id"))
+    for post in posts:
+        post.path = get_path(post.id)
+    Post.objects.bulk_update(posts, ["path"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forums", "0017_alter_forum_options"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="path",
+            field=models.CharField(blank=True, db_index=True, max_length=1024),
+        ),
+        migrations.RunPython(populate_post_paths, migrations.RunPython.noop),
+    ]
@@ -7,6 +7,7 @@ import datetime
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -96,37 +97,31 @@ class Forum(models.Model):
 
     def update_cfs(self):
         self.update_cf_nr_posts()
-        if self.parent:
-            self.parent.update_cfs()
+
+    @property
+    def path(self):
+        """Prefix of the materialized paths of all Posts in this Forum."""
+        return f"{self.id}/"
+
+    def get_posts_hierarchy(self):
+        """All the motions and posts in this Forum, at any depth."""
+        return Post.objects.filter(path__startswith=self.path)
 
     @property
     def nr_posts(self):
-        """Recursively counts the number of motions and posts in this Forum."""
-        nr = 0
-        posts = self.posts.all()  # gathers all Posts (including those with a Motion)
-        if posts:
-            nr += posts.count()
-            for post in self.posts.all():
-                nr += post.nr_followups
-        return nr
+        """Counts the number of motions and posts in this Forum."""
+        return self.get_posts_hierarchy().count()
 
     def update_cf_nr_posts(self):
         self.cf_nr_posts = self.nr_posts
-        self.save()
+        self.save(update_fields=["cf_nr_posts"])
 
     def posts_hierarchy_id_list(self):
-        id_list = []
-        for post in self.posts.all():
-            id_list += post.posts_hierarchy_id_list()
-        return id_list
+        return list(self.get_posts_hierarchy().values_list("id", flat=True))
 
     @property
     def latest_post(self):
-        id_list = self.posts_hierarchy_id_list()
-        try:
-            return Post.objects.filter(id__in=id_list).order_by("-posted_on").first()
-        except:
-            return None
+        return self.get_posts_hierarchy().order_by("-posted_on").first()
 
 
 class Meeting(Forum):
@@ -267,6 +262,8 @@ class Post(models.Model):
         "anchor_object_id",
     )
     absolute_url = models.URLField(blank=True)
+    # Materialized path: ids of the Forum and of the Posts down to this one
+    path = models.CharField(max_length=1024, blank=True, db_index=True)
 
     # calculated fields
     cf_nr_followups = models.PositiveSmallIntegerField(blank=True, null=True)
@@ -304,10 +301,63 @@ class Post(models.Model):
         return self.absolute_url
 
     def update_cfs(self):
-        self.update_cf_nr_followups()
-        self.update_cf_latest_followup_in_hierarchy()
-        if self.parent:
-            self.parent.update_cfs()
+        self.cf_nr_followups = self.nr_followups
+        self.cf_latest_followup_in_hierarchy = self.latest_followup_in_hierarchy
+        self.save(update_fields=["cf_nr_followups", "cf_latest_followup_in_hierarchy"])
+
+    def get_path(self):
+        """Return the materialized path of this Post, extending its parent's."""
+        parent_path = getattr(self.parent, "path", "")
+        return f"{parent_path}{self.id}/" if parent_path else ""
+
+    @staticmethod
+    def forum_id_in_path(path):
+        return int(path.split("/")[0]) if path else None
+
+    @staticmethod
+    def ancestor_ids_in_path(path):
+        """Return the ids of the Posts above the one with the given path."""
+        return [int(id) for id in path.split("/")[1:-2]]
+
+    def insert_in_hierarchy(self):
+        """
+        Set the path (and anchor) of this newly created Post, and increment
+        the calculated fields of the Posts above it and of its Forum.
+        """
+        self.path = self.get_path()
+        if not self.path:
+            return
+        if isinstance(self.parent, Forum):
+            self.anchor = self.parent
+        else:
+            self.anchor_content_type_id = self.parent.anchor_content_type_id
+            self.anchor_object_id = self.parent.anchor_object_id
+        Post.objects.filter(pk=self.pk).update(
+            path=self.path,
+            anchor_content_type_id=self.anchor_content_type_id,
+            anchor_object_id=self.anchor_object_id,
+        )
+        Post.objects.filter(pk__in=self.ancestor_ids_in_path(self.path)).update(
+            cf_nr_followups=Coalesce("cf_nr_followups", 0) + 1,
+            cf_latest_followup_in_hierarchy=self,
+        )
+        Forum.objects.filter(pk=self.forum_id_in_path(self.path)).update(
+            cf_nr_posts=Coalesce("cf_nr_posts", 0) + 1
+        )
+
+    def remove_from_hierarchy(self):
+        """
+        Recompute the calculated fields of the Posts above this deleted Post
+        and of its Forum.
+        """
+        Post.objects.filter(pk__in=self.ancestor_ids_in_path(self.path)).update_cfs()
+        Forum.objects.filter(pk=self.forum_id_in_path(self.path)).update_cfs()
+
+    def get_posts_hierarchy(self):
+        """This Post and all its followups, at any depth."""
+        if not self.path:
+            return Post.objects.filter(pk=self.pk)
+        return Post.objects.filter(path__startswith=self.path)
 
     def get_followups(self):
         # if this Post is in fact a Motion, the followups are attached to the Motion
@@ -317,36 +367,26 @@ class Post(models.Model):
 
     @property
     def nr_followups(self):
-        nr = 0
-        followups = self.get_followups()
-        if followups:
-            nr += followups.count()
-            for followup in followups.all():
-                nr += followup.nr_followups
-        return nr
+        return self.get_posts_hierarchy().exclude(pk=self.pk).count()
 
     def update_cf_nr_followups(self):
         self.cf_nr_followups = self.nr_followups
-        self.save()
+        self.save(update_fields=["cf_nr_followups"])
 
     @property
     def latest_followup(self):
         return self.followup_posts.last()
 
     def posts_hierarchy_id_list(self):
-        id_list = [self.id]
-        for post in self.followup_posts.all():
-            id_list += post.posts_hierarchy_id_list()
-        return id_list
+        return list(self.get_posts_hierarchy().values_list("id", flat=True))
 
     @property
     def latest_followup_in_hierarchy(self):
-        id_list = self.posts_hierarchy_id_list()
-        return Post.objects.filter(pk__in=id_list).exclude(pk=self.id).last()
+        return self.get_posts_hierarchy().exclude(pk=self.pk).last()
 
     def update_cf_latest_followup_in_hierarchy(self):
         self.cf_latest_followup_in_hierarchy = self.latest_followup_in_hierarchy
-        self.save()
+        self.save(update_fields=["cf_latest_followup_in_hierarchy"])
 
     def get_thread_initiator(self):
         """
@@ -5,18 +5,19 @@ __license__ = "AGPL v3"
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from forums.models import Post
+from forums.models import Motion, Post
 
 
 @receiver(post_save, sender=Post)
+@receiver(post_save, sender=Motion)
 def post_save_update_cfs_in_post_hierarchy(sender, instance, created, **kwargs):
     """
-    When a Post is created, update all related Post (and Forum) calculated fields.
+    When a Post is created, insert it in the materialized hierarchy and
+    increment the related Post (and Forum) calculated fields.
     """
 
-    if created:
-        if instance.parent:
-            instance.parent.update_cfs()
+    if created and not kwargs.get("raw"):
+        instance.insert_in_hierarchy()
 
 
 @receiver(post_delete, sender=Post)
@@ -25,9 +26,5 @@ def post_delete_update_cfs_in_post_hierarchy(sender, instance, **kwargs):
     When a Post is deleted, update all related Post (and Forum) calculated fields.
     """
 
-    if instance.parent:
-        instance.parent.update_cfs()
-    # to cover multi-instance Post deletion in admin,
-    # which might temporarily break recursive climbing of the hierarchy:
-    if instance.anchor:
-        instance.anchor.update_cfs()
+    if instance.path:
+        instance.remove_from_hierarchy()
@@ -0,0 +1,89 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from ..models import Forum, Meeting, Motion, Post
+
+
+class PostHierarchyTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="poster")
+        cls.forum = Forum.objects.create(name="Forum", slug="forum")
+        cls.meeting = Meeting.objects.create(
+            name="Meeting",
+            slug="meeting",
+            date_from=datetime.date(2024, 1, 1),
+            date_until=datetime.date(2024, 1, 31),
+            preamble="Preamble",
+        )
+
+    def post(self, parent, model=Post, **kwargs):
+        return model.objects.create(
+            posted_by=self.user, parent=parent, subject="Subject", text="Text", **kwargs
+        )
+
+    def test_posting_updates_cfs_incrementally(self):
+        thread = self.post(self.forum)
+        reply = self.post(thread)
+        with self.assertNumQueries(4):
+            # Insert with the path, then one update for all ancestors and the forum
+            nested_reply = self.post(reply)
+        self.assertEqual(
+            nested_reply.path,
+            f"{self.forum.id}/{thread.id}/{reply.id}/{nested_reply.id}/",
+        )
+        self.assertEqual(nested_reply.anchor, self.forum)
+        other_thread = self.post(self.forum)
+
+        thread.refresh_from_db()
+        self.assertEqual(thread.cf_nr_followups, 2)
+        self.assertEqual(thread.cf_latest_followup_in_hierarchy, nested_reply)
+        self.assertEqual(thread.nr_followups, 2)
+        self.assertEqual(thread.latest_followup_in_hierarchy, nested_reply)
+        self.forum.refresh_from_db()
+        self.assertEqual(self.forum.cf_nr_posts, 4)
+        self.assertEqual(self.forum.nr_posts, 4)
+        self.assertEqual(self.forum.latest_post, other_thread)
+        self.assertCountEqual(
+            self.forum.posts_hierarchy_id_list(),
+            [thread.id, reply.id, nested_reply.id, other_thread.id],
+        )
+
+        reply.delete()
+        thread.refresh_from_db()
+        self.assertEqual(thread.cf_nr_followups, 0)
+        self.assertIsNone(thread.cf_latest_followup_in_hierarchy)
+        self.forum.refresh_from_db()
+        self.assertEqual(self.forum.cf_nr_posts, 2)
+
+    def test_motion_followups(self):
+        motion = self.post(
+            self.meeting, model=Motion, voting_deadline=datetime.date(2024, 2, 1)
+        )
+        reply = self.post(motion)
+        self.assertEqual(reply.anchor, self.meeting)
+        self.assertEqual(motion.nr_followups, 1)
+        self.assertEqual(self.meeting.nr_posts, 2)
+        self.assertEqual(Post.objects.get(pk=motion.pk).cf_nr_followups, 1)
+
+    def test_update_cfs(self):
+        thread = self.post(self.forum)
+        replies = [self.post(thread), self.post(thread)]
+        Post.objects.update(cf_nr_followups=None, cf_latest_followup_in_hierarchy=None)
+        Forum.objects.update(cf_nr_posts=None)
+
+        with self.assertNumQueries(3):
+            self.assertEqual(Post.objects.all().update_cfs(), 3)
+        thread.refresh_from_db()
+        self.assertEqual(thread.cf_nr_followups, 2)
+        self.assertEqual(thread.cf_latest_followup_in_hierarchy, replies[1])
+        self.assertEqual(Post.objects.get(pk=replies[0].pk).cf_nr_followups, 0)
+
+        Forum.objects.all().update_cfs()
+        self.forum.refresh_from_db()
+        self.assertEqual(self.forum.cf_nr_posts, 3)
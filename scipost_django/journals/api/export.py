@@ -0,0 +1,189 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch, QuerySet
+
+from organizations.models import Organization
+
+from ..models import Publication, PublicationAuthorsTable
+
+
+class Echo:
+    """Pseudo-buffer for `csv.writer`, returning the rows instead of writing them."""
+
+    def write(self, value):
+        return value
+
+
+class PublicationExport:
+    """
+    Bulk export of the metadata of Publications, as JSON Lines or CSV.
+
+    The rows are generated lazily from a server-side cursor, fetching
+    the related objects needed for the `includes` once per chunk,
+    such that the export can be streamed in constant memory.
+    """
+
+    FORMATS = {
+        "jsonl": "application/jsonl",
+        "csv": "text/csv",
+    }
+    COLUMNS = [
+        "doi",
+        "url",
+        "title",
+        "author_list",
+        "abstract",
+        "journal",
+        "citation",
+        "submission_date",
+        "acceptance_date",
+        "publication_date",
+        "latest_activity",
+        "cc_license",
+        "acad_field",
+        "specialties",
+        "topics",
+    ]
+    INCLUDES = {
+        "authors": ["authors"],
+        "affiliations": ["affiliations"],
+        "funders": ["funders", "grants"],
+        "citations": ["number_of_citations"],
+    }
+    CHUNK_SIZE = 500
+
+    def __init__(self, queryset: QuerySet[Publication], includes=()):
+        self.queryset = queryset
+        self.includes = [include for include in self.INCLUDES if include in includes]
+        self.columns = self.COLUMNS + [
+            column for include in self.includes for column in self.INCLUDES[include]
+        ]
+
+    def get_queryset(self):
+        queryset = (
+            self.queryset.select_related(
+                "in_journal",
+                "in_issue__in_journal",
+                "in_issue__in_volume__in_journal",
+                "acad_field",
+            )
+            .prefetch_related("specialties", "topics")
+            # The bulky metadata is not exported
+            .defer(
+                "abstract_jats",
+                "metadata",
+                "metadata_xml",
+                "metadata_DOAJ",
+                "citedby",
+                "search_vector",
+            )
+            .order_by("id")
+        )
+        if "authors" in self.includes or "affiliations" in self.includes:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "authors",
+                    queryset=PublicationAuthorsTable.objects.select_related(
+                        "profile"
+                    ).prefetch_related(
+                        Prefetch(
+                            "affiliations",
+                            queryset=Organization.objects.only("id", "name", "country"),
+                        )
+                    ),
+                )
+            )
+        if "funders" in self.includes:
+            queryset = queryset.prefetch_related("grants__funder", "funders_generic")
+        return queryset
+
+    def rows(self):
+        for publication in self.get_queryset().iterator(chunk_size=self.CHUNK_SIZE):
+            yield self.get_row(publication)
+
+    def get_row(self, publication: Publication):
+        row = {
+            "doi": publication.doi_string,
+            "url": publication.get_absolute_url(),
+            "title": publication.title,
+            "author_list": publication.author_list,
+            "abstract": publication.abstract,
+            "journal": publication.get_journal().name,
+            # Not the `citation` property, which saves the calculated field if missing
+            "citation": publication.cf_citation,
+            "submission_date": publication.submission_date,
+            "acceptance_date": publication.acceptance_date,
+            "publication_date": publication.publication_date,
+            "latest_activity": publication.latest_activity,
+            "cc_license": publication.cc_license,
+            "acad_field": str(publication.acad_field),
+            "specialties": [str(s) for s in publication.specialties.all()],
+            "topics": [str(t) for t in publication.topics.all()],
+        }
+        if "authors" in self.includes:
+            row["authors"] = [
+                {
+                    "first_name": author.first_name,
+                    "last_name": author.last_name,
+                    "affiliations": [org.id for org in author.affiliations.all()],
+                }
+                for author in publication.authors.all()
+            ]
+        if "affiliations" in self.includes:
+            organizations = {
+                org.id: org
+                for author in publication.authors.all()
+                for org in author.affiliations.all()
+            }
+            row["affiliations"] = [
+                {"id": org.id, "name": org.name, "country": str(org.country)}
+                for org in organizations.values()
+            ]
+        if "funders" in self.includes:
+            funders = {grant.funder for grant in publication.grants.all()}
+            funders.update(publication.funders_generic.all())
+            row["funders"] = [
+                {"name": funder.name, "identifier": funder.identifier}
+                for funder in sorted(funders, key=lambda funder: funder.name)
+            ]
+            row["grants"] = [
+                {"funder": grant.funder.name, "number": grant.number}
+                for grant in publication.grants.all()
+            ]
+        if "citations" in self.includes:
+            row["number_of_citations"] = publication.number_of_citations
+        return row
+
+    def as_jsonl(self):
+        for row in self.rows():
+            yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+    def as_csv(self):
+        """
+        Generate the CSV lines, with the lists of (nested) values
+        joined by semicolons.
+        """
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.columns)
+        for row in self.rows():
+            yield writer.writerow([self.csv_value(row[key]) for key in self.columns])
+
+    @classmethod
+    def csv_value(cls, value):
+        if isinstance(value, list):
+            return "; ".join(cls.csv_value(item) for item in value)
+        if isinstance(value, dict):
+            return " ".join(
+                f"[{cls.csv_value(v)}]" if isinstance(v, list) else cls.csv_value(v)
+                for v in value.values()
+            )
+        return "" if value is None else str(value)
+
+    def stream(self, format: str):
+        return getattr(self, f"as_{format}")()
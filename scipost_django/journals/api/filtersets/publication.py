@@ -8,6 +8,10 @@ from ...models import Publication
 
 
 class PublicationPublicAPIFilterSet(df_filters.FilterSet):
+    modified_since = df_filters.DateTimeFilter(
+        field_name="latest_activity", lookup_expr="gte"
+    )
+
     class Meta:
         model = Publication
         fields = {
@@ -3,11 +3,17 @@ __license__ = "AGPL v3"
 
 
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import AllowAny
 
+from api.views.search import FullTextSearchFilter
 from api.viewsets.base import ExtraFilteredReadOnlyModelViewSet
-from api.viewsets.mixins import FilteringOptionsActionMixin
+from api.viewsets.mixins import CursorPaginationMixin, FilteringOptionsActionMixin
 
 from journals.models import Publication
 from journals.regexes import PUBLICATION_DOI_LABEL_REGEX
@@ -15,6 +21,7 @@ from journals.api.filtersets import (
     PublicationPublicAPIFilterSet,
     PublicationPublicSearchAPIFilterSet,
 )
+from journals.api.export import PublicationExport
 from journals.api.serializers import (
     PublicationPublicSerializer,
     PublicationPublicSearchSerializer,
@@ -22,7 +29,9 @@ from journals.api.serializers import (
 
 
 class PublicationPublicAPIViewSet(
-    FilteringOptionsActionMixin, ExtraFilteredReadOnlyModelViewSet
+    CursorPaginationMixin,
+    FilteringOptionsActionMixin,
+    ExtraFilteredReadOnlyModelViewSet,
 ):
     queryset = Publication.objects.published()
     permission_classes = [
@@ -35,6 +44,7 @@ class PublicationPublicAPIViewSet(
     ordering_fields = [
         "publication_date",
     ]
+    cursor_ordering = ("-publication_date", "-id")
     filterset_class = PublicationPublicAPIFilterSet
     extra_filters = {
         "journal__name": {
@@ -53,6 +63,33 @@ class PublicationPublicAPIViewSet(
         "doi_label__icontains",
     ]
 
+    @action(detail=False)
+    def export(self, request):
+        """
+        Stream the metadata of all the (filtered) publications in a single response,
+        as JSON Lines (`export_format=jsonl`, the default) or CSV (`export_format=csv`).
+
+        Related data can be added with e.g. `include=authors,affiliations,funders,citations`,
+        and incremental exports made with `modified_since`.
+        """
+        export_format = request.query_params.get("export_format", "jsonl")
+        if export_format not in PublicationExport.FORMATS:
+            raise ValidationError(
+                {"export_format": f"Choose from {list(PublicationExport.FORMATS)}."}
+            )
+        export = PublicationExport(
+            self.filter_queryset(self.get_queryset()),
+            includes=request.query_params.get("include", "").split(","),
+        )
+        response = StreamingHttpResponse(
+            export.stream(export_format),
+            content_type=PublicationExport.FORMATS[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="SciPost_publications.{export_format}"'
+        )
+        return response
+
 
 # For Vue-based search
 class PublicationPublicSearchAPIViewSet(
@@ -63,6 +100,7 @@ class PublicationPublicSearchAPIViewSet(
         AllowAny,
     ]
     serializer_class = PublicationPublicSearchSerializer
+    filter_backends = [FullTextSearchFilter, OrderingFilter, DjangoFilterBackend]
     lookup_field = "doi_label"
     lookup_value_regex = PUBLICATION_DOI_LABEL_REGEX
     search_fields = ["title", "author_list", "abstract", "doi_label"]
@@ -0,0 +1,62 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class JournalsConfig(AppConfig):
+    name = "journals"
+
+    def ready(self):
+        super().ready()
+
+        from . import signals
+        from finances.models import PubFrac
+        from journals.models import (
+            Issue,
+            Journal,
+            Publication,
+            PublicationAuthorsTable,
+            PublicationResource,
+            PublicationUpdate,
+            Volume,
+        )
+        from submissions.models import EditorialDecision
+
+        for signal in [post_save, post_delete]:
+            signal.connect(
+                signals.invalidate_page_cache_of_publication,
+                sender=Publication,
+            )
+            for model in [
+                PublicationAuthorsTable,
+                PublicationResource,
+                PublicationUpdate,
+                PubFrac,
+            ]:
+                signal.connect(
+                    signals.invalidate_page_cache_of_publication_related,
+                    sender=model,
+                )
+            signal.connect(signals.invalidate_page_cache_of_issue, sender=Issue)
+            signal.connect(signals.invalidate_page_cache_of_volume, sender=Volume)
+            signal.connect(signals.invalidate_page_cache_of_journal, sender=Journal)
+        post_save.connect(
+            signals.invalidate_page_cache_of_decision_journal,
+            sender=EditorialDecision,
+        )
+        for field in [
+            Publication.grants,
+            Publication.funders_generic,
+            Publication.topics,
+        ]:
+            m2m_changed.connect(
+                signals.m2m_changed_invalidate_page_cache_of_publication,
+                sender=field.through,
+            )
+        m2m_changed.connect(
+            signals.m2m_changed_invalidate_page_cache_of_author_affiliations,
+            sender=PublicationAuthorsTable.affiliations.through,
+        )
@@ -0,0 +1,174 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from collections import defaultdict
+from typing import Iterable
+
+from django.db.models import Count, F, Min
+from django.db.models.functions import Coalesce, ExtractYear
+from django.utils import timezone
+
+from submissions.models import Submission
+
+from .models import Citation, Journal, Publication
+
+# Key of the counts over all specialties
+ALL = None
+
+
+class JournalMetrics:
+    """
+    Batch computation of the Journals' `cf_metrics`.
+
+    The numbers of publications, submissions and citations of all the Journals
+    are fetched per year (and per specialty) with a few grouped queries.
+    The CiteScores and impact factors of all years (and specialties) are then
+    derived in memory.
+    """
+
+    def __init__(self, journals: Iterable[Journal] | None = None):
+        self.journals = list(Journal.objects.all() if journals is None else journals)
+
+    def load(self) -> None:
+        journal_ids = [journal.id for journal in self.journals]
+        self.specialties = defaultdict(list)
+        for journal_id, specialty_id, slug in (
+            Journal.specialties.through.objects.filter(journal_id__in=journal_ids)
+            .values_list("journal_id", "specialty_id", "specialty__slug")
+            .order_by("specialty__acad_field", "specialty__order")
+        ):
+            self.specialties[journal_id].append((specialty_id, slug))
+
+        publications = Publication.objects.annotate(
+            journal_id=Coalesce(
+                "in_journal_id",
+                "in_issue__in_journal_id",
+                "in_issue__in_volume__in_journal_id",
+            ),
+            year=ExtractYear("publication_date"),
+        ).filter(journal_id__in=journal_ids)
+        self.first_year = dict(
+            publications.values("journal_id")
+            .annotate(first_year=Min("year"))
+            .values_list("journal_id", "first_year")
+            .order_by()
+        )
+        self.nr_publications = self._count(publications, "specialties", "year")
+
+        submissions = Submission.objects.filter(
+            submitted_to_id__in=journal_ids, is_resubmission_of__isnull=True
+        ).annotate(journal_id=F("submitted_to_id"), year=ExtractYear("submission_date"))
+        self.nr_submissions = self._count(submissions, "specialties", "year")
+
+        citations = Citation.objects.annotate(
+            journal_id=Coalesce(
+                "publication__in_journal_id",
+                "publication__in_issue__in_journal_id",
+                "publication__in_issue__in_volume__in_journal_id",
+            ),
+            publication_year=ExtractYear("publication__publication_date"),
+        ).filter(journal_id__in=journal_ids, year__isnull=False)
+        self.nr_citations = self._count(
+            citations, "publication__specialties", "publication_year", "year"
+        )
+        self.nr_citations_in_year = defaultdict(int)
+        for (*key, publication_year, year), count in self.nr_citations.items():
+            self.nr_citations_in_year[(*key, year)] += count
+
+    @staticmethod
+    def _count(queryset, specialties: str, *fields: str) -> dict[tuple, int]:
+        """
+        Count the objects per (journal, specialty, *fields),
+        the specialty being ALL for the counts over all specialties.
+        """
+        counts = defaultdict(int)
+        for journal_id, *values, count in (
+            queryset.values("journal_id", *fields)
+            .annotate(count=Count("id"))
+            .values_list("journal_id", *fields, "count")
+            .order_by()
+        ):
+            counts[(journal_id, ALL, *values)] = count
+        for journal_id, specialty_id, *values, count in (
+            queryset.filter(**{f"{specialties}__isnull": False})
+            .values("journal_id", specialties, *fields)
+            .annotate(count=Count("id"))
+            .values_list("journal_id", specialties, *fields, "count")
+            .order_by()
+        ):
+            counts[(journal_id, specialty_id, *values)] = count
+        return counts
+
+    def citations(self, key, publication_years, citation_years) -> int:
+        return sum(
+            self.nr_citations[(*key, publication_year, year)]
+            for publication_year in publication_years
+            for year in citation_years
+        )
+
+    def citescore(self, key, year: int) -> float:
+        """
+        Citations in years YYYY-3 to YYYY of the papers published in these years,
+        divided by the number of these papers.
+        """
+        years = range(year - 3, year + 1)
+        nr_publications = sum(self.nr_publications[(*key, y)] for y in years)
+        if not nr_publications:
+            return 0
+        return self.citations(key, years, years) / nr_publications
+
+    def impact_factor(self, key, year: int) -> float:
+        """
+        Citations in year YYYY of the papers published in years YYYY-1 and YYYY-2,
+        divided by the number of these papers.
+        """
+        years = (year - 2, year - 1)
+        nr_publications = sum(self.nr_publications[(*key, y)] for y in years)
+        if not nr_publications:
+            return 0
+        return self.citations(key, years, [year]) / nr_publications
+
+    def compute(self, journal: Journal) -> None:
+        current_year = timezone.now().year
+        if journal.id in self.first_year:
+            years = list(range(self.first_year[journal.id], current_year))
+        else:
+            years = [current_year]
+        keys = {"all": (journal.id, ALL)} | {
+            slug: (journal.id, specialty_id)
+            for specialty_id, slug in self.specialties[journal.id]
+        }
+        metrics = {
+            "nr_publications": (
+                "Number of publications per year",
+                lambda key, year: self.nr_publications[(*key, year)],
+            ),
+            "nr_submissions": (
+                "Number of submissions per year",
+                lambda key, year: self.nr_submissions[(*key, year)],
+            ),
+            "nr_citations": (
+                "Number of citations per year",
+                lambda key, year: self.nr_citations_in_year[(*key, year)],
+            ),
+            "citedby_citescore": ("CiteScore", self.citescore),
+            "citedby_impact_factor": ("Impact Factor", self.impact_factor),
+        }
+        for name, (title, metric) in metrics.items():
+            journal.cf_metrics[name] = {
+                "title": title,
+                "years": years,
+                name: {
+                    label: [metric(key, year) for year in years]
+                    for label, key in keys.items()
+                },
+            }
+
+    def update(self, batch_size: int = 100) -> int:
+        """Recompute and save the `cf_metrics` of the Journals."""
+        self.load()
+        for journal in self.journals:
+            self.compute(journal)
+        Journal.objects.bulk_update(self.journals, ["cf_metrics"], batch_size)
+        return len(self.journals)
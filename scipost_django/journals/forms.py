@@ -129,9 +129,9 @@ class PortalPublicationSearchForm(CrispyFormMixin, SearchForm[Publication]):
             queryset = queryset.filter(specialties__slug=self.specialty_slug)
 
         if author := self.cleaned_data.get("author"):
-            queryset = queryset.filter(author_list__icontains=author)
+            queryset = queryset.search(author, fields=["author_list"])
         if title := self.cleaned_data.get("title"):
-            queryset = queryset.filter(title__icontains=title)
+            queryset = queryset.search(title, fields=["title"])
         if doi_label := self.cleaned_data.get("doi_label"):
             queryset = queryset.filter(doi_label__icontains=doi_label)
         if journal := self.cleaned_data.get("journal"):
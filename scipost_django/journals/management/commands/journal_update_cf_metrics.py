@@ -4,18 +4,24 @@ __license__ = "AGPL v3"
 
 from django.core.management.base import BaseCommand
 
+from journals.calculated_fields import JournalMetrics
 from journals.models import Journal
+from journals.plots import get_metrics_plots
 
 
 class Command(BaseCommand):
     help = (
         "For all Journal model instances, "
-        "this updates the calculated field `cf_metrics`"
+        "this updates the calculated field `cf_metrics` "
+        "and pre-renders the metrics plots of the active Journals"
     )
 
     def handle(self, *args, **kwargs):
-        for journal in Journal.objects.all():
-            journal.update_cf_metrics()
+        JournalMetrics().update()
         self.stdout.write(
             self.style.SUCCESS("Successfully updated Journal:cf_metrics.")
         )
+        for journal in Journal.objects.active().prefetch_related("specialties"):
+            for subset_key in ["all"] + [s.slug for s in journal.specialties.all()]:
+                get_metrics_plots(journal, subset_key)
+        self.stdout.write(self.style.SUCCESS("Successfully rendered metrics plots."))
@@ -2,10 +2,15 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 
-from django.db import connection, models
+import datetime
+
+from django.db import models
 from django.db.models import Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
+from common.utils.search import FullTextSearchQuerySetMixin
+
 from .constants import (
     STATUS_DRAFT,
     STATUS_PUBLICLY_OPEN,
@@ -85,7 +90,7 @@ class IssueManager(models.Manager.from_queryset(IssueQuerySet)):
         )
 
 
-class PublicationQuerySet(models.QuerySet):
+class PublicationQuerySet(FullTextSearchQuerySetMixin, models.QuerySet):
     def published(self):
         return self.filter(status=PUBLICATION_PUBLISHED).filter(
             models.Q(in_issue__status=STATUS_PUBLISHED)
@@ -139,57 +144,49 @@ class PublicationQuerySet(models.QuerySet):
     def most_cited(self, n_returns=5):
         return self.order_by("-number_of_citations")[:n_returns]
 
+    def _citations(self):
+        from journals.models.publication import Citation
+
+        return Citation.objects.filter(publication__in=self)
+
     def citations_in_year(self, year) -> int:
         """
         Returns the number of citations for all publications in the queryset for a given year.
         """
-        if not self.exists():
-            return 0
-
-        query = (
-            "SELECT COUNT(*) "
-            "FROM ("
-            "    SELECT jsonb_array_elements(citedby::jsonb) AS citation"
-            "    FROM journals_publication"
-            "    WHERE citedby <> '{}'::jsonb "
-            f"   AND id IN ({', '.join(map(str, self.values_list('id', flat=True)))})"
-            ") AS citations "
-            f"WHERE citation->>'year' = '{year}'"
-        )
-
-        # Run the query
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            citations = cursor.fetchone()
-
-        if citations:
-            return citations[0]
+        return self._citations().filter(year=year).count()
 
     def citations_per_year(self) -> dict[int, int]:
         """
         Returns a dictionary with year as key and number of citations as value.
         """
-        if not self.exists():
-            return {}
-
-        query = (
-            "SELECT CAST(citation->>'year' AS INTEGER), COUNT(*) "
-            "FROM ("
-            "    SELECT jsonb_array_elements(citedby::jsonb) AS citation"
-            "    FROM journals_publication"
-            "    WHERE citedby <> '{}'::jsonb "
-            f"   AND id IN ({', '.join(map(str, self.values_list('id', flat=True)))})"
-            ") AS citations "
-            "GROUP BY citation->>'year' "
-            "ORDER BY citation->>'year'"
+        return dict(
+            self._citations()
+            .filter(year__isnull=False)
+            .values("year")
+            .annotate(count=models.Count("id"))
+            .values_list("year", "count")
+            .order_by("year")
         )
 
-        # Run the query
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            citations = cursor.fetchall()
+    def citation_rate(self) -> float:
+        """
+        Return the citation rate in units of nr citations per article per year.
+        """
+        from journals.models.publication import Citation
 
-        return dict(citations)
+        cited = self.filter(
+            models.Exists(Citation.objects.filter(publication=models.OuterRef("pk"))),
+            latest_citedby_update__isnull=False,
+        )
+        nr_citations = cited._citations().count()
+        deltat = cited.aggregate(
+            deltat=models.Sum(
+                TruncDate("latest_citedby_update", tzinfo=datetime.timezone.utc)
+                - models.F("publication_date")
+            )
+        )["deltat"]
+        days = 1 + (deltat.days if deltat else 0)  # to avoid division by zero
+        return nr_citations * 365.25 / days
 
     def impact_factor(self, year):
         """
@@ -203,28 +200,9 @@ class PublicationQuerySet(models.QuerySet):
             publication_date__year__gte=int(year) - 2,
             publication_date__year__lte=int(year) - 1,
         )
-
-        if not qs.exists():
+        if not (nr_publications := qs.count()):
             return 0
-
-        query = (
-            "SELECT COUNT(*) "
-            "FROM ("
-            "    SELECT jsonb_array_elements(citedby::jsonb) AS citation"
-            "    FROM journals_publication"
-            "    WHERE citedby <> '{}'::jsonb "
-            f"   AND id IN ({', '.join(map(str, qs.values_list('id', flat=True)))})"
-            ") AS citations "
-            f"WHERE citation->>'year' = '{year}'"
-        )
-
-        # Run the query
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            citations = cursor.fetchone()
-
-        if citations:
-            return citations[0] / qs.count()
+        return qs._citations().filter(year=year).count() / nr_publications
 
     def citescore(self, year):
         """
@@ -238,28 +216,10 @@ class PublicationQuerySet(models.QuerySet):
             publication_date__year__lte=int(year),
             publication_date__year__gte=int(year) - 3,
         )
-
-        if not qs.exists():
+        if not (nr_publications := qs.count()):
             return 0
-
-        query = (
-            "SELECT COUNT(*) "
-            "FROM ("
-            "    SELECT jsonb_array_elements(citedby::jsonb) AS citation"
-            "    FROM journals_publication"
-            "    WHERE citedby <> '{}'::jsonb "
-            f"   AND id IN ({', '.join(map(str, qs.values_list('id', flat=True)))})"
-            ") AS citations "
-            f"WHERE citation->>'year' IN ('{year}', '{int(year) - 1}', '{int(year) - 2}', '{int(year) - 3}')"
-        )
-
-        # Run the query
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            citations = cursor.fetchone()
-
-        if citations:
-            return citations[0] / qs.count()
+        citations = qs._citations().filter(year__range=(int(year) - 3, int(year)))
+        return citations.count() / nr_publications
 
 
 class PublicationResourceQuerySet(models.QuerySet):
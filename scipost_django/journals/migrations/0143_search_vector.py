@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:48
+
+import common.utils.lookups
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("common", "0001_add_immutable_unaccent_function"),
+        ("journals", "0142_alter_publicationresource_options"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="publication",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector(
+                                common.utils.lookups.ImmutableUnaccent("title"),
+                                config="english",
+                                weight="A",
+                            ),
+                            "||",
+                            django.contrib.postgres.search.SearchVector(
+                                common.utils.lookups.ImmutableUnaccent("author_list"),
+                                config="english",
+                                weight="B",
+                            ),
+                            django.contrib.postgres.search.SearchConfig("english"),
+                        ),
+                        "||",
+                        django.contrib.postgres.search.SearchVector(
+                            common.utils.lookups.ImmutableUnaccent("abstract"),
+                            config="english",
+                            weight="C",
+                        ),
+                        django.contrib.postgres.search.SearchConfig("english"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        common.utils.lookups.ImmutableUnaccent("doi_label"),
+                        config="english",
+                        weight="D",
+                    ),
+                    django.contrib.postgres.search.SearchConfig("english"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="journals_pu_search__d06424_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass("title", name="gin_trgm_ops"),
+                name="journals_pub_title_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "author_list", name="gin_trgm_ops"
+                ),
+                name="journals_pub_authors_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_citations(apps, schema_editor):
+    Publication = apps.get_model("journals.Publication")
+    Citation = apps.get_model("journals.Citation")
+
+    citations = []
+    for publication in (
+        Publication.objects.exclude(citedby={}).only("id", "citedby").iterator()
+    ):
+        if not isinstance(publication.citedby, list):
+            continue
+        for entry in publication.citedby:
+            year = str(entry.get("year") or "")
+            citations.append(
+                Citation(
+                    publication_id=publication.id,
+                    doi=entry.get("doi") or "",
+                    year=int(year) if year.isdigit() else None,
+                    journal_abbreviation=entry.get("journal_abbreviation") or "",
+                )
+            )
+        if len(citations) >= 10000:
+            Citation.objects.bulk_create(citations)
+            citations = []
+    Citation.objects.bulk_create(citations)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("journals", "0143_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Citation",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("doi", models.CharField(max_length=256)),
+                ("year", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("journal_abbreviation", models.CharField(blank=True, max_length=256)),
+                (
+                    "publication",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="journals.publication",
+                    ),
+                ),
+            ],
+            options={
+                "default_related_name": "citations",
+                "indexes": [
+                    models.Index(
+                        fields=["publication", "year"],
+                        name="journals_ci_publica_bfed0e_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_citations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("journals", "0144_citation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="publication",
+            index=models.Index(
+                fields=["publication_date", "id"], name="journals_pu_publica_a9cd7b_idx"
+            ),
+        ),
+    ]
@@ -6,7 +6,7 @@ from .journal import Journal
 from .volume import Volume
 from .issue import Issue
 from .submission_template import SubmissionTemplate
-from .publication import PublicationAuthorsTable, Publication, Reference
+from .publication import PublicationAuthorsTable, Publication, Reference, Citation
 from .deposits import Deposit, DOAJDeposit, GenericDOIDeposit
 from .update import PublicationUpdate
 from .autogenerated_file import AutogeneratedFileContentTemplate
@@ -9,7 +9,6 @@ import json
 from django.db import models
 from django.db.models import Avg, F
 from django.urls import reverse
-from django.utils import timezone
 from django.utils.functional import cached_property
 
 from scipost.fields import ChoiceArrayField
@@ -314,13 +313,7 @@ class Journal(models.Model):
             publications = publications.filter(
                 accepted_submission__eicrecommendations__recommendation=tier
             )
-        ncites = 0
-        deltat = 1  # to avoid division by zero
-        for pub in publications:
-            if pub.citedby and pub.latest_citedby_update:
-                ncites += len(pub.citedby)
-                deltat += (pub.latest_citedby_update.date() - pub.publication_date).days
-        return ncites * 365.25 / deltat
+        return publications.citation_rate()
 
     def nr_citations(self, year, specialty=None):
         publications = self.get_publications()
@@ -366,82 +359,6 @@ class Journal(models.Model):
         """
         Update the `cf_metrics` calculated field for this Journal.
         """
-        publications = self.get_publications()
-        from submissions.models import Submission
-
-        if publications:
-            pubyears = [
-                year
-                for year in range(
-                    publications.last().publication_date.year, timezone.now().year
-                )
-            ]
-        else:
-            pubyears = [timezone.now().year]
-        from submissions.models import Submission
-
-        submissions = Submission.objects.filter(
-            submitted_to=self, is_resubmission_of__isnull=True
-        )
-        self.cf_metrics["nr_publications"] = {
-            "title": "Number of publications per year",
-            "years": pubyears,
-            "nr_publications": {
-                "all": [
-                    publications.filter(publication_date__year=year).count()
-                    for year in pubyears
-                ]
-            },
-        }
-        self.cf_metrics["nr_submissions"] = {
-            "title": "Number of submissions per year",
-            "years": pubyears,
-            "nr_submissions": {
-                "all": [
-                    submissions.filter(submission_date__year=year).count()
-                    for year in pubyears
-                ]
-            },
-        }
-        self.cf_metrics["nr_citations"] = {
-            "title": "Number of citations per year",
-            "years": pubyears,
-            "nr_citations": {"all": [self.nr_citations(year) for year in pubyears]},
-        }
-        self.cf_metrics["citedby_citescore"] = {
-            "title": "CiteScore",
-            "years": pubyears,
-            "citedby_citescore": {
-                "all": [self.citedby_citescore(year) for year in pubyears]
-            },
-        }
-        self.cf_metrics["citedby_impact_factor"] = {
-            "title": "Impact Factor",
-            "years": pubyears,
-            "citedby_impact_factor": {
-                "all": [self.citedby_impact_factor(year) for year in pubyears]
-            },
-        }
-        for specialty in self.specialties.all():
-            self.cf_metrics["nr_publications"]["nr_publications"][specialty.slug] = [
-                publications.filter(
-                    specialties=specialty, publication_date__year=year
-                ).count()
-                for year in pubyears
-            ]
-            self.cf_metrics["nr_submissions"]["nr_submissions"][specialty.slug] = [
-                submissions.filter(
-                    specialties=specialty, submission_date__year=year
-                ).count()
-                for year in pubyears
-            ]
-            self.cf_metrics["nr_citations"]["nr_citations"][specialty.slug] = [
-                self.nr_citations(year, specialty) for year in pubyears
-            ]
-            self.cf_metrics["citedby_citescore"]["citedby_citescore"][
-                specialty.slug
-            ] = [self.citedby_citescore(year, specialty) for year in pubyears]
-            self.cf_metrics["citedby_impact_factor"]["citedby_impact_factor"][
-                specialty.slug
-            ] = [self.citedby_impact_factor(year, specialty) for year in pubyears]
-        self.save()
+        from journals.calculated_fields import JournalMetrics
+
+        JournalMetrics([self]).update()
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Min, Sum, OuterRef, Exists, Q
@@ -29,11 +31,11 @@ from ..managers import PublicationQuerySet
 from ..validators import doi_publication_validator
 
 from common.utils import get_current_domain
+from common.utils.search import weighted_search_vector
 from finances.models import PubFrac
 from scipost.constants import SCIPOST_APPROACHES
 from scipost.fields import ChoiceArrayField
 
-
 if TYPE_CHECKING:
     from django.db.models.manager import RelatedManager, Manager
     from production.models import ProofsRepository
@@ -97,6 +99,14 @@ class Publication(models.Model):
     It may be directly related to a Journal or to an Issue.
     """
 
+    SEARCH_VECTOR_WEIGHTS = {
+        "title": "A",
+        "author_list": "B",
+        "abstract": "C",
+        "doi_label": "D",
+    }
+    SEARCH_TRIGRAM_FIELDS = ["title", "author_list"]
+
     PUBTYPE_ARTICLE = "article"
     PUBTYPE_CODEBASE_RELEASE = "codebase_release"
     PUBTYPE_CHOICES = (
@@ -218,16 +228,37 @@ class Publication(models.Model):
         help_text="NB: calculated field. Do not modify.",
     )
 
+    # Full text search, maintained by the database
+    search_vector = models.GeneratedField(
+        expression=weighted_search_vector(SEARCH_VECTOR_WEIGHTS),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     objects = PublicationQuerySet.as_manager()
 
     if TYPE_CHECKING:
         authors = RelatedManager[PublicationAuthorsTable]
+        citations = "RelatedManager[Citation]"
         gen_ai_disclosures = "Manager[GenAIDisclosure]"
         resources = RelatedManager[PublicationResource]
 
     class Meta:
         default_related_name = "publications"
         ordering = ("-publication_date", "-paper_nr")
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            # Trigram indexes for the word similarity fallback of the search
+            GinIndex(
+                OpClass("title", name="gin_trgm_ops"),
+                name="journals_pub_title_trgm_idx",
+            ),
+            GinIndex(
+                OpClass("author_list", name="gin_trgm_ops"),
+                name="journals_pub_authors_trgm_idx",
+            ),
+            models.Index(fields=["publication_date", "id"]),
+        ]
 
     def __str__(self):
         return "{cite}, {title} by {authors}, {date}".format(
@@ -741,3 +772,55 @@ class Reference(models.Model):
         return "[{}] {}, {}".format(
             self.reference_number, self.authors[:30], self.citation[:30]
         )
+
+
+class Citation(models.Model):
+    """
+    A Citation of a Publication by another work, as harvested from Crossref.
+
+    These mirror the entries of the Publication's `citedby` data,
+    so that citation metrics can be aggregated in the database.
+    """
+
+    publication = models.ForeignKey["Publication"](
+        "journals.Publication", on_delete=models.CASCADE
+    )
+
+    doi = models.CharField(max_length=256)
+    year = models.PositiveSmallIntegerField(blank=True, null=True)
+    journal_abbreviation = models.CharField(max_length=256, blank=True)
+
+    class Meta:
+        default_related_name = "citations"
+        indexes = [models.Index(fields=["publication", "year"])]
+
+    def __str__(self):
+        return f"{self.doi} citing {self.publication}"
+
+    @classmethod
+    def from_citedby(cls, publication: "Publication") -> list["Citation"]:
+        """Return the (unsaved) Citations in the Publication's `citedby` data."""
+        citations = []
+        citedby = publication.citedby if isinstance(publication.citedby, list) else []
+        for entry in citedby:
+            year = str(entry.get("year") or "")
+            citations.append(
+                cls(
+                    publication=publication,
+                    doi=entry.get("doi") or "",
+                    year=int(year) if year.isdigit() else None,
+                    journal_abbreviation=entry.get("journal_abbreviation") or "",
+                )
+            )
+        return citations
+
+    @classmethod
+    def sync(cls, publications: "list[Publication]", batch_size: int = 1000) -> None:
+        """
+        Replace the Citations of the given Publications by those in their `citedby`.
+        """
+        cls.objects.filter(publication__in=publications).delete()
+        cls.objects.bulk_create(
+            [c for publication in publications for c in cls.from_citedby(publication)],
+            batch_size=batch_size,
+        )
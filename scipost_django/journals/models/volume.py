@@ -94,10 +94,4 @@ class Volume(models.Model):
             publications = publications.filter(
                 accepted_submission__eicrecommendations__recommendation=tier
             )
-        ncites = 0
-        deltat = 1  # to avoid division by zero
-        for pub in publications:
-            if pub.citedby and pub.latest_citedby_update:
-                ncites += len(pub.citedby)
-                deltat += (pub.latest_citedby_update.date() - pub.publication_date).days
-        return ncites * 365.25 / deltat
+        return publications.citation_rate()
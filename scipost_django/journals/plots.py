@@ -0,0 +1,75 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import hashlib
+import io
+import json
+
+from django.core.cache import cache
+from matplotlib.figure import Figure
+
+METRICS_PLOTS = {
+    "nr_publications": "Publications",
+    "nr_submissions": "Submissions",
+    "nr_citations": "Total Citations",
+    "citedby_citescore": "CiteScore",
+    "citedby_impact_factor": "Impact Factor",
+}
+
+# The plots are cached by a hash of their data, so they never become stale
+METRICS_PLOT_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+
+def render_bar_plot(x, y, name):
+    """
+    Return the SVG of a bar plot.
+
+    The Figure is created without pyplot, which would keep a reference to it
+    until closed; it is simply garbage collected once rendered.
+    """
+    fig = Figure(figsize=(5, 3))
+    ax = fig.subplots()
+    ax.bar(x, y)
+    ax.set_title(name)
+
+    plot_svg = io.StringIO()
+    fig.savefig(plot_svg, format="svg")
+    plot_svg = plot_svg.getvalue()
+    # Manipulate the SVG to make it display properly in the browser
+    # Add the classes `w-100` and `h-100` to make the SVG responsive
+    plot_svg = plot_svg.replace("<svg ", '<svg class="w-100 h-auto" ')
+    return plot_svg
+
+
+def get_metrics_plots(journal, subset_key="all"):
+    """
+    Return the SVG plots of the Journal's `cf_metrics` (for all specialties, or
+    the one with the given slug), keyed by `<metric>_plot` for the non-empty metrics.
+
+    The plots are rendered only if not found in the cache.
+    """
+    plots_data = {}
+    for plot_key, name in METRICS_PLOTS.items():
+        if (
+            (key_metrics := journal.cf_metrics.get(plot_key))
+            and (years := key_metrics.get("years", []))
+            and (values := key_metrics.get(plot_key, {}).get(subset_key))
+            and not all(v == 0 for v in values)
+        ):
+            data = json.dumps([years, values, name])
+            cache_key = "metrics_plot:" + hashlib.md5(data.encode()).hexdigest()
+            plots_data[cache_key] = (f"{plot_key}_plot", years, values, name)
+
+    plots = cache.get_many(plots_data.keys())
+    rendered = {
+        cache_key: render_bar_plot(years, values, name)
+        for cache_key, (_, years, values, name) in plots_data.items()
+        if cache_key not in plots
+    }
+    cache.set_many(rendered, METRICS_PLOT_CACHE_TIMEOUT)
+    plots.update(rendered)
+    return {
+        context_key: plots[cache_key]
+        for cache_key, (context_key, *_) in plots_data.items()
+    }
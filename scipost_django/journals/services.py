@@ -2,28 +2,34 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 
+import datetime
 import hashlib
+import json
 import logging
 import random
 import string
-import requests
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, QuerySet, Value, When
 from django.utils import timezone
 
-from .models import Publication
+from common.utils.http import RateLimiter, pooled_session
 
+from .models import Citation, Publication
 
 logger = logging.getLogger(__name__)
 
 
-def update_citedby(doi_label):
+def citedby_query_params(publication):
     """
-    Run an XML query at Crossref, to update the Cited-by data for a Publication
+    Return the parameters of the Crossref query for the Cited-by data of a Publication.
     """
-    publication = Publication.objects.get(doi_label=doi_label)
-
     # create a doi_batch_id
     salt = ""
     for i in range(5):
@@ -49,31 +55,23 @@ def update_citedby(doi_label):
         "</body>"
         "</query_batch>"
     )
-    url = "http://doi.crossref.org/servlet/getForwardLinks"
-    params = {
+    return {
         "usr": settings.CROSSREF_LOGIN_ID,
         "pwd": settings.CROSSREF_LOGIN_PASSWORD,
         "qdata": query_xml,
         "doi": publication.doi_string,
     }
-    r = requests.post(url, params=params)
-    if r.status_code == 401:
-        print(
-            "update_citedby: Crossref credentials are invalid. "
-            "Please contact the SciPost Admin."
-        )
 
-        logger.info(
-            "update_citedby: Crossref credentials are invalid. "
-            "Please contact the SciPost Admin."
-        )
-        return
 
+def parse_citedby_response(text):
+    """
+    Return the list of citations in a Crossref forward links response,
+    or None if the response cannot be parsed.
+    """
     try:
-        response_deserialized = ET.fromstring(r.text)
+        response_deserialized = ET.fromstring(text)
     except ET.ParseError:  # something went wrong, abort
-        logger.info("Response parsing failed for doi: %s", publication.doi_string)
-        return
+        return None
 
     prefix = "{http://www.crossref.org/qrschema/2.0}"
     citations = []
@@ -135,8 +133,148 @@ def update_citedby(doi_label):
         citation["multiauthors"] = multiauthors
         citations.append(citation)
 
-    # Update Publication object
-    publication.citedby = citations
-    publication.number_of_citations = len(citations)
-    publication.latest_citedby_update = timezone.now()
-    publication.save()
+    return citations
+
+
+def citations_hash(citations):
+    """Hash of a list of citations, independent of the (JSON) key ordering."""
+    return hashlib.sha1(
+        json.dumps(citations or [], sort_keys=True).encode("utf8")
+    ).hexdigest()
+
+
+class CrossrefCredentialsError(Exception):
+    pass
+
+
+class CitedByHarvester:
+    """
+    Harvest the Cited-by data of Publications from Crossref.
+
+    Queries are sent concurrently over a pooled session (retrying with backoff),
+    within a global rate limit. The results are written in batches, and only for
+    the Publications whose citations have changed; for the others, only the
+    `latest_citedby_update` is bumped.
+    """
+
+    # Publications published within this many days are harvested first
+    RECENT_DAYS = 90
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_requests_per_second: float | None = 10,
+        batch_size: int = 200,
+    ):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.session = pooled_session(pool_size=max_workers)
+        self.rate_limiter = RateLimiter(max_requests_per_second)
+        self.aborted = threading.Event()
+        self.nr_updated = 0
+        self.nr_unchanged = 0
+        self.nr_failed = 0
+
+    @classmethod
+    def prioritized(cls, publications: QuerySet) -> QuerySet:
+        """
+        Order the Publications by harvesting priority: recent Publications first,
+        then by staleness of their Cited-by data (never harvested first).
+        """
+        recent = timezone.now().date() - datetime.timedelta(days=cls.RECENT_DAYS)
+        return publications.alias(
+            is_older=Case(
+                When(publication_date__gte=recent, then=Value(0)), default=Value(1)
+            )
+        ).order_by(
+            "is_older",
+            F("latest_citedby_update").asc(nulls_first=True),
+            "-publication_date",
+        )
+
+    def fetch(self, publication):
+        """
+        Return the citations of the Publication (None if they could not be fetched).
+        """
+        if self.aborted.is_set():
+            raise CrossrefCredentialsError
+        self.rate_limiter.acquire()
+        try:
+            r = self.session.post(
+                settings.CROSSREF_FORWARD_LINKS_URL,
+                params=citedby_query_params(publication),
+                timeout=60,
+            )
+        except requests.RequestException as e:
+            logger.info(
+                "Cited-by query failed for doi %s: %s", publication.doi_string, e
+            )
+            return None
+        if r.status_code == 401:
+            self.aborted.set()
+            raise CrossrefCredentialsError
+        citations = parse_citedby_response(r.text)
+        if citations is None:
+            logger.info("Response parsing failed for doi: %s", publication.doi_string)
+        return citations
+
+    def harvest(self, publications: QuerySet) -> None:
+        """
+        Update the Cited-by data of the given Publications, in order of priority.
+        """
+        publications = self.prioritized(publications).only(
+            "id", "doi_label", "title", "citedby"
+        )
+        batch = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for publication in publications.iterator(chunk_size=self.batch_size):
+                    batch.append(publication)
+                    if len(batch) == self.batch_size:
+                        self.harvest_batch(batch, executor)
+                        batch = []
+                self.harvest_batch(batch, executor)
+            except CrossrefCredentialsError:
+                print(
+                    "update_citedby: Crossref credentials are invalid. "
+                    "Please contact the SciPost Admin."
+                )
+                logger.info(
+                    "update_citedby: Crossref credentials are invalid. "
+                    "Please contact the SciPost Admin."
+                )
+
+    def harvest_batch(self, batch, executor) -> None:
+        """Concurrently fetch the citations of a batch, and save the changes."""
+        now = timezone.now()
+        changed = []
+        unchanged_ids = []
+        for publication, citations in zip(batch, executor.map(self.fetch, batch)):
+            if citations is None:
+                self.nr_failed += 1
+            elif citations_hash(citations) == citations_hash(publication.citedby):
+                unchanged_ids.append(publication.id)
+            else:
+                publication.citedby = citations
+                publication.number_of_citations = len(citations)
+                publication.latest_citedby_update = now
+                changed.append(publication)
+        with transaction.atomic():
+            Publication.objects.bulk_update(
+                changed, ["citedby", "number_of_citations", "latest_citedby_update"]
+            )
+            Citation.sync(changed)
+        Publication.objects.filter(id__in=unchanged_ids).update(
+            latest_citedby_update=now
+        )
+        self.nr_updated += len(changed)
+        self.nr_unchanged += len(unchanged_ids)
+
+
+def update_citedby(doi_label):
+    """
+    Run an XML query at Crossref, to update the Cited-by data for a Publication
+    """
+    CitedByHarvester(max_workers=1).harvest(
+        Publication.objects.filter(doi_label=doi_label)
+    )
@@ -0,0 +1,81 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from common.utils.cache import PageCache
+
+M2M_CHANGED_ACTIONS = ["post_add", "post_remove", "post_clear"]
+
+
+def invalidate_page_cache_of_publication(sender, instance, **kwargs):
+    """
+    When a Publication is saved or deleted, invalidate the cached pages
+    of the Publication, its Issue and its Journal.
+    """
+    PageCache.invalidate(instance, instance.in_issue, instance.get_journal())
+
+
+def invalidate_page_cache_of_publication_related(sender, instance, **kwargs):
+    """
+    When an object displayed on a Publication's page (author, resource, update,
+    fraction, ...) is saved or deleted, invalidate the Publication's cached page.
+    """
+    PageCache.invalidate(instance.publication)
+
+
+def m2m_changed_invalidate_page_cache_of_publication(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    """
+    When the grants, funders or topics of a Publication change, invalidate
+    its cached page (or those of the Publications changed from the other side).
+    """
+    if action not in M2M_CHANGED_ACTIONS:
+        return
+    if reverse:
+        PageCache.invalidate(*model.objects.filter(pk__in=pk_set or []))
+    else:
+        PageCache.invalidate(instance)
+
+
+def m2m_changed_invalidate_page_cache_of_author_affiliations(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    When the affiliations of a Publication's author change, invalidate
+    the Publication's cached page.
+    """
+    from journals.models import Publication
+
+    if action not in M2M_CHANGED_ACTIONS:
+        return
+    if reverse:
+        PageCache.invalidate(
+            *Publication.objects.filter(authors__pk__in=pk_set or []).distinct()
+        )
+    else:
+        PageCache.invalidate(instance.publication)
+
+
+def invalidate_page_cache_of_issue(sender, instance, **kwargs):
+    """
+    When an Issue is saved or deleted, invalidate its cached page and those
+    of its Journal (which link to the neighbouring issues).
+    """
+    PageCache.invalidate(instance, instance.get_journal())
+
+
+def invalidate_page_cache_of_volume(sender, instance, **kwargs):
+    PageCache.invalidate(instance.in_journal)
+
+
+def invalidate_page_cache_of_journal(sender, instance, **kwargs):
+    PageCache.invalidate(instance)
+
+
+def invalidate_page_cache_of_decision_journal(sender, instance, **kwargs):
+    """
+    When an EditorialDecision is saved, invalidate the cached page of its Journal,
+    which lists the accepted Submissions.
+    """
+    PageCache.invalidate(instance.for_journal)
@@ -0,0 +1,155 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import csv
+import datetime
+import json
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from common.helpers.test import create_publication
+from journals.api.viewsets import PublicationPublicAPIViewSet
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.models import Publication
+from journals.factories import JournalFactory
+from ontology.factories import AcademicFieldFactory
+from organizations.factories import OrganizationFactory
+from preprints.models import Preprint
+
+
+class PublicationPublicAPITest(TestCase):
+    url = "/api/publications/"
+
+    @classmethod
+    def setUpTestData(cls):
+        journal = JournalFactory(
+            doi_label="SciPostTest",
+            structure=INDIVIDUAL_PUBLICATIONS,
+            college__acad_field=AcademicFieldFactory(),
+        )
+        cls.organization = OrganizationFactory(name="University of Amsterdam")
+        # Two publications on each date, newest first
+        cls.publications = [
+            create_publication(
+                journal,
+                paper_nr,
+                [[cls.organization], [cls.organization]],
+                datetime.date(2024, 1, 10 - (paper_nr - 1) // 2),
+            )
+            for paper_nr in range(1, 8)
+        ]
+        for publication in cls.publications:
+            # Submission links need versioned preprint identifiers
+            Preprint.objects.filter(submission__publications=publication).update(
+                identifier_w_vn_nr=f"2401.{publication.paper_nr:05d}v1"
+            )
+        cls.publications.sort(key=lambda p: (p.publication_date, p.id), reverse=True)
+
+    def get(self, **params):
+        response = self.client.get(self.url, {"format": "json", **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def doi_labels(self, data):
+        return [result["doi_label"] for result in data["results"]]
+
+    def test_limit_offset_without_count(self):
+        data = self.get(limit=3, offset=3)
+        self.assertEqual(data["count"], 7)
+
+        data = self.get(limit=3, offset=3, count="false")
+        self.assertNotIn("count", data)
+        self.assertEqual(len(data["results"]), 3)
+        self.assertIn("offset=6", data["next"])
+        self.assertIsNone(self.get(limit=3, offset=6, count="false")["next"])
+
+    def test_cursor_pagination(self):
+        doi_labels = []
+        data = self.get(cursor="", limit=3)
+        self.assertNotIn("count", data)
+        self.assertIsNone(data["previous"])
+        while True:
+            doi_labels += self.doi_labels(data)
+            if data["next"] is None:
+                break
+            data = self.client.get(data["next"]).json()
+        self.assertEqual(
+            doi_labels, [publication.doi_label for publication in self.publications]
+        )
+
+    def filtered_queryset(self, **params):
+        view = PublicationPublicAPIViewSet(
+            action="list", action_map={"get": "list"}, format_kwarg=None
+        )
+        view.request = view.initialize_request(
+            APIRequestFactory().get(self.url, params)
+        )
+        return view.filter_queryset(view.get_queryset())
+
+    def test_distinct_only_for_multivalued_filters(self):
+        queryset = self.filtered_queryset(journal__name__icontains="Sci")
+        self.assertFalse(queryset.query.distinct)
+        self.assertEqual(queryset.count(), 7)
+
+        # Each publication has two authors with the same affiliation
+        queryset = self.filtered_queryset(
+            authors__affiliations__name__icontains="Amsterdam"
+        )
+        self.assertTrue(queryset.query.distinct)
+        self.assertEqual(queryset.count(), 7)
+
+    def export(self, **params):
+        response = self.client.get(self.url + "export/", params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode().splitlines()
+
+    def test_export_jsonl(self):
+        # The publications, then a query per related table, for each chunk
+        with self.assertNumQueries(7):
+            lines = self.export(include="authors,affiliations,funders,citations")
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(
+            [row["doi"] for row in rows],
+            [p.doi_string for p in sorted(self.publications, key=lambda p: p.id)],
+        )
+        self.assertEqual(rows[0]["publication_date"], "2024-01-10")
+        self.assertEqual(
+            [author["affiliations"] for author in rows[0]["authors"]],
+            [[self.organization.id], [self.organization.id]],
+        )
+        self.assertEqual(
+            rows[0]["affiliations"],
+            [
+                {
+                    "id": self.organization.id,
+                    "name": "University of Amsterdam",
+                    "country": str(self.organization.country),
+                }
+            ],
+        )
+        self.assertEqual(rows[0]["number_of_citations"], 0)
+        self.assertEqual(rows[0]["funders"], [])
+
+    def test_export_csv(self):
+        rows = list(csv.reader(self.export(export_format="csv", include="funders")))
+        self.assertEqual(len(rows), 8)
+        self.assertEqual(rows[0][0], "doi")
+        self.assertEqual(rows[0][-2:], ["funders", "grants"])
+        self.assertEqual(rows[1][rows[0].index("title")], "Title 1")
+
+    def test_export_modified_since(self):
+        Publication.objects.update(
+            latest_activity=timezone.make_aware(datetime.datetime(2024, 1, 1))
+        )
+        Publication.objects.filter(paper_nr__in=[2, 5]).update(
+            latest_activity=timezone.make_aware(datetime.datetime(2024, 6, 1))
+        )
+        rows = self.export(modified_since="2024-02-01")
+        self.assertEqual(
+            [json.loads(row)["title"] for row in rows], ["Title 2", "Title 5"]
+        )
+        response = self.client.get(self.url + "export/", {"export_format": "xml"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,112 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from common.helpers.test import create_publication
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from journals.models import Citation, Journal
+from ontology.factories import AcademicFieldFactory, SpecialtyFactory
+from submissions.models import Submission
+
+from ..calculated_fields import JournalMetrics
+
+
+def citations(*years):
+    return [{"doi": f"10.1000/{i}", "year": str(year)} for i, year in enumerate(years)]
+
+
+class JournalMetricsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        acad_field = AcademicFieldFactory()
+        cls.journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS, college__acad_field=acad_field
+        )
+        cls.specialties = [SpecialtyFactory(acad_field=acad_field) for _ in range(2)]
+        cls.journal.specialties.set(cls.specialties)
+        year = timezone.now().year
+        cls.years = list(range(year - 4, year))
+        for paper_nr, (pub_year, cited_in, specialties) in enumerate(
+            [
+                (year - 4, [year - 3, year - 2, year - 2, year - 1], [0]),
+                (year - 3, [year - 2, year - 1, year - 1], [0, 1]),
+                (year - 2, [year - 1], [1]),
+                (year - 2, [], [1]),
+                (year - 1, [year - 1, year], []),
+            ],
+            start=1,
+        ):
+            publication = create_publication(
+                cls.journal, paper_nr, [], datetime.date(pub_year, 6, 1)
+            )
+            publication.specialties.add(*[cls.specialties[i] for i in specialties])
+            publication.citedby = citations(*cited_in) + [{"doi": "10.1000/undated"}]
+            publication.latest_citedby_update = timezone.now()
+            publication.save()
+            Citation.sync([publication])
+            Submission.objects.filter(id=publication.accepted_submission_id).update(
+                submission_date=timezone.make_aware(
+                    datetime.datetime(pub_year - 1, 12, 1)
+                )
+            )
+            publication.accepted_submission.specialties.add(
+                *[cls.specialties[i] for i in specialties]
+            )
+
+    def test_update(self):
+        with self.assertNumQueries(10):
+            self.assertEqual(JournalMetrics().update(), 1)
+
+        metrics = Journal.objects.get(id=self.journal.id).cf_metrics
+        slugs = [specialty.slug for specialty in self.specialties]
+        self.assertEqual(metrics["nr_publications"]["years"], self.years)
+        self.assertEqual(
+            metrics["nr_publications"]["nr_publications"],
+            {"all": [1, 1, 2, 1], slugs[0]: [1, 1, 0, 0], slugs[1]: [0, 1, 2, 0]},
+        )
+        self.assertEqual(
+            metrics["nr_submissions"]["nr_submissions"],
+            {"all": [1, 2, 1, 0], slugs[0]: [1, 0, 0, 0], slugs[1]: [1, 2, 0, 0]},
+        )
+
+        # Same values as the per-year (and per-specialty) computations
+        for specialty, label in [(None, "all"), *zip(self.specialties, slugs)]:
+            self.assertEqual(
+                metrics["nr_citations"]["nr_citations"][label],
+                [self.journal.nr_citations(year, specialty) for year in self.years],
+            )
+            self.assertEqual(
+                metrics["citedby_citescore"]["citedby_citescore"][label],
+                [
+                    self.journal.citedby_citescore(year, specialty)
+                    for year in self.years
+                ],
+            )
+            self.assertEqual(
+                metrics["citedby_impact_factor"]["citedby_impact_factor"][label],
+                [
+                    self.journal.citedby_impact_factor(year, specialty)
+                    for year in self.years
+                ],
+            )
+        self.assertEqual(
+            metrics["citedby_impact_factor"]["citedby_impact_factor"]["all"],
+            [0, 1, 1.5, 1],
+        )
+
+    def test_citation_rate(self):
+        publications = self.journal.get_publications()
+        # Same value as from the citedby data
+        ncites = 0
+        deltat = 1
+        for pub in publications:
+            if pub.citedby and pub.latest_citedby_update:
+                ncites += len(pub.citedby)
+                deltat += (pub.latest_citedby_update.date() - pub.publication_date).days
+        self.assertEqual(ncites, 15)
+        self.assertEqual(self.journal.citation_rate(), ncites * 365.25 / deltat)
@@ -0,0 +1,100 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.test import TestCase
+from django.urls import reverse
+
+from common.helpers.test import create_publication
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from journals.models import Publication
+from ontology.factories import AcademicFieldFactory
+
+
+class PublicationSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS,
+            college__acad_field=AcademicFieldFactory(),
+        )
+        date = datetime.date(2024, 1, 1)
+        cls.topological = cls.create(
+            1,
+            title="Topological phases of interacting fermions",
+            author_list="J.-S. Caux, A. Smith",
+            abstract="We study a chain of fermions.",
+            date=date,
+        )
+        cls.mentions_topology = cls.create(
+            2,
+            title="Spin chains out of equilibrium",
+            author_list="B. Jones",
+            abstract="Contrary to topological systems, these chains thermalize.",
+            date=date,
+        )
+        cls.unrelated = cls.create(
+            3,
+            title="Hydrodynamics of integrable systems",
+            author_list="C. Sébastien",
+            abstract="Generalized hydrodynamics describes the large scale dynamics.",
+            date=date,
+        )
+
+    @classmethod
+    def create(cls, paper_nr, date, **fields):
+        publication = create_publication(cls.journal, paper_nr, [], date)
+        Publication.objects.filter(id=publication.id).update(
+            doi_label=f"SciPostPhys.{paper_nr}", **fields
+        )
+        return Publication.objects.get(id=publication.id)
+
+    def test_search_is_ranked(self):
+        self.assertEqual(
+            list(Publication.objects.search("topological")),
+            [self.topological, self.mentions_topology],
+        )
+        self.assertEqual(
+            list(Publication.objects.search("thermalizing chain")),
+            [self.mentions_topology],
+        )
+
+    def test_search_restricted_to_fields(self):
+        self.assertEqual(
+            list(Publication.objects.search("topological", fields=["title"])),
+            [self.topological],
+        )
+        self.assertEqual(
+            list(Publication.objects.search("Smith", fields=["author_list"])),
+            [self.topological],
+        )
+        # Matching in the second of the fields only
+        self.assertEqual(
+            list(
+                Publication.objects.search("thermalize", fields=["title", "abstract"])
+            ),
+            [self.mentions_topology],
+        )
+
+    def test_search_is_unaccented(self):
+        self.assertEqual(
+            list(Publication.objects.search("Sebastien")), [self.unrelated]
+        )
+
+    def test_search_falls_back_to_trigrams(self):
+        self.assertEqual(
+            list(Publication.objects.search("hydrodynamcs", fields=["title"])),
+            [self.unrelated],
+        )
+
+    def test_search_api(self):
+        response = self.client.get(
+            reverse("api:search_publications-list"),
+            {"search": "topological", "format": "json"},
+        )
+        self.assertEqual(
+            [result["doi_label"] for result in response.json()["results"]],
+            [self.topological.doi_label, self.mentions_topology.doi_label],
+        )
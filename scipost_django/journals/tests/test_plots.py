@@ -0,0 +1,47 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from journals.models import Journal
+
+from ..plots import get_metrics_plots
+
+
+class MetricsPlotsTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.journal = Journal(
+            cf_metrics={
+                "nr_publications": {
+                    "years": [2023, 2024],
+                    "nr_publications": {"all": [3, 5], "physics": [0, 0]},
+                },
+                "nr_submissions": {
+                    "years": [2023, 2024],
+                    "nr_submissions": {"all": [8, 9]},
+                },
+            }
+        )
+
+    def test_plots_are_cached(self):
+        plots = get_metrics_plots(self.journal)
+        self.assertCountEqual(plots, ["nr_publications_plot", "nr_submissions_plot"])
+        self.assertIn('<svg class="w-100 h-auto" ', plots["nr_publications_plot"])
+
+        with mock.patch(
+            "journals.plots.render_bar_plot", return_value="<svg>"
+        ) as render:
+            self.assertEqual(get_metrics_plots(self.journal), plots)
+            render.assert_not_called()
+
+            # Changed metrics are plotted anew
+            self.journal.cf_metrics["nr_submissions"]["nr_submissions"]["all"] = [8, 10]
+            get_metrics_plots(self.journal)
+            render.assert_called_once_with([2023, 2024], [8, 10], "Submissions")
+
+    def test_empty_metrics_are_not_plotted(self):
+        self.assertEqual(get_metrics_plots(self.journal, "physics"), {})
@@ -0,0 +1,151 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from common.helpers.test import create_publication, stub_http_server
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from journals.models import Citation, Publication
+from ontology.factories import AcademicFieldFactory
+
+from ..services import CitedByHarvester, parse_citedby_response
+
+FORWARD_LINK = """
+<forward_link doi="{cited}">
+  <journal_cite>
+    <issn>2542-4653</issn>
+    <article_title>Citing article {citing}</article_title>
+    <contributors>
+      <contributor sequence="first" contributor_role="author">
+        <given_name>A.</given_name>
+        <surname>Uthor</surname>
+      </contributor>
+      <contributor sequence="additional" contributor_role="author">
+        <given_name>B.</given_name>
+        <surname>Other</surname>
+      </contributor>
+    </contributors>
+    <volume>1</volume>
+    <year>2024</year>
+    <doi type="journal_article">10.1000/{citing}</doi>
+  </journal_cite>
+</forward_link>
+"""
+
+
+def forward_links_response(doi, nr_citations):
+    links = "".join(
+        FORWARD_LINK.format(cited=doi, citing=i) for i in range(nr_citations)
+    )
+    return (
+        '<crossref_result xmlns="http://www.crossref.org/qrschema/2.0">'
+        f"<query_result><body>{links}</body></query_result></crossref_result>"
+    )
+
+
+def queried_doi(path):
+    return parse_qs(urlparse(path).query)["doi"][0]
+
+
+class CitedByHarvesterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS,
+            college__acad_field=AcademicFieldFactory(),
+        )
+        today = timezone.now().date()
+        cls.stale = create_publication(
+            journal, 1, [], today - datetime.timedelta(days=1000)
+        )
+        cls.never_harvested = create_publication(
+            journal, 2, [], today - datetime.timedelta(days=500)
+        )
+        cls.recent = create_publication(journal, 3, [], today)
+        cls.last_year = timezone.now() - datetime.timedelta(days=365)
+        cls.citations = parse_citedby_response(
+            forward_links_response(cls.stale.doi_string, 2)
+        )
+        Publication.objects.filter(id=cls.stale.id).update(
+            citedby=cls.citations,
+            number_of_citations=2,
+            latest_citedby_update=cls.last_year,
+        )
+        Publication.objects.filter(id=cls.recent.id).update(
+            latest_citedby_update=cls.last_year
+        )
+
+    def harvest(self, respond, **kwargs):
+        with stub_http_server(respond) as server:
+            with override_settings(CROSSREF_FORWARD_LINKS_URL=server.url):
+                harvester = CitedByHarvester(**kwargs)
+                harvester.harvest(Publication.objects.all())
+        return harvester, [queried_doi(path) for method, path in server.requests]
+
+    def test_parse_citedby_response(self):
+        self.assertEqual(len(self.citations), 2)
+        self.assertEqual(self.citations[0]["doi"], "10.1000/0")
+        self.assertEqual(self.citations[0]["first_author_surname"], "Uthor")
+        self.assertTrue(self.citations[0]["multiauthors"])
+        self.assertIsNone(parse_citedby_response("Internal error"))
+
+    def test_harvest(self):
+        harvester, queried = self.harvest(
+            lambda method, path: (200, forward_links_response(queried_doi(path), 2)),
+            max_workers=1,
+            max_requests_per_second=None,
+        )
+        # Recent first, then by staleness
+        self.assertEqual(
+            queried,
+            [
+                self.recent.doi_string,
+                self.never_harvested.doi_string,
+                self.stale.doi_string,
+            ],
+        )
+        self.assertEqual(harvester.nr_updated, 2)
+        self.assertEqual(harvester.nr_unchanged, 1)
+        for publication in Publication.objects.all():
+            self.assertEqual(publication.number_of_citations, 2)
+            self.assertEqual(publication.citedby, self.citations)
+            self.assertGreater(publication.latest_citedby_update, self.last_year)
+        # The Citations of the changed Publications are synced
+        self.assertEqual(
+            list(
+                Citation.objects.filter(publication=self.recent)
+                .values_list("doi", "year")
+                .order_by("doi")
+            ),
+            [("10.1000/0", 2024), ("10.1000/1", 2024)],
+        )
+        self.assertFalse(Citation.objects.filter(publication=self.stale).exists())
+
+    def test_harvest_retries(self):
+        failed = set()
+
+        def respond(method, path):
+            doi = queried_doi(path)
+            if doi not in failed:
+                failed.add(doi)
+                return 503, "Service unavailable"
+            return 200, forward_links_response(doi, 1)
+
+        harvester, queried = self.harvest(respond, max_workers=3)
+        self.assertEqual(len(queried), 6)
+        self.assertEqual(harvester.nr_updated, 3)
+        self.assertEqual(harvester.nr_failed, 0)
+
+    def test_harvest_invalid_credentials(self):
+        harvester, queried = self.harvest(
+            lambda method, path: (401, "Unauthorized"), max_workers=1
+        )
+        self.assertEqual(len(queried), 1)
+        self.assertEqual(harvester.nr_updated, 0)
+        self.stale.refresh_from_db()
+        self.assertEqual(self.stale.latest_citedby_update, self.last_year)
@@ -0,0 +1,72 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import TestCase
+
+from common.helpers.test import create_publication
+from common.utils.cache import PageCache
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from ontology.factories import AcademicFieldFactory
+from organizations.factories import OrganizationFactory
+
+TEMPLATE = Template(
+    "{% load common_extras %}"
+    '{% pagecache page_cache "content" %}{{ publication.title }}{% endpagecache %}'
+)
+
+
+class PageCacheInvalidationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS,
+            college__acad_field=AcademicFieldFactory(),
+        )
+        cls.publication = create_publication(
+            cls.journal, 1, [[]], datetime.date(2024, 1, 1)
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def page_cache(self):
+        return PageCache("publication_detail", self.publication, self.journal)
+
+    def render(self, page_cache):
+        return TEMPLATE.render(
+            Context({"page_cache": page_cache, "publication": self.publication})
+        )
+
+    def test_fragments_are_cached(self):
+        page_cache = self.page_cache()
+        self.assertFalse(page_cache.hit)
+        self.assertEqual(self.render(page_cache), self.publication.title)
+
+        self.publication.title = "Not saved"
+        page_cache = self.page_cache()
+        self.assertTrue(page_cache.hit)
+        self.assertEqual(self.render(page_cache), "Title 1")
+        # Rendered directly without a PageCache
+        self.assertEqual(self.render(None), "Not saved")
+
+    def test_changes_invalidate_the_cache(self):
+        self.render(self.page_cache())
+        journal_page_cache = PageCache("journal_detail", self.journal)
+        journal_page_cache.set("content", "Journal")
+
+        self.publication.save()
+        self.assertFalse(self.page_cache().hit)
+        self.assertFalse(PageCache("journal_detail", self.journal).hit)
+
+        self.render(self.page_cache())
+        self.publication.authors.get().affiliations.add(OrganizationFactory())
+        self.assertFalse(self.page_cache().hit)
+
+        self.render(self.page_cache())
+        self.journal.save()
+        self.assertFalse(self.page_cache().hit)
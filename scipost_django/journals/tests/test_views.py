@@ -0,0 +1,85 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from common.helpers.test import create_publication
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from ontology.factories import AcademicFieldFactory
+
+PDF_CONTENT = b"%PDF-1.4 " + bytes(range(256)) * 400
+
+
+class PublicationPdfTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.media_root = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.media_root.cleanup)
+        cls.enterClassContext(override_settings(MEDIA_ROOT=cls.media_root.name))
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        journal = JournalFactory(
+            doi_label="SciPostTest",
+            structure=INDIVIDUAL_PUBLICATIONS,
+            college__acad_field=AcademicFieldFactory(),
+        )
+        cls.publication = create_publication(journal, 1, [], datetime.date(2024, 1, 1))
+        cls.publication.pdf_file.save("test.pdf", ContentFile(PDF_CONTENT))
+        cls.url = reverse("scipost:publication_pdf", args=(cls.publication.doi_label,))
+
+    def test_streams_pdf(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b"".join(response.streaming_content), PDF_CONTENT)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Content-Length"], str(len(PDF_CONTENT)))
+        self.assertEqual(
+            response["Content-Disposition"], 'inline; filename="SciPostTest_1.pdf"'
+        )
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_conditional_requests(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_range_requests(self):
+        response = self.client.get(self.url, headers={"Range": "bytes=100-199"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), PDF_CONTENT[100:200])
+        self.assertEqual(response["Content-Range"], f"bytes 100-199/{len(PDF_CONTENT)}")
+
+        response = self.client.get(self.url, headers={"Range": "bytes=-10"})
+        self.assertEqual(b"".join(response.streaming_content), PDF_CONTENT[-10:])
+
+        response = self.client.get(
+            self.url, headers={"Range": f"bytes={len(PDF_CONTENT)}-"}
+        )
+        self.assertEqual(response.status_code, 416)
+
+        # Stale ranges are ignored
+        response = self.client.get(
+            self.url, headers={"Range": "bytes=100-199", "If-Range": '"stale"'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_accel_redirect(self):
+        with self.settings(
+            FILE_SERVING_ACCEL_REDIRECT={self.media_root.name: "/protected/media/"}
+        ):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            "/protected/media/" + self.publication.pdf_file.name,
+        )
@@ -13,8 +13,6 @@ import shutil
 from typing import Any, Dict
 import requests
 
-import matplotlib
-
 from ethics.mixins import GenAIFormViewInjectorMixin
 from mails.utils import DirectMailUtil
 from ethics.forms import GenAIDisclosureForm
@@ -24,10 +22,6 @@ from proceedings.models import Proceedings
 from profiles.models import Profile
 from submissions.models.decision import EditorialDecision
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import io, base64
-
 from django.contrib.auth.decorators import login_required
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
@@ -104,10 +98,13 @@ from .forms import (
     PublicationDynSelForm,
 )
 from .mixins import PublicationMixin, ProdSupervisorPublicationPermissionMixin
+from .plots import get_metrics_plots
 from .services import update_citedby
 
 from comments.models import Comment
 from common.utils import get_current_domain
+from common.utils.cache import PageCache
+from common.utils.files import serve_file
 from common.views import HTMXInlineCRUDModelFormView, HTMXInlineCRUDModelListView
 from finances.models import PubFrac
 from funders.forms import FunderSelectForm, GrantSelectForm
@@ -322,7 +319,11 @@ def journal_detail(request, doi_label):
     if not (journal.active or request.user.is_staff):
         raise PermissionDenied("Journal is not active")
 
-    prefetch_related_objects([journal], "contained_series")
+    page_cache = None
+    if not request.user.is_authenticated:
+        page_cache = PageCache("journal_detail", journal)
+    if page_cache is None or not page_cache.hit:
+        prefetch_related_objects([journal], "contained_series")
 
     accepted_submissions = (
         (
@@ -359,6 +360,7 @@ def journal_detail(request, doi_label):
         "most_cited": most_cited,
         "latest_publications": latest_publications,
         "accepted_submissions": accepted_submissions,
+        "page_cache": page_cache,
     }
     return render(request, "journals/journal_detail.html", context)
 
@@ -523,20 +525,6 @@ def about(request, doi_label):
     return render(request, "journals/about.html", context)
 
 
-def provide_plot(x, y, name, nonce=None):
-    fig, ax = plt.subplots(figsize=(5, 3))
-    ax.bar(x, y)
-    ax.set_title(name)
-
-    plot_svg = io.StringIO()
-    fig.savefig(plot_svg, format="svg")
-    plot_svg = plot_svg.getvalue()
-    # Manipulate the SVG to make it display properly in the browser
-    # Add the classes `w-100` and `h-100` to make the SVG responsive
-    plot_svg = plot_svg.replace("<svg ", '<svg class="w-100 h-auto" ')
-    return plot_svg
-
-
 def metrics(request, doi_label, specialty=None):
     journal = get_object_or_404(Journal, doi_label=doi_label)
     # Guard against inactive journals
@@ -549,27 +537,7 @@ def metrics(request, doi_label, specialty=None):
     subset_key = "all"
     if specialty:
         subset_key = specialty.slug
-
-    plot_keys = {
-        "nr_publications": "Publications",
-        "nr_submissions": "Submissions",
-        "nr_citations": "Total Citations",
-        "citedby_citescore": "CiteScore",
-        "citedby_impact_factor": "Impact Factor",
-    }
-    for plot_key in plot_keys:
-        if (
-            (key_metrics := journal.cf_metrics.get(plot_key))
-            and (years := key_metrics.get("years", []))
-            and (values := key_metrics.get(plot_key, {}).get(subset_key))
-            and not all(v == 0 for v in values)
-        ):
-            context[f"{plot_key}_plot"] = provide_plot(
-                x=years,
-                y=values,
-                name=plot_keys[plot_key],
-                nonce=request.csp_nonce,
-            )
+    context.update(get_metrics_plots(journal, subset_key))
     return render(request, "journals/metrics.html", context)
 
 
@@ -578,6 +546,16 @@ def issue_detail(request, doi_label):
     issue = get_object_or_404(Issue.objects.open_or_published(), doi_label=doi_label)
     journal = issue.in_journal or issue.in_volume.in_journal
 
+    context = {
+        "issue": issue,
+        "journal": journal,
+        "page_cache": None,
+    }
+    if not request.user.is_authenticated:
+        context["page_cache"] = PageCache("issue_detail", issue, journal)
+        if context["page_cache"].hit:
+            return render(request, "journals/journal_issue_detail.html", context)
+
     papers = issue.publications.published().order_by("paper_nr")
     next_issue = (
         Issue.objects.published()
@@ -598,13 +576,13 @@ def issue_detail(request, doi_label):
         .last()
     )
 
-    context = {
-        "issue": issue,
-        "prev_issue": prev_issue,
-        "next_issue": next_issue,
-        "papers": papers,
-        "journal": journal,
-    }
+    context.update(
+        {
+            "prev_issue": prev_issue,
+            "next_issue": next_issue,
+            "papers": papers,
+        }
+    )
     return render(request, "journals/journal_issue_detail.html", context)
 
 
@@ -2377,6 +2355,23 @@ def publication_detail(request, doi_label):
     ):
         raise Http404("Publication is not publicly visible")
 
+    journal = publication.get_journal()
+    context = {
+        "publication": publication,
+        "journal": journal,
+        "page_cache": None,
+    }
+    if not request.user.is_authenticated:
+        # The head meta tags link to the pdf on the requested host
+        context["page_cache"] = PageCache(
+            f"publication_detail:{request.get_host()}",
+            publication,
+            journal,
+            fragments=("headsup", "content"),
+        )
+        if context["page_cache"].hit:
+            return render(request, "journals/publication_detail.html", context)
+
     publication.funders = list(
         publication.get_all_funders().select_related("organization")
     )
@@ -2392,13 +2387,13 @@ def publication_detail(request, doi_label):
         ),
     )
 
-    context = {
-        "publication": publication,
-        "affiliation_indices": publication.get_author_affiliation_indices_list(),
-        "affiliations_list": publication.get_all_affiliations(),
-        "journal": publication.get_journal(),
-        "select_topic_form": SelectTopicForm(),
-    }
+    context.update(
+        {
+            "affiliation_indices": publication.get_author_affiliation_indices_list(),
+            "affiliations_list": publication.get_all_affiliations(),
+            "select_topic_form": SelectTopicForm(),
+        }
+    )
     return render(request, "journals/publication_detail.html", context)
 
 
@@ -2414,11 +2409,12 @@ def publication_detail_pdf(request, doi_label):
         raise Http404("Publication is not publicly visible")
     if not publication.pdf_file:
         raise Http404("Publication has no associated pdf document")
-    response = HttpResponse(publication.pdf_file.read(), content_type="application/pdf")
-    response["Content-Disposition"] = (
-        "filename=" + publication.doi_label.replace(".", "_") + ".pdf"
+    return serve_file(
+        request,
+        publication.pdf_file,
+        content_type="application/pdf",
+        filename=publication.doi_label.replace(".", "_") + ".pdf",
     )
-    return response
 
 
 def publication_update_detail(request, doi_label, update_nr):
@@ -2,6 +2,7 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 from email.utils import make_msgid
+from functools import lru_cache
 from itertools import chain
 from html2text import HTML2Text
 import os
@@ -18,7 +19,43 @@ from common.utils.models import model_eval_attr
 
 from .exceptions import ConfigurationError
 
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
+
+
+class MailFileCache:
+    """
+    Process-wide cache of the compiled templates of the mail files,
+    keyed by path and invalidated when the file's modification time changes.
+    """
+
+    def __init__(self):
+        self.entries: dict[str, tuple[int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str, compile: Callable[[str], Any] = Template) -> Any:
+        mtime = os.stat(path).st_mtime_ns
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        with open(path, "r") as f:
+            compiled = compile(f.read())
+        self.entries[path] = (mtime, compiled)
+        return compiled
+
+    def clear(self):
+        self.entries.clear()
+
+
+mail_file_cache = MailFileCache()
+
+
+@lru_cache(maxsize=512)
+def compile_template(source: str) -> Template:
+    """Compile a template string, reusing the compiled versions of recent ones."""
+    return Template(source)
 
 
 class MailEngine:
@@ -120,7 +157,7 @@ class MailEngine:
         Returns a tuple of (message, html_message).
         """
         if isinstance(template, str):
-            template = Template(template)
+            template = compile_template(template)
 
         # Render HTML and plain text version of the mail.
         html_message = template.render(context or self.context)
@@ -130,7 +167,7 @@ class MailEngine:
 
     def render_subject(self, subject: str, context: Context | None = None) -> str:
         """Render the subject str of the mail as if it were a template."""
-        return Template(subject).render(context or self.context)
+        return compile_template(subject).render(context or self.context)
 
     def send_mail(self):
         """Send the mail."""
@@ -260,12 +297,13 @@ class MailEngine:
     def load_mail_config(
         mail_path: str, context: dict[str, Any] | Context | None = None
     ) -> dict[str, Any]:
+        template = MailEngine.load_mail_config_template(mail_path)
+        return json.loads(template.render(context) if context else template.source)
+
+    @staticmethod
+    def load_mail_config_template(mail_path: str) -> Template:
         try:
-            with open(mail_path, "r") as f:
-                config = f.read()
-                if context:
-                    config = Template(config).render(context)
-                return json.loads(config)
+            return mail_file_cache.get(mail_path)
         except OSError:
             raise ImportError(
                 f"Configuration file is malformed. Mail path: {mail_path}"
@@ -274,8 +312,7 @@ class MailEngine:
     @staticmethod
     def load_mail_template(mail_path: str) -> Template:
         try:
-            with open(mail_path, "r") as f:
-                return Template(f.read())
+            return mail_file_cache.get(mail_path)
         except OSError:
             raise ImportError(f"Template file is malformed. Mail path: {mail_path}")
 
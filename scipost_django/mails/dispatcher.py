@@ -0,0 +1,230 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from common.utils.http import RateLimiter
+
+from .core import MailEngine
+from .models import MAIL_NOT_RENDERED, MAIL_RENDERED, MAIL_SENT, MailLog
+
+logger = logging.getLogger(__name__)
+
+
+def get_sending_connection():
+    """
+    Return a connection to the backend actually sending the mails,
+    i.e. not the ModelEmailBackend writing them to the MailLog table.
+    """
+    # Fallback to Django's default
+    backend = getattr(
+        settings,
+        "EMAIL_BACKEND_ORIGINAL",
+        "django.core.mail.backends.smtp.EmailBackend",
+    )
+    if backend == "mails.backends.filebased.ModelEmailBackend":
+        raise AssertionError(
+            "The `EMAIL_BACKEND_ORIGINAL` cannot be the ModelEmailBackend"
+        )
+    return get_connection(backend=backend, fail_silently=False)
+
+
+class MailDispatcher:
+    """
+    Render and send the MailLogs waiting in the database.
+
+    Batches of MailLogs are claimed with `SELECT ... FOR UPDATE SKIP LOCKED`,
+    so that several dispatchers can run in parallel without sending a mail twice.
+    The messages of a batch are sent over a single persistent connection in chunks,
+    within a rate limit (in messages per second), and the progress of the batch
+    (rendering, status, `sent_to`) is saved with a single bulk update.
+
+    A batch contains at most `batch_size` messages: bulk MailLogs with more
+    remaining recipients are continued in the next batches.
+    """
+
+    UPDATED_FIELDS = [
+        "body",
+        "body_html",
+        "subject",
+        "status",
+        "processed",
+        "sent_to",
+        "latest_activity",
+    ]
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        max_rate: float | None = None,
+        chunk_size: int = 20,
+        connection=None,
+    ):
+        self.batch_size = batch_size or settings.MAIL_DISPATCH_BATCH_SIZE
+        self.chunk_size = chunk_size
+        self.rate_limiter = RateLimiter(max_rate or settings.MAIL_DISPATCH_MAX_RATE)
+        self.connection = connection or get_sending_connection()
+        self.nr_sent = 0
+
+    def render(self, mail_log: MailLog) -> None:
+        """Render the templates of the mail (in place)."""
+        engine = MailEngine(mail_log.mail_code, **mail_log.get_full_context())
+        engine.process(render_template=True)
+        mail_log.body = engine.mail_config.get("message", "")
+        mail_log.body_html = engine.mail_config.get("html_message", "")
+        mail_log.subject = engine.mail_config.get("subject", "")
+        mail_log.status = MAIL_RENDERED
+
+    def build_message(
+        self, mail_log: MailLog, recipients: list[str]
+    ) -> EmailMultiAlternatives:
+        headers: dict[str, str] = {}
+        # Add Message-ID header if available to help with identifying emails
+        # after being sent and reported on through MailGun
+        if mail_log.message_id:
+            headers["Message-ID"] = mail_log.message_id
+
+        message = EmailMultiAlternatives(
+            mail_log.subject,
+            mail_log.body,
+            mail_log.from_email,
+            recipients,
+            connection=self.connection,
+            cc=mail_log.cc_recipients,
+            bcc=mail_log.bcc_recipients,
+            reply_to=(mail_log.from_email,),
+            headers=headers,
+        )
+        # Attach the HTML version *ONLY* if one exists
+        # If attached while empty, it will cause the mail to be treated as if were
+        if mail_log.body_html:
+            message.attach_alternative(mail_log.body_html, "text/html")
+        return message
+
+    def prepare(self, mail_logs: list[MailLog]):
+        """
+        Return the (MailLog, recipients) of the messages to send for the MailLogs,
+        up to the batch size. MailLogs without anything left to send are marked sent.
+        """
+        deliveries = []
+        for mail_log in mail_logs:
+            budget = self.batch_size - len(deliveries)
+            if budget <= 0:
+                break
+            if mail_log.status == MAIL_NOT_RENDERED:
+                try:
+                    self.render(mail_log)
+                except Exception:
+                    logger.exception("Rendering MailLog %s failed", mail_log.id)
+                    continue
+
+            if mail_log.type == MailLog.TYPE_SINGLE:
+                deliveries.append((mail_log, mail_log.to_recipients))
+            elif mail_log.type == MailLog.TYPE_BULK:
+                if mail_log.to_recipients is None:
+                    logger.info("MailLog %s has no recipients. Skipping.", mail_log.id)
+                    continue
+                sent_to = set(mail_log.sent_to or [])
+                remaining_recipients = [
+                    recipient
+                    for recipient in mail_log.to_recipients
+                    if recipient not in sent_to
+                ]
+                if not remaining_recipients:
+                    mail_log.status = MAIL_SENT
+                    mail_log.processed = True
+                deliveries += [
+                    (mail_log, [recipient])
+                    for recipient in remaining_recipients[:budget]
+                ]
+        return deliveries
+
+    def send(self, deliveries) -> list:
+        """
+        Send the messages in chunks over the connection, returning the deliveries
+        which were sent. Sending stops at the first failing chunk.
+        """
+        sent = []
+        for start in range(0, len(deliveries), self.chunk_size):
+            chunk = deliveries[start : start + self.chunk_size]
+            for _ in chunk:
+                self.rate_limiter.acquire()
+            try:
+                nr_sent = self.connection.send_messages(
+                    [self.build_message(*delivery) for delivery in chunk]
+                )
+            except Exception:
+                logger.exception("Sending a chunk of %s mails failed", len(chunk))
+                break
+            if nr_sent != len(chunk):
+                break
+            sent += chunk
+        return sent
+
+    def dispatch_batch(self, mail_logs) -> int:
+        """
+        Claim, render and send a batch of the given MailLogs.
+        Return the number of claimed MailLogs which progressed (sent to anyone).
+        """
+        with transaction.atomic():
+            claimed = list(
+                mail_logs.select_for_update(skip_locked=True).order_by("created")[
+                    : self.batch_size
+                ]
+            )
+            deliveries = self.prepare(claimed)
+            sent = self.send(deliveries)
+
+            for mail_log, recipients in sent:
+                if mail_log.type == MailLog.TYPE_SINGLE:
+                    mail_log.status = MAIL_SENT
+                    mail_log.processed = True
+                else:
+                    mail_log.sent_to = (mail_log.sent_to or []) + recipients
+                    if set(mail_log.to_recipients) <= set(mail_log.sent_to):
+                        mail_log.status = MAIL_SENT
+                        mail_log.processed = True
+            progressed = {mail_log.id for mail_log, _ in sent} | {
+                mail_log.id for mail_log in claimed if mail_log.status == MAIL_SENT
+            }
+            now = timezone.now()
+            for mail_log in claimed:
+                mail_log.latest_activity = now
+            MailLog.objects.bulk_update(claimed, self.UPDATED_FIELDS)
+        self.nr_sent += len(sent)
+        return len(progressed)
+
+    def dispatch(
+        self,
+        mail_logs=None,
+        loop: bool = False,
+        interval: float = 10,
+        max_batches: int | None = None,
+    ) -> int:
+        """
+        Send the given (by default: all unsent) MailLogs batch by batch, until no
+        progress is made (or forever if `loop`, polling every `interval` seconds),
+        or until `max_batches` batches were dispatched.
+        Return the number of messages sent.
+        """
+        if mail_logs is None:
+            mail_logs = MailLog.objects.not_sent().with_recipients()
+        self.connection.open()
+        try:
+            nr_batches = 0
+            while max_batches is None or nr_batches < max_batches:
+                nr_batches += 1
+                if not self.dispatch_batch(mail_logs):
+                    if not loop:
+                        break
+                    time.sleep(interval)
+        finally:
+            self.connection.close()
+        return self.nr_sent
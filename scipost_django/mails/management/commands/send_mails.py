@@ -1,29 +1,14 @@
-from typing import Iterable
-
-from django.core.mail import get_connection
 from django.core.management.base import BaseCommand
-from django.conf import settings
 
-from ...core import MailEngine
+from ...dispatcher import MailDispatcher
 from ...models import MailLog
 
-BULK_EMAIL_THROTTLE = getattr(settings, "BULK_EMAIL_THROTTLE", 5)
-
-if hasattr(settings, "EMAIL_BACKEND_ORIGINAL"):
-    backend = settings.EMAIL_BACKEND_ORIGINAL
-else:
-    # Fallback to Django's default
-    backend = "django.core.mail.backends.smtp.EmailBackend"
-
-if backend == "mails.backends.filebased.ModelEmailBackend":
-    raise AssertionError("The `EMAIL_BACKEND_ORIGINAL` cannot be the ModelEmailBackend")
-
-connection = get_connection(backend=backend, fail_silently=False)
-
 
 class Command(BaseCommand):
     """
     This sends the mails that are not processed, written to the database.
+
+    Several instances can run in parallel: each claims its own batches of mails.
     """
 
     def add_arguments(self, parser):
@@ -33,120 +18,40 @@ class Command(BaseCommand):
             required=False,
             help="The id in the `MailLog` table for a specific mail, Leave blank to send all",
         )
-
-    def _render_mail(self, mail: MailLog):
-        """
-        Render the templates for the mail if not done yet.
-        """
-        engine = MailEngine(mail.mail_code, **mail.get_full_context())
-        engine.process(render_template=True)
-
-        MailLog.objects.filter(pk=mail.pk).update(
-            body=engine.mail_config.get("message", ""),
-            body_html=engine.mail_config.get("html_message", ""),
-            subject=engine.mail_config.get("subject", ""),
-            status="rendered",
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            required=False,
+            help="The maximal number of mails sent per batch",
         )
-
-    def _send_mail(self, connection, mail_log: "MailLog", recipients, **kwargs):
-        """
-        Build and send the mail, returning the response.
-        """
-        from django.core.mail import EmailMultiAlternatives
-
-        headers: dict[str, str] = {}
-        # Add Message-ID header if available to help with identifying emails
-        # after being sent and reported on through MailGun
-        if mail_log.message_id:
-            headers["Message-ID"] = mail_log.message_id
-
-        mail = EmailMultiAlternatives(
-            mail_log.subject,
-            mail_log.body,
-            mail_log.from_email,
-            recipients,
-            connection=connection,
-            cc=mail_log.cc_recipients,
-            bcc=mail_log.bcc_recipients,
-            reply_to=(mail_log.from_email,),
-            headers=headers,
-            **kwargs,
+        parser.add_argument(
+            "--max_rate",
+            type=float,
+            required=False,
+            help="The maximal number of mails sent per second",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, waiting for new mails when all are sent",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=10,
+            help="The number of seconds to wait for new mails (with --loop)",
         )
-        # Attach the HTML version *ONLY* if one exists
-        # If attached while empty, it will cause the mail to be treated as if were
-        if mail_log.body_html:
-            mail.attach_alternative(mail_log.body_html, "text/html")
-        response = mail.send()
-        return response
-
-    def process_mail_logs(self, mail_logs: "Iterable[MailLog]"):
-        """
-        Process the MailLogs according to their type and send the mails.
-        """
-        count = 0
-        for mail_log in mail_logs:
-            if mail_log.status == "not_rendered":
-                self._render_mail(mail_log)
-                mail_log.refresh_from_db()
-
-            # If single entry per mail, send regularly
-            if mail_log.type == mail_log.TYPE_SINGLE:
-                response = self._send_mail(
-                    connection,
-                    mail_log,
-                    mail_log.to_recipients,
-                )
-
-                if response:
-                    count += 1
-                    mail_log.status = "sent"
-                    mail_log.processed = True
-
-            # If bulk, build separate instances of the mail
-            # for each recipient up to the throttle limit per run
-            elif mail_log.type == mail_log.TYPE_BULK:
-                if mail_log.sent_to is None:
-                    mail_log.sent_to = []
-                if mail_log.to_recipients is None:
-                    self.stdout.write(
-                        "MailLog {} has no recipients. Skipping.".format(mail_log.id)
-                    )
-                    continue
-
-                remaining_recipients = [
-                    recipient
-                    for recipient in mail_log.to_recipients
-                    if recipient not in mail_log.sent_to
-                ]
-
-                # Guard against empty recipients, updating the status
-                if not remaining_recipients:
-                    mail_log.status = "sent"
-                    mail_log.processed = True
-                    mail_log.save()
-                    continue
-
-                # For each recipient not yet sent to and up to the throttle limit
-                for recipient in remaining_recipients[:BULK_EMAIL_THROTTLE]:
-                    response = self._send_mail(connection, mail_log, [recipient])
-
-                    if response:
-                        count += 1
-                        mail_log.sent_to.append(recipient)
-
-            mail_log.save()
-
-        return count
 
     def handle(self, *args, **options):
+        dispatcher = MailDispatcher(
+            batch_size=options.get("batch_size"), max_rate=options.get("max_rate")
+        )
         if options.get("id"):
-            mail_logs = MailLog.objects.filter(id=options["id"])
+            nr_mails = dispatcher.dispatch(
+                MailLog.objects.filter(id=options["id"]), max_batches=1
+            )
         else:
-            mail_logs = (
-                MailLog.objects.all()
-                .not_sent()
-                .with_recipients()
-                .order_by("created")[:10]
+            nr_mails = dispatcher.dispatch(
+                loop=options.get("loop"), interval=options.get("interval")
             )
-        nr_mails = self.process_mail_logs(mail_logs)
         self.stdout.write("Sent {} mails.".format(nr_mails))
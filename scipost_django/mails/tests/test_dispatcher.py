@@ -0,0 +1,91 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.test import TestCase
+
+from mails.dispatcher import MailDispatcher
+from mails.models import MAIL_NOT_RENDERED, MAIL_RENDERED, MAIL_SENT, MailLog
+
+
+class MailDispatcherTests(TestCase):
+    def setUp(self):
+        self.single = MailLog.objects.create(
+            subject="Single",
+            body="Body",
+            body_html="<p>Body</p>",
+            from_email="admin@scipost.org",
+            to_recipients=["single@scipost.org"],
+            cc_recipients=["cc@scipost.org"],
+            message_id="<single@scipost.org>",
+        )
+        self.bulk = MailLog.objects.create(
+            type=MailLog.TYPE_BULK,
+            subject="Bulk",
+            body="Announcement",
+            from_email="admin@scipost.org",
+            to_recipients=[f"reader{i}@scipost.org" for i in range(5)],
+            sent_to=["reader0@scipost.org"],
+        )
+        self.unrendered = MailLog.objects.create(
+            status=MAIL_NOT_RENDERED,
+            mail_code="tests/test_mail_code_1",
+            from_email="admin@scipost.org",
+            to_recipients=["unrendered@scipost.org"],
+        )
+        self.unrendered.context.create(name="object", value="Test object")
+
+    def dispatcher(self, **kwargs):
+        return MailDispatcher(
+            max_rate=1000,
+            connection=get_connection("django.core.mail.backends.locmem.EmailBackend"),
+            **kwargs,
+        )
+
+    def test_dispatch(self):
+        self.assertEqual(self.dispatcher(batch_size=3).dispatch(), 6)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            [
+                "reader1@scipost.org",
+                "reader2@scipost.org",
+                "reader3@scipost.org",
+                "reader4@scipost.org",
+                "single@scipost.org",
+                "unrendered@scipost.org",
+            ],
+        )
+        single = next(m for m in mail.outbox if m.subject == "Single")
+        self.assertEqual(single.cc, ["cc@scipost.org"])
+        self.assertEqual(single.extra_headers["Message-ID"], "<single@scipost.org>")
+        self.assertEqual(single.alternatives[0][0], "<p>Body</p>")
+
+        for mail_log in MailLog.objects.all():
+            self.assertEqual(mail_log.status, MAIL_SENT)
+            self.assertTrue(mail_log.processed)
+        self.bulk.refresh_from_db()
+        self.assertCountEqual(self.bulk.sent_to, self.bulk.to_recipients)
+        self.unrendered.refresh_from_db()
+        self.assertEqual(self.unrendered.subject, "SciPost Test")
+        self.assertIn("Test object", self.unrendered.body_html)
+
+        # Nothing is sent twice
+        self.assertEqual(self.dispatcher().dispatch(), 0)
+
+    def test_dispatch_batch_progress(self):
+        dispatcher = self.dispatcher(batch_size=2)
+        with self.assertNumQueries(4):
+            # Claim and a single bulk update (in a savepoint)
+            self.assertEqual(
+                dispatcher.dispatch_batch(MailLog.objects.filter(type="bulk")), 1
+            )
+        self.bulk.refresh_from_db()
+        self.assertEqual(len(self.bulk.sent_to), 3)
+        self.assertEqual(self.bulk.status, MAIL_RENDERED)
+
+    def test_dispatch_failure(self):
+        dispatcher = self.dispatcher(chunk_size=1)
+        dispatcher.connection.send_messages = lambda messages: 0
+        self.assertEqual(dispatcher.dispatch(), 0)
+        self.assertEqual(MailLog.objects.filter(status=MAIL_SENT).count(), 0)
@@ -1,7 +1,10 @@
+import os
+import tempfile
+
 from django.template.exceptions import TemplateDoesNotExist
 from django.test import TestCase
 
-from mails.core import MailEngine
+from mails.core import MailEngine, MailFileCache
 from mails.exceptions import ConfigurationError
 
 
@@ -103,3 +106,29 @@ class MailLogModelTests(TestCase):
         self.assertNotIn("weird_variable_name", engine.mail_config)
         self.assertIn("weird_variable_name", engine.template_variables)
         self.assertEqual(engine.template_variables["weird_variable_name"], "John Doe")
+
+
+class MailFileCacheTests(TestCase):
+    """
+    Test the cache of the compiled mail templates.
+    """
+
+    def test_cache(self):
+        cache = MailFileCache()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "mail.html")
+            with open(path, "w") as f:
+                f.write("Hello {{ name }}")
+            template = cache.get(path)
+            self.assertIs(cache.get(path), template)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            # Modified files are recompiled
+            with open(path, "w") as f:
+                f.write("Goodbye {{ name }}")
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+            self.assertEqual(cache.get(path).source, "Goodbye {{ name }}")
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+            with self.assertRaises(OSError):
+                cache.get(os.path.join(directory, "missing.html"))
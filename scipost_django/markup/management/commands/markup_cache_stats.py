@@ -0,0 +1,24 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.core.management.base import BaseCommand
+
+from markup.utils.cache import markup_cache
+
+
+class Command(BaseCommand):
+    help = "Show the hits and misses of the markup cache, counted by all processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset the counters afterwards."
+        )
+
+    def handle(self, *args, **options):
+        stats = markup_cache.get_shared_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = f" ({stats['hits'] / total:.1%} hit ratio)" if total else ""
+        self.stdout.write(f"Hits: {stats['hits']}, misses: {stats['misses']}{ratio}")
+        if options["reset"]:
+            markup_cache.reset_shared_stats()
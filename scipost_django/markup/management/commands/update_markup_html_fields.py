@@ -0,0 +1,32 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from markup.mixins import MarkupHTMLFieldsMixin
+
+
+class Command(BaseCommand):
+    help = (
+        "For all instances of the models with markup shadow fields, "
+        "this updates the processed markup persisted in them."
+    )
+
+    def handle(self, *args, **kwargs):
+        for model in apps.get_models():
+            if not issubclass(model, MarkupHTMLFieldsMixin):
+                continue
+            fields = list(model.markup_html_fields.keys())
+            html_fields = list(model.markup_html_fields.values())
+            objects = []
+            for obj in model.objects.only("id", *fields).iterator(chunk_size=500):
+                obj.update_markup_html_fields()
+                objects.append(obj)
+            model.objects.bulk_update(objects, html_fields, batch_size=500)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Updated the markup of {len(objects)} {model._meta.verbose_name_plural}."
+                )
+            )
@@ -0,0 +1,36 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from .utils.cache import markup_cache
+
+
+class MarkupHTMLFieldsMixin:
+    """
+    Persist the processed markup of some text fields in shadow `*_html` fields,
+    refreshed on save, such that pages need not process the markup on every view.
+
+    Models using it define `markup_html_fields`, mapping the text fields
+    to their shadow fields. These are rendered in templates with
+    `{% automarkup object.text rendered=object.text_html %}`.
+
+    Texts with markup errors are not persisted, such that the errors keep
+    being flagged when the text is rendered.
+    """
+
+    markup_html_fields: dict[str, str] = {}
+
+    def update_markup_html_fields(self):
+        for field, html_field in self.markup_html_fields.items():
+            markup = markup_cache.process(getattr(self, field))
+            setattr(self, html_field, "" if markup["errors"] else markup["processed"])
+
+    def save(self, *args, **kwargs):
+        self.update_markup_html_fields()
+        if (update_fields := kwargs.get("update_fields")) is not None:
+            kwargs["update_fields"] = set(update_fields) | {
+                html_field
+                for field, html_field in self.markup_html_fields.items()
+                if field in update_fields
+            }
+        return super().save(*args, **kwargs)
@@ -4,18 +4,25 @@ __license__ = "AGPL v3"
 
 from django import template
 from django.contrib.auth import get_user_model
+from django.utils.safestring import mark_safe
 
 from helpdesk.constants import TICKET_PRIORITY_MEDIUM, TICKET_STATUS_UNASSIGNED
 from helpdesk.models import Queue, Ticket
-from ..utils import process_markup
+from ..utils.cache import markup_cache
 
 
 register = template.Library()
 
 
 @register.simple_tag(takes_context=True)
-def automarkup(context, text, language_forced=None):
-    markup = process_markup(text, language_forced=language_forced)
+def automarkup(context, text, language_forced=None, rendered=None):
+    """
+    Render the markup of the text. If given, the (non-empty) `rendered`
+    HTML is used instead, e.g. from a model's shadow field.
+    """
+    if rendered:
+        return mark_safe(rendered)
+    markup = markup_cache.process(text, language_forced=language_forced)
     if (
         markup["errors"]
         and "request" in context
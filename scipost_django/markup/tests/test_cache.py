@@ -0,0 +1,54 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import SimpleTestCase
+
+from ..utils.cache import MarkupCache
+
+TEXT = "Title\n=====\n\nSome *emphasis*."
+
+
+class MarkupCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_process(self):
+        markup_cache = MarkupCache()
+        markup = markup_cache.process(TEXT)
+        self.assertEqual(markup["language"], "reStructuredText")
+        self.assertIn("<em>emphasis</em>", markup["processed"])
+
+        with mock.patch("markup.utils.cache.process_markup") as process_markup:
+            self.assertEqual(markup_cache.process(TEXT), markup)
+            process_markup.assert_not_called()
+        self.assertEqual((markup_cache.hits, markup_cache.misses), (1, 1))
+
+        # Other options are cached separately
+        markup_cache.process(TEXT, language_forced="plain")
+        markup_cache.process(TEXT, include_errors=True)
+        self.assertEqual((markup_cache.hits, markup_cache.misses), (1, 3))
+
+    def test_shared_stats(self):
+        markup_caches = [MarkupCache(), MarkupCache()]
+        for markup_cache in markup_caches:
+            markup_cache.STATS_FLUSH_INTERVAL = 2
+            markup_cache.process(TEXT)
+            markup_cache.process(TEXT)
+        self.assertEqual(markup_caches[0].get_shared_stats(), {"hits": 3, "misses": 1})
+
+    def test_automarkup_tag(self):
+        template = Template(
+            "{% load automarkup %}{% automarkup text rendered=text_html %}"
+        )
+        self.assertIn(
+            "<em>emphasis</em>",
+            template.render(Context({"text": TEXT, "text_html": ""})),
+        )
+        self.assertEqual(
+            template.render(Context({"text": TEXT, "text_html": "<p>Cached</p>"})),
+            "<p>Cached</p>",
+        )
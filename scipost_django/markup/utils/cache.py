@@ -0,0 +1,77 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import hashlib
+from typing import Any
+
+from django.core.cache import cache
+
+from . import process_markup
+
+
+class MarkupCache:
+    """
+    Cache of processed markup, shared by all processes through Django's cache
+    and keyed by a hash of the text and the processing options.
+
+    Hits and misses are counted per process, and added to counters in the shared
+    cache (see `get_shared_stats`) every `STATS_FLUSH_INTERVAL` lookups.
+    """
+
+    TIMEOUT = 60 * 60 * 24 * 30
+    STATS_FLUSH_INTERVAL = 100
+    STATS_KEYS = {"hits": "markup_cache:hits", "misses": "markup_cache:misses"}
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.unflushed = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def key(text: str, language_forced: str | None, include_errors: bool) -> str:
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        return f"markup_cache:{digest}:{language_forced}:{int(include_errors)}"
+
+    def process(
+        self, text: str, language_forced: str | None = None, include_errors=False
+    ) -> dict[str, Any]:
+        """Return the processed markup of the text (see `process_markup`)."""
+        if not text:
+            return process_markup(text, language_forced, include_errors)
+        key = self.key(text, language_forced, include_errors)
+        markup = cache.get(key)
+        if markup is None:
+            self.count("misses")
+            markup = process_markup(text, language_forced, include_errors)
+            cache.set(key, markup, self.TIMEOUT)
+        else:
+            self.count("hits")
+        return markup
+
+    def count(self, stat: str) -> None:
+        setattr(self, stat, getattr(self, stat) + 1)
+        self.unflushed[stat] += 1
+        if sum(self.unflushed.values()) >= self.STATS_FLUSH_INTERVAL:
+            self.flush_stats()
+
+    def flush_stats(self) -> None:
+        for stat, value in self.unflushed.items():
+            if value:
+                key = self.STATS_KEYS[stat]
+                try:
+                    cache.incr(key, value)
+                except ValueError:  # Not yet (or no longer) in the cache
+                    cache.add(key, value, None)
+                self.unflushed[stat] = 0
+
+    def get_shared_stats(self) -> dict[str, int]:
+        """Return the hits and misses counted by all processes (up to their last flush)."""
+        values = cache.get_many(self.STATS_KEYS.values())
+        return {stat: values.get(key, 0) for stat, key in self.STATS_KEYS.items()}
+
+    def reset_shared_stats(self) -> None:
+        cache.delete_many(self.STATS_KEYS.values())
+
+
+markup_cache = MarkupCache()
@@ -11,7 +11,7 @@ from rest_framework.response import Response
 from rest_framework.settings import api_settings
 from rest_framework_csv import renderers as r
 
-from api.viewsets.mixins import FilteringOptionsActionMixin
+from api.viewsets.mixins import CursorPaginationMixin, FilteringOptionsActionMixin
 
 from journals.api.serializers import PubFracPublicSerializer
 from organizations.models import Organization
@@ -24,7 +24,7 @@ from organizations.api.serializers import (
 
 
 class OrganizationPublicAPIViewSet(
-    FilteringOptionsActionMixin, viewsets.ReadOnlyModelViewSet
+    CursorPaginationMixin, FilteringOptionsActionMixin, viewsets.ReadOnlyModelViewSet
 ):
     queryset = Organization.objects.all()
     permission_classes = [
@@ -39,6 +39,7 @@ class OrganizationPublicAPIViewSet(
         "name_original",
         "acronym",
     ]
+    cursor_ordering = ("id",)
     filterset_class = OrganizationPublicAPIFilterSet
     default_filtering_fields = [
         "name__icontains",
@@ -0,0 +1,537 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import datetime
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Iterable
+
+from django.db.models import Sum
+from django.utils import timezone
+
+from finances.models import PubFrac, Subsidy
+from journals.constants import ISSUES_AND_VOLUMES, ISSUES_ONLY
+from journals.models import Journal, Publication, PublicationAuthorsTable
+
+CALCULATED_FIELDS = (
+    "cf_associated_publication_ids",
+    "cf_nr_associated_publications",
+    "cf_expenditure_for_publication",
+    "cf_balance_info",
+)
+
+ASSOCIATION_KEYS = (
+    "via_author_affiliation",
+    "via_grant",
+    "via_funder_generic",
+)
+
+
+@dataclass
+class _PublicationInfo:
+    id: int
+    doi_label: str
+    year: int
+    in_journal_id: int | None
+    in_issue_journal_id: int | None
+    in_volume_journal_id: int | None
+
+    @property
+    def journal_id(self) -> int | None:
+        """Mirror of `Publication.get_journal`."""
+        return (
+            self.in_journal_id or self.in_issue_journal_id or self.in_volume_journal_id
+        )
+
+    def is_in_journal(self, journal: Journal) -> bool:
+        """Mirror of `Journal.get_publications` membership."""
+        if journal.structure == ISSUES_AND_VOLUMES:
+            return self.in_volume_journal_id == journal.id
+        elif journal.structure == ISSUES_ONLY:
+            return self.in_issue_journal_id == journal.id
+        return self.in_journal_id == journal.id
+
+
+@dataclass
+class _PubFracInfo:
+    organization_id: int
+    publication_id: int
+    doi_label: str
+    year: int
+    fraction: Decimal
+    cf_value: Decimal | None
+    compensated_by_id: int | None
+    compensated_by_organization_id: int | None
+
+
+class OrganizationCalculatedFields:
+    """
+    Batch recomputation of the Organization calculated fields (``cf_*``).
+
+    All the data needed to compute the fields is fetched with a handful of
+    grouped queries (independently of the number of Organizations), after which
+    the fields are computed in memory and written back using ``bulk_update``.
+
+    If ``organization_ids`` is given, only those Organizations are updated;
+    otherwise all Organizations are. If ``cf_associated_publication_ids`` is not
+    among the ``fields`` to update, the stored value is used for the other fields.
+    """
+
+    def __init__(
+        self,
+        organization_ids: Iterable[int] | None = None,
+        fields: Iterable[str] = CALCULATED_FIELDS,
+    ):
+        from organizations.models import Organization
+
+        self.fields = [field for field in CALCULATED_FIELDS if field in fields]
+        self.organization_ids = (
+            None if organization_ids is None else set(organization_ids)
+        )
+        self.organizations = Organization.objects.only(
+            "id", "cf_associated_publication_ids", *self.fields
+        )
+        if self.organization_ids is not None:
+            self.organizations = self.organizations.filter(id__in=self.organization_ids)
+
+    def _filter_organizations(self, queryset, lookup: str, organization_ids: set[int]):
+        """
+        Restrict the queryset to the given Organizations, unless all are being updated
+        (in which case a filter on a list of all ids would only slow the query down).
+        """
+        if self.organization_ids is None:
+            return queryset
+        return queryset.filter(**{f"{lookup}__in": organization_ids})
+
+    def load(self, organizations, publication_ids: list[int] | None = None) -> None:
+        """
+        Fetch all the data required for the given Organizations.
+
+        If ``publication_ids`` is given, only those (published) Publications are
+        loaded, instead of all published ones.
+        """
+        from organizations.models import Organization
+
+        target_ids = {org.id for org in organizations}
+        self.children = defaultdict(list)
+        self.organization_names: dict[int, tuple[str, str]] = {}
+        for org_id, parent_id, name, country in (
+            self._filter_organizations(
+                Organization.objects.filter(parent__isnull=False),
+                "parent_id",
+                target_ids,
+            )
+            .values_list("id", "parent_id", "name", "country")
+            .order_by()
+        ):
+            self.children[parent_id].append(org_id)
+            self.organization_names[org_id] = (str(country), name)
+        relevant_ids = target_ids | set(self.organization_names)
+
+        publications = Publication.objects.published()
+        if publication_ids is not None:
+            publications = publications.filter(id__in=publication_ids)
+        self.publications: dict[int, _PublicationInfo] = {
+            row[0]: _PublicationInfo(*row)
+            for row in publications.values_list(
+                "id",
+                "doi_label",
+                "publication_date__year",
+                "in_journal_id",
+                "in_issue__in_journal_id",
+                "in_issue__in_volume__in_journal_id",
+            )
+        }
+        # Position in the default Publication ordering, to keep lists sorted
+        self.publication_order = {
+            pub_id: index for index, pub_id in enumerate(self.publications)
+        }
+
+        self.journals = {journal.id: journal for journal in Journal.objects.all()}
+        self.journals_by_label = {
+            journal.doi_label: journal for journal in self.journals.values()
+        }
+
+        self.pubfracs: dict[int, list[_PubFracInfo]] = defaultdict(list)
+        for row in (
+            self._filter_organizations(
+                PubFrac.objects.filter(organization__isnull=False),
+                "organization_id",
+                relevant_ids,
+            )
+            .values_list(
+                "organization_id",
+                "publication_id",
+                "publication__doi_label",
+                "publication__publication_date__year",
+                "fraction",
+                "cf_value",
+                "compensated_by_id",
+                "compensated_by__organization_id",
+            )
+            .order_by()
+            .iterator()
+        ):
+            self.pubfracs[row[0]].append(_PubFracInfo(*row))
+
+        self.compensated_fractions: dict[int, Decimal] = dict(
+            PubFrac.objects.filter(
+                compensated_by__isnull=False,
+                publication__in=publications.values("id"),
+            )
+            .values("publication_id")
+            .annotate(total=Sum("fraction"))
+            .values_list("publication_id", "total")
+            .order_by()
+        )
+
+        self.subsidies: dict[int, list[Subsidy]] = defaultdict(list)
+        for subsidy in (
+            self._filter_organizations(
+                Subsidy.objects.obtained(), "organization_id", target_ids
+            )
+            .only("organization_id", "amount", "date_from", "date_until")
+            .order_by()
+        ):
+            self.subsidies[subsidy.organization_id].append(subsidy)
+
+    def load_associations(self, organization_ids: set[int]) -> dict[int, dict]:
+        """
+        Return the publication ids associated to each Organization (or its children),
+        in the format of `Organization.cf_associated_publication_ids`.
+        """
+        relevant_ids = organization_ids | set(
+            chain.from_iterable(self.children[org_id] for org_id in organization_ids)
+        )
+        direct: dict[str, dict[int, list[int]]] = {
+            key: defaultdict(list) for key in ASSOCIATION_KEYS
+        }
+        rows = {
+            "via_author_affiliation": self._filter_organizations(
+                PublicationAuthorsTable.affiliations.through.objects.all(),
+                "organization_id",
+                relevant_ids,
+            ).values_list("organization_id", "publicationauthorstable__publication_id"),
+            "via_grant": self._filter_organizations(
+                Publication.grants.through.objects.filter(
+                    grant__funder__organization__isnull=False
+                ),
+                "grant__funder__organization_id",
+                relevant_ids,
+            ).values_list("grant__funder__organization_id", "publication_id"),
+            "via_funder_generic": self._filter_organizations(
+                Publication.funders_generic.through.objects.filter(
+                    funder__organization__isnull=False
+                ),
+                "funder__organization_id",
+                relevant_ids,
+            ).values_list("funder__organization_id", "publication_id"),
+        }
+        for key, values in rows.items():
+            for org_id, pub_id in values.order_by().iterator():
+                if pub_id in self.publications:
+                    direct[key][org_id].append(pub_id)
+            for pub_ids in direct[key].values():
+                pub_ids.sort(key=self.publication_order.__getitem__)
+
+        associations = {}
+        for org_id in organization_ids:
+            ids: dict[str, list[int]] = {}
+            for key in ASSOCIATION_KEYS:
+                ids[key] = direct[key].get(org_id, [])
+            for key in ASSOCIATION_KEYS:
+                ids[key.replace("via_", "via_child_")] = sorted(
+                    chain.from_iterable(
+                        direct[key].get(child_id, [])
+                        for child_id in self.children[org_id]
+                    ),
+                    key=self.publication_order.__getitem__,
+                )
+            ids["all"] = list(set(chain.from_iterable(ids.values())))
+            associations[org_id] = ids
+        return associations
+
+    def cost_per_publication(self, publication: _PublicationInfo) -> int:
+        """Mirror of `Publication.expenditures`."""
+        journal = self.journals[publication.journal_id]
+        return journal.cost_per_publication(publication.year)
+
+    def compensated_expenditures(self, publication: _PublicationInfo):
+        """Mirror of `Publication.compensated_expenditures`."""
+        if publication.id not in self.compensated_fractions:
+            return 0
+        return self.compensated_fractions[publication.id] * self.cost_per_publication(
+            publication
+        )
+
+    def expenditure_for_publications(
+        self, organization_id: int, publication_ids: list[int]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Compute `Organization.expenditure_for_publication` for all given publications.
+        """
+        own_pubfracs = {pf.publication_id: pf for pf in self.pubfracs[organization_id]}
+        children_pubfracs = defaultdict(set)
+        for child_id in self.children[organization_id]:
+            for pf in self.pubfracs[child_id]:
+                children_pubfracs[pf.publication_id].add(child_id)
+
+        expenditures = {}
+        for pub_id in publication_ids:
+            publication = self.publications[pub_id]
+            unitcost = self.cost_per_publication(publication)
+            if pf := own_pubfracs.get(pub_id):
+                expenditures[publication.doi_label] = {
+                    "millipubfrac": int(1000 * pf.fraction),
+                    "unitcost": unitcost,
+                    "expenditure": int(pf.fraction * unitcost),
+                    "message": "",
+                }
+                continue
+            message = ""
+            if children_ids := children_pubfracs.get(pub_id):
+                message = "as parent (ascribed to "
+                for child_id in sorted(children_ids, key=self.organization_names.get):
+                    message += f"{self.organization_names[child_id][1]}; "
+                message = message.rpartition(";")[0] + ")"
+            expenditures[publication.doi_label] = {
+                "millipubfrac": 0,
+                "unitcost": unitcost,
+                "expenditure": 0,
+                "message": message,
+            }
+        return expenditures
+
+    def balance_info(
+        self, organization_id: int, publication_ids: list[int]
+    ) -> dict[str, Any]:
+        """
+        Compute `Organization.get_balance_info` from the loaded data.
+        """
+        pubyears = range(int(timezone.now().strftime("%Y")), 2015, -1)
+        publications_per_year = defaultdict(list)
+        for pub_id in publication_ids:
+            if publication := self.publications.get(pub_id):
+                publications_per_year[publication.year].append(publication)
+        pubfracs_per_year = defaultdict(list)
+        for pf in self.pubfracs[organization_id]:
+            pubfracs_per_year[pf.year].append(pf)
+
+        rep = {}
+        cumulative = defaultdict(int)
+        for year in pubyears:
+            subsidy_income = sum(
+                subsidy.value_in_year(year)
+                for subsidy in self.subsidies[organization_id]
+            )
+            rep[str(year)] = {
+                "subsidy_income": subsidy_income,
+                "expenditures": {"per_journal": {}},
+            }
+            totals = defaultdict(int)
+            publications_year = publications_per_year[year]
+            journal_labels = {
+                self.journals[journal_id].doi_label
+                for publication in publications_year
+                for journal_id in (
+                    publication.in_journal_id,
+                    publication.in_issue_journal_id,
+                    publication.in_volume_journal_id,
+                )
+                if journal_id
+            }
+            for journal_label in sorted(journal_labels):
+                prefix = journal_label.lower() + "."
+                qs = [
+                    pf
+                    for pf in pubfracs_per_year[year]
+                    if pf.doi_label.lower().startswith(prefix)
+                ]
+                journal = self.journals_by_label[journal_label]
+                publications_year_journal = [
+                    p for p in publications_year if p.is_in_journal(journal)
+                ]
+                nap = len(publications_year_journal)
+                sum_pf = sum(pf.fraction for pf in qs)
+                costperpaper = journal.cost_per_publication(year)
+                expenditures = int(costperpaper * sum_pf)
+                self_compensated = int(
+                    sum(
+                        pf.cf_value
+                        for pf in qs
+                        if pf.compensated_by_organization_id == organization_id
+                        and pf.cf_value is not None
+                    )
+                )
+                ally_compensated = int(
+                    sum(
+                        pf.cf_value
+                        for pf in qs
+                        if pf.compensated_by_id is not None
+                        and pf.compensated_by_organization_id != organization_id
+                        and pf.cf_value is not None
+                    )
+                )
+                uncompensated = expenditures - self_compensated - ally_compensated
+                associated_compensated = int(
+                    sum(
+                        self.compensated_expenditures(p)
+                        for p in publications_year_journal
+                    )
+                )
+                associated_uncompensated = nap * costperpaper - associated_compensated
+                if sum_pf > 0 or associated_uncompensated > 0:
+                    rep[str(year)]["expenditures"]["per_journal"][journal_label] = {
+                        "costperpaper": costperpaper,
+                        "nap": nap,
+                        "pubfracs": float(sum_pf),
+                        "expenditures": expenditures,
+                        "self_compensated": self_compensated,
+                        "ally_compensated": ally_compensated,
+                        "uncompensated": uncompensated,
+                        "associated_expenditures": nap * costperpaper,
+                        "associated_compensated": associated_compensated,
+                        "associated_uncompensated": associated_uncompensated,
+                        "bystander_percentage": (
+                            int(100 * associated_uncompensated / (nap * costperpaper))
+                            if nap * costperpaper > 0
+                            else "N/A"
+                        ),
+                    }
+                totals["nap"] += nap
+                totals["pubfracs"] += float(sum_pf)
+                totals["expenditures"] += expenditures
+                totals["self_compensated"] += self_compensated
+                totals["ally_compensated"] += ally_compensated
+                totals["uncompensated"] += uncompensated
+                totals["associated_expenditures"] += nap * costperpaper
+                totals["associated_compensated"] += associated_compensated
+                totals["associated_uncompensated"] += associated_uncompensated
+            rep[str(year)]["expenditures"]["total"] = {
+                "nap": totals["nap"],
+                "pubfracs": totals["pubfracs"],
+                "expenditures": totals["expenditures"],
+                "self_compensated": totals["self_compensated"],
+                "ally_compensated": totals["ally_compensated"],
+                "uncompensated": totals["uncompensated"],
+                "associated_expenditures": totals["associated_expenditures"],
+                "associated_compensated": totals["associated_compensated"],
+                "associated_uncompensated": totals["associated_uncompensated"],
+                "bystander_percentage": _bystander_percentage(totals),
+            }
+            rep[str(year)]["reserved"] = subsidy_income - totals["self_compensated"]
+            rep[str(year)]["impact_on_reserves"] = (
+                subsidy_income - totals["expenditures"]
+            )
+            for key, value in totals.items():
+                cumulative[key] += value
+            cumulative["subsidy_income"] += subsidy_income
+            cumulative["impact_on_reserves"] += subsidy_income - totals["expenditures"]
+            cumulative["reserved"] += subsidy_income - totals["self_compensated"]
+        rep["cumulative"] = {
+            "nap": cumulative["nap"],
+            "pubfracs": cumulative["pubfracs"],
+            "expenditures": cumulative["expenditures"],
+            "self_compensated": cumulative["self_compensated"],
+            "ally_compensated": cumulative["ally_compensated"],
+            "uncompensated": cumulative["uncompensated"],
+            "associated_expenditures": cumulative["associated_expenditures"],
+            "associated_compensated": cumulative["associated_compensated"],
+            "associated_uncompensated": cumulative["associated_uncompensated"],
+            "bystander_percentage": _bystander_percentage(cumulative),
+            "subsidy_income": cumulative["subsidy_income"],
+            "reserved": cumulative["reserved"],
+            "impact_on_reserves": cumulative["impact_on_reserves"],
+        }
+        return rep
+
+    def compute(self, organizations) -> None:
+        """
+        Set the calculated fields on the given Organization instances (without saving).
+        """
+        self.load(organizations)
+        if "cf_associated_publication_ids" in self.fields:
+            associations = self.load_associations({org.id for org in organizations})
+        for org in organizations:
+            if "cf_associated_publication_ids" in self.fields:
+                org.cf_associated_publication_ids = associations[org.id]
+            publication_ids = [
+                pub_id
+                for pub_id in org.cf_associated_publication_ids.get("all", [])
+                if pub_id in self.publications
+            ]
+            if "cf_nr_associated_publications" in self.fields:
+                org.cf_nr_associated_publications = len(publication_ids)
+            if "cf_expenditure_for_publication" in self.fields:
+                org.cf_expenditure_for_publication = self.expenditure_for_publications(
+                    org.id, publication_ids
+                )
+            if "cf_balance_info" in self.fields:
+                org.cf_balance_info = self.balance_info(org.id, publication_ids)
+
+    def update(self, batch_size: int = 500) -> int:
+        """
+        Recompute and save the calculated fields. Returns the number of updated rows.
+        """
+        from organizations.models import Organization
+
+        organizations = list(self.organizations)
+        if not organizations or not self.fields:
+            return 0
+        self.compute(organizations)
+        return Organization.objects.bulk_update(
+            organizations, self.fields, batch_size=batch_size
+        )
+
+
+def _bystander_percentage(totals) -> int | str:
+    if totals["associated_expenditures"] > 0:
+        return int(
+            100 * totals["associated_uncompensated"] / totals["associated_expenditures"]
+        )
+    return "N/A"
+
+
+def get_recently_touched_organization_ids(since: datetime.datetime) -> set[int]:
+    """
+    Return the ids of Organizations whose calculated fields may have changed since
+    the given datetime, for an incremental update.
+
+    These are the Organizations (and their parents) linked to recently modified
+    Publications, as well as those involved in current Subsidies (whose
+    compensations are reallocated as new PubFracs appear).
+    """
+    from organizations.models import Organization
+
+    publications = Publication.objects.filter(latest_activity__gte=since)
+    current_subsidies = Subsidy.objects.current()
+    touched = set(
+        chain(
+            PublicationAuthorsTable.affiliations.through.objects.filter(
+                publicationauthorstable__publication__in=publications
+            ).values_list("organization_id", flat=True),
+            Publication.grants.through.objects.filter(
+                publication__in=publications
+            ).values_list("grant__funder__organization_id", flat=True),
+            Publication.funders_generic.through.objects.filter(
+                publication__in=publications
+            ).values_list("funder__organization_id", flat=True),
+            PubFrac.objects.filter(publication__in=publications).values_list(
+                "organization_id", flat=True
+            ),
+            current_subsidies.values_list("organization_id", flat=True),
+            PubFrac.objects.filter(compensated_by__in=current_subsidies).values_list(
+                "organization_id", flat=True
+            ),
+        )
+    )
+    touched.discard(None)
+    touched |= set(
+        Organization.objects.filter(id__in=touched, parent__isnull=False).values_list(
+            "parent_id", flat=True
+        )
+    )
+    return touched
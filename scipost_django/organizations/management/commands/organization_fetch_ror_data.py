@@ -4,7 +4,7 @@ __license__ = "AGPL v3"
 
 from django.core.management.base import BaseCommand
 
-from organizations.models import Organization
+from organizations.ror_dump import update_organizations_ror_json
 from organizations.utils import RORAPIHandler
 
 
@@ -12,24 +12,19 @@ class Command(BaseCommand):
     help = (
         "For all Organization model instances, "
         "this command updates the `ror_json` field by fetching the latest data "
-        "using the `id` property of the `ror_json` field."
+        "using the `id` property of the `ror_json` field. "
+        "The data is taken from the local index of the ROR data dump "
+        "(see `organization_import_ror_dump`) where available, "
+        "and only the changed organizations are saved."
     )
 
     def handle(self, *args, **kwargs):
-        ror_api_handler = RORAPIHandler()
-
-        updated = 0
-        missing = 0
-        for org in Organization.objects.all():
-            if ror_id := org.ror_json.get("id", None):
-                org.ror_json = ror_api_handler.fetch(ror_id)
-                org.save()
-                updated += 1
-            else:
-                missing += 1
+        counts = update_organizations_ror_json(fetch_missing=RORAPIHandler().fetch)
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Successfully updated {updated} organizations, {missing} organizations missing `id`"
+                f"Successfully updated {counts['updated']} organizations "
+                f"({counts['unchanged']} unchanged, {counts['missing']} not found), "
+                f"{counts['without_id']} organizations missing `id`"
             )
         )
@@ -0,0 +1,41 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.core.management.base import BaseCommand
+
+from organizations.ror_dump import (
+    iter_ror_dump,
+    update_organizations_ror_json,
+    update_ror_records,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the local index of ROR records from a ROR data dump "
+        "(the zip file or its v2 schema JSON file), then the `ror_json` field "
+        "of all Organization model instances from this index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the ROR data dump.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        counts = update_ror_records(
+            iter_ror_dump(options["path"]), batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            f"ROR records: {counts['created']} created, {counts['updated']} updated, "
+            f"{counts['unchanged']} unchanged"
+        )
+
+        counts = update_organizations_ror_json(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully updated {counts['updated']} organizations "
+                f"({counts['unchanged']} unchanged, {counts['missing']} not found "
+                f"in the dump, {counts['without_id']} missing `id`)"
+            )
+        )
@@ -4,7 +4,7 @@ __license__ = "AGPL v3"
 
 from django.core.management.base import BaseCommand
 
-from organizations.models import Organization
+from organizations.calculated_fields import OrganizationCalculatedFields
 
 
 class Command(BaseCommand):
@@ -14,13 +14,9 @@ class Command(BaseCommand):
     )
 
     def handle(self, *args, **kwargs):
-        for org in Organization.objects.all():
-            for publication in org.get_publications():
-                org.cf_expenditure_for_publication[
-                    publication.doi_label
-                ] = org.expenditure_for_publication(publication.doi_label)
-                org.save()
-            org.update_cf_nr_associated_publications()
+        OrganizationCalculatedFields(
+            fields=["cf_expenditure_for_publication", "cf_nr_associated_publications"]
+        ).update()
         self.stdout.write(
             self.style.SUCCESS(
                 "Successfully updated Organization:cf_expenditure_for_publication."
@@ -4,7 +4,7 @@ __license__ = "AGPL v3"
 
 from django.core.management.base import BaseCommand
 
-from organizations.models import Organization
+from organizations.calculated_fields import OrganizationCalculatedFields
 
 
 class Command(BaseCommand):
@@ -14,8 +14,7 @@ class Command(BaseCommand):
     )
 
     def handle(self, *args, **kwargs):
-        for org in Organization.objects.all():
-            org.update_cf_nr_associated_publications()
+        OrganizationCalculatedFields(fields=["cf_nr_associated_publications"]).update()
         self.stdout.write(
             self.style.SUCCESS(
                 "Successfully updated Organization:cf_nr_associated_publications."
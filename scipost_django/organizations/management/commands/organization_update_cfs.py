@@ -0,0 +1,54 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import datetime
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from organizations.calculated_fields import (
+    OrganizationCalculatedFields,
+    get_recently_touched_organization_ids,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Updates all the calculated fields (cf_*) of Organizations in a single batch. "
+        "By default all Organizations are updated; use --organization_ids or "
+        "--since_hours to restrict the update to a subset."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--organization_ids",
+            nargs="+",
+            type=int,
+            required=False,
+            help="Only update the Organizations with these ids.",
+        )
+        parser.add_argument(
+            "--since_hours",
+            type=int,
+            required=False,
+            help=(
+                "Only update the Organizations touched by publications or subsidies "
+                "changed in the last given number of hours."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        organization_ids = options["organization_ids"]
+        if options["since_hours"] is not None:
+            since = timezone.now() - datetime.timedelta(hours=options["since_hours"])
+            organization_ids = set(organization_ids or []) | (
+                get_recently_touched_organization_ids(since)
+            )
+
+        nr_updated = OrganizationCalculatedFields(organization_ids).update()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully updated the calculated fields of {nr_updated} Organizations."
+            )
+        )
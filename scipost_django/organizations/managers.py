@@ -225,3 +225,34 @@ class OrganizationQuerySet(models.QuerySet):
             .values("id")[:1]
         )
         # fmt: on
+
+
+class RORRecordQuerySet(models.QuerySet):
+    PUBLIC_TYPES = ["education", "funder", "government", "nonprofit"]
+
+    def matching_domain(self, domain: str, exclude_private: bool = False):
+        """
+        Records of the active organizations with the given (email) domain,
+        or one of its parent domains (e.g. `uva.nl` for `science.uva.nl`).
+        """
+        labels = domain.lower().strip().split(".")
+        domains = [".".join(labels[i:]) for i in range(max(len(labels) - 1, 1))]
+        # Like the ROR API's search, leave out the inactive and withdrawn records
+        queryset = self.filter(domains__overlap=domains, data__status="active")
+        if exclude_private:
+            queryset = queryset.filter(types__overlap=self.PUBLIC_TYPES)
+        return queryset
+
+    def get_record(self, ror_id: str):
+        """
+        Return the record with the given ROR ID (or URL, or GRID ID),
+        or None if there is no single match.
+        """
+        if ror_id.startswith("grid"):
+            queryset = self.filter(
+                data__external_ids__contains=[{"type": "grid", "all": [ror_id]}]
+            )
+        else:
+            queryset = self.filter(ror_id=ror_id.split("/")[-1])
+        records = list(queryset[:2])
+        return records[0] if len(records) == 1 else None
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:50
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0026_remove_organization_crossref_json"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RORRecord",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ror_id", models.CharField(max_length=16, unique=True)),
+                ("data", models.JSONField()),
+                (
+                    "domains",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "types",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=32),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("content_hash", models.CharField(max_length=64)),
+            ],
+            options={
+                "verbose_name": "ROR record",
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["domains"], name="organizatio_domains_40b34f_gin"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -5,10 +5,14 @@ __license__ = "AGPL v3"
 import datetime
 import hashlib
 from itertools import chain
+import json
 import random
 import string
+from urllib.parse import urlparse
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import F, Q, Count, OuterRef, Subquery, Sum
 from django.db.models.functions import Lower
@@ -39,7 +43,7 @@ from .constants import (
     ORGANIZATION_EVENTS,
     ROLE_KINDS,
 )
-from .managers import OrganizationQuerySet
+from .managers import OrganizationQuerySet, RORRecordQuerySet
 
 from typing import TYPE_CHECKING
 
@@ -502,182 +506,17 @@ class Organization(models.Model):
     def get_balance_info(self):
         """
         Return a dict containing this Organization's expenditure and support history.
+
+        The PubFracs, Publications and Subsidies of this Organization (and its children)
+        are fetched once and the per-year, per-journal report is built in memory,
+        so the number of queries does not grow with the number of years or journals.
         """
-        pubyears = range(int(timezone.now().strftime("%Y")), 2015, -1)
-        rep = {}
-        cumulative_nap = 0
-        cumulative_pubfracs = 0
-        cumulative_expenditures = 0
-        cumulative_self_compensated = 0
-        cumulative_ally_compensated = 0
-        cumulative_uncompensated = 0
-        cumulative_associated_expenditures = 0
-        cumulative_associated_compensated = 0
-        cumulative_associated_uncompensated = 0
-        cumulative_subsidy_income = 0
-        cumulative_reserved = 0
-        cumulative_impact_on_reserves = 0
-        pf = self.pubfracs.all()
-        publications_all = self.get_publications()
-        for year in pubyears:
-            rep[str(year)] = {}
-            subsidy_income = self.total_subsidies_in_year(year)
-            rep[str(year)]["subsidy_income"] = subsidy_income
-            year_nap = 0
-            year_associated_expenditures = 0
-            year_pubfracs = 0
-            year_expenditures = 0
-            year_self_compensated = 0
-            year_ally_compensated = 0
-            year_uncompensated = 0
-            year_associated_compensated = 0
-            year_associated_uncompensated = 0
-            year_reserved = 0
-            rep[str(year)]["expenditures"] = {
-                "per_journal": {},
-            }
-            pfy = pf.filter(publication__publication_date__year=year)
-            publications_year = publications_all.filter(publication_date__year=year)
-            jl1 = [
-                j
-                for j in publications_year.values_list(
-                    "in_journal__doi_label",
-                    flat=True,
-                )
-                if j
-            ]
-            jl2 = [
-                j
-                for j in publications_year.values_list(
-                    "in_issue__in_journal__doi_label",
-                    flat=True,
-                )
-                if j
-            ]
-            jl3 = [
-                j
-                for j in publications_year.values_list(
-                    "in_issue__in_volume__in_journal__doi_label",
-                    flat=True,
-                )
-                if j
-            ]
-            journal_labels = set(jl1 + jl2 + jl3)
-            for journal_label in journal_labels:
-                qs = pfy.filter(publication__doi_label__istartswith=journal_label + ".")
-                journal = get_object_or_404(Journal, doi_label=journal_label)
-                publications_year_journal = self.get_publications(
-                    year=year, journal=journal
-                )
-                nap = publications_year_journal.count()
-                sum_pf = qs.aggregate(Sum("fraction"))["fraction__sum"] or 0
-                costperpaper = journal.cost_per_publication(year)
-                expenditures = int(costperpaper * sum_pf)
-                self_compensated = int(
-                    qs.filter(compensated_by__organization=self).aggregate(
-                        Sum("cf_value")
-                    )["cf_value__sum"]
-                    or 0
-                )
-                ally_compensated = int(
-                    qs.filter(compensated_by__isnull=False)
-                    .exclude(compensated_by__organization=self)
-                    .aggregate(Sum("cf_value"))["cf_value__sum"]
-                    or 0
-                )
-                uncompensated = expenditures - self_compensated - ally_compensated
-                associated_compensated = int(
-                    sum(
-                        p.compensated_expenditures
-                        for p in self.get_publications(year=year, journal=journal)
-                    )
-                )
-                associated_uncompensated = nap * costperpaper - associated_compensated
-                if sum_pf > 0 or associated_uncompensated > 0:
-                    rep[str(year)]["expenditures"]["per_journal"][journal_label] = {
-                        "costperpaper": costperpaper,
-                        "nap": nap,
-                        "pubfracs": float(sum_pf),
-                        "expenditures": expenditures,
-                        "self_compensated": self_compensated,
-                        "ally_compensated": ally_compensated,
-                        "uncompensated": uncompensated,
-                        "associated_expenditures": nap * costperpaper,
-                        "associated_compensated": associated_compensated,
-                        "associated_uncompensated": associated_uncompensated,
-                        "bystander_percentage": (
-                            int(100 * associated_uncompensated / (nap * costperpaper))
-                            if nap * costperpaper > 0
-                            else "N/A"
-                        ),
-                    }
-                year_nap += nap
-                year_pubfracs += float(sum_pf)
-                year_expenditures += expenditures
-                year_self_compensated += self_compensated
-                year_ally_compensated += ally_compensated
-                year_uncompensated += uncompensated
-                year_associated_expenditures += nap * costperpaper
-                year_associated_compensated += associated_compensated
-                year_associated_uncompensated += associated_uncompensated
-            rep[str(year)]["expenditures"]["total"] = {
-                "nap": year_nap,
-                "pubfracs": year_pubfracs,
-                "expenditures": year_expenditures,
-                "self_compensated": year_self_compensated,
-                "ally_compensated": year_ally_compensated,
-                "uncompensated": year_uncompensated,
-                "associated_expenditures": year_associated_expenditures,
-                "associated_compensated": year_associated_compensated,
-                "associated_uncompensated": year_associated_uncompensated,
-                "bystander_percentage": (
-                    int(
-                        100
-                        * year_associated_uncompensated
-                        / year_associated_expenditures
-                    )
-                    if year_associated_expenditures > 0
-                    else "N/A"
-                ),
-            }
-            rep[str(year)]["reserved"] = subsidy_income - year_self_compensated
-            rep[str(year)]["impact_on_reserves"] = subsidy_income - year_expenditures
-            cumulative_nap += year_nap
-            cumulative_pubfracs += year_pubfracs
-            cumulative_expenditures += year_expenditures
-            cumulative_self_compensated += year_self_compensated
-            cumulative_ally_compensated += year_ally_compensated
-            cumulative_uncompensated += year_uncompensated
-            cumulative_associated_expenditures += year_associated_expenditures
-            cumulative_associated_compensated += year_associated_compensated
-            cumulative_associated_uncompensated += year_associated_uncompensated
-            cumulative_subsidy_income += subsidy_income
-            cumulative_impact_on_reserves += subsidy_income - year_expenditures
-            cumulative_reserved += subsidy_income - year_self_compensated
-        rep["cumulative"] = {
-            "nap": cumulative_nap,
-            "pubfracs": cumulative_pubfracs,
-            "expenditures": cumulative_expenditures,
-            "self_compensated": cumulative_self_compensated,
-            "ally_compensated": cumulative_ally_compensated,
-            "uncompensated": cumulative_uncompensated,
-            "associated_expenditures": cumulative_associated_expenditures,
-            "associated_compensated": cumulative_associated_compensated,
-            "associated_uncompensated": cumulative_associated_uncompensated,
-            "bystander_percentage": (
-                int(
-                    100
-                    * cumulative_associated_uncompensated
-                    / cumulative_associated_expenditures
-                )
-                if cumulative_associated_expenditures > 0
-                else "N/A"
-            ),
-            "subsidy_income": cumulative_subsidy_income,
-            "reserved": cumulative_reserved,
-            "impact_on_reserves": cumulative_impact_on_reserves,
-        }
-        return rep
+        from .calculated_fields import OrganizationCalculatedFields
+
+        publication_ids = self.cf_associated_publication_ids.get("all", [])
+        calculator = OrganizationCalculatedFields([self.id], fields=["cf_balance_info"])
+        calculator.load([self], publication_ids=publication_ids)
+        return calculator.balance_info(self.id, publication_ids)
 
 
 ###################################
@@ -819,3 +658,52 @@ class ContactRole(models.Model):
         """
         choices = dict(ROLE_KINDS)
         return ", ".join([choices[value] for index, value in enumerate(self.kind)])
+
+
+class RORRecord(models.Model):
+    """
+    A record of the Research Organization Registry (ROR), as found in its data dump
+    (see `organizations.ror_dump`), serving as local index for the `RORAPIHandler`.
+    """
+
+    ror_id = models.CharField(max_length=16, unique=True)
+    data = models.JSONField()
+    domains = ArrayField(models.CharField(max_length=255), default=list)
+    types = ArrayField(models.CharField(max_length=32), default=list)
+    content_hash = models.CharField(max_length=64)
+
+    objects = RORRecordQuerySet.as_manager()
+
+    class Meta:
+        indexes = [GinIndex(fields=["domains"])]
+        verbose_name = "ROR record"
+
+    def __str__(self):
+        return self.ror_id
+
+    @classmethod
+    def from_data(cls, data: dict, **kwargs):
+        """
+        Return a (new) record for the given ROR data, indexing its domains and types.
+        """
+        domains = set(data.get("domains", []))
+        for link in data.get("links", []):
+            if link.get("type") == "website" and (
+                hostname := urlparse(link.get("value", "")).hostname
+            ):
+                domains.add(hostname.removeprefix("www."))
+        return cls(
+            ror_id=data["id"].split("/")[-1],
+            data=data,
+            domains=sorted(domain.lower() for domain in domains),
+            types=data.get("types", []),
+            content_hash=cls.hash_data(data),
+            **kwargs,
+        )
+
+    @staticmethod
+    def hash_data(data) -> str:
+        """Return a hash of the content of some (ROR) JSON data, for diffing."""
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
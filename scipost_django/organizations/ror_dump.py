@@ -0,0 +1,153 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+import io
+import json
+import zipfile
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from .models import Organization, RORRecord
+from .utils import RORAPIHandler
+
+
+def iter_json_array(file: TextIO, chunk_size: int = 2**20) -> Iterator[Any]:
+    """
+    Yield the objects of the JSON array in the file one at a time,
+    without loading the whole file in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    for chunk in iter(lambda: file.read(chunk_size), ""):
+        buffer += chunk
+        position = 0
+        while True:
+            # Skip the opening bracket, separators and whitespace between items
+            while position < len(buffer) and buffer[position] in "[, \t\r\n":
+                position += 1
+            if position == len(buffer) or buffer[position] == "]":
+                break
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Incomplete item, to be completed by the next chunk
+                break
+            yield item
+        buffer = buffer[position:]
+    if buffer.strip() not in ["", "]"]:
+        raise ValueError(f"Invalid JSON array, ending with {buffer[:100]!r}")
+
+
+def iter_ror_dump(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Yield the records of a ROR data dump, either the zip file as published
+    (see https://ror.readme.io/docs/data-dump) or the (v2 schema) JSON file it contains.
+    """
+    if not zipfile.is_zipfile(path):
+        with open(path, encoding="utf-8") as file:
+            yield from iter_json_array(file)
+        return
+
+    with zipfile.ZipFile(path) as archive:
+        names = [name for name in archive.namelist() if name.endswith(".json")]
+        # Dumps contain the data in both the v1 and v2 schemas
+        name = next((name for name in names if "schema_v2" in name), names[0])
+        with archive.open(name) as file:
+            yield from iter_json_array(io.TextIOWrapper(file, encoding="utf-8"))
+
+
+def update_ror_records(
+    records: Iterable[dict[str, Any]], batch_size: int = 1000
+) -> dict[str, int]:
+    """
+    Update the local ROR index from the given records, creating the new ones and
+    updating only those whose content changed, in batches.
+    """
+    existing = {
+        ror_id: (pk, content_hash)
+        for ror_id, pk, content_hash in RORRecord.objects.values_list(
+            "ror_id", "id", "content_hash"
+        )
+    }
+    counts = {"created": 0, "updated": 0, "unchanged": 0}
+    to_create, to_update = [], []
+
+    def flush():
+        RORRecord.objects.bulk_create(to_create)
+        RORRecord.objects.bulk_update(
+            to_update, ["data", "domains", "types", "content_hash"]
+        )
+        counts["created"] += len(to_create)
+        counts["updated"] += len(to_update)
+        to_create.clear()
+        to_update.clear()
+
+    for data in records:
+        record = RORRecord.from_data(data)
+        if record.ror_id not in existing:
+            to_create.append(record)
+            # Not created twice if duplicated within the dump
+            existing[record.ror_id] = (None, record.content_hash)
+        elif existing[record.ror_id][1] == record.content_hash:
+            counts["unchanged"] += 1
+        elif (pk := existing[record.ror_id][0]) is not None:
+            record.id = pk
+            to_update.append(record)
+        if len(to_create) + len(to_update) >= batch_size:
+            flush()
+    flush()
+    return counts
+
+
+def update_organizations_ror_json(
+    batch_size: int = 500,
+    fetch_missing: Callable[[str], dict[str, Any]] | None = None,
+) -> dict[str, int]:
+    """
+    Update the `ror_json` of the Organizations from the local ROR index,
+    saving only those whose content changed, in batches.
+
+    The ROR IDs missing from the index are fetched with `fetch_missing` if given
+    (e.g. `RORAPIHandler().fetch`), else counted as missing.
+    """
+    counts = {"updated": 0, "unchanged": 0, "missing": 0, "without_id": 0}
+
+    def update_batch(organizations):
+        ror_ids = {org.ror_json["id"].split("/")[-1] for org in organizations}
+        records = RORRecord.objects.in_bulk(ror_ids, field_name="ror_id")
+        to_update = []
+        for org in organizations:
+            ror_id = org.ror_json["id"]
+            record = records.get(ror_id.split("/")[-1])
+            if record is None and ror_id.startswith("grid"):
+                record = RORRecord.objects.get_record(ror_id)
+            if record is not None:
+                ror_json = RORAPIHandler._map_ror_to_organization(record.data)
+            elif fetch_missing is not None:
+                ror_json = fetch_missing(ror_id)
+            else:
+                ror_json = None
+            if not ror_json:
+                counts["missing"] += 1
+                continue
+            if RORRecord.hash_data(ror_json) == RORRecord.hash_data(org.ror_json):
+                counts["unchanged"] += 1
+            else:
+                org.ror_json = ror_json
+                to_update.append(org)
+        Organization.objects.bulk_update(to_update, ["ror_json"])
+        counts["updated"] += len(to_update)
+
+    batch = []
+    for org in Organization.objects.only("id", "ror_json").iterator(
+        chunk_size=batch_size
+    ):
+        if not (org.ror_json or {}).get("id"):
+            counts["without_id"] += 1
+            continue
+        batch.append(org)
+        if len(batch) >= batch_size:
+            update_batch(batch)
+            batch = []
+    update_batch(batch)
+    return counts
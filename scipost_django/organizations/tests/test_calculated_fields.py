@@ -0,0 +1,204 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from common.helpers.test import create_publication
+from finances.constants import SUBSIDY_RECEIVED, SUBSIDY_TYPE_SPONSORSHIPAGREEMENT
+from finances.models import PubFrac, Subsidy
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from ontology.factories import AcademicFieldFactory
+from organizations.calculated_fields import (
+    OrganizationCalculatedFields,
+    get_recently_touched_organization_ids,
+)
+from organizations.factories import OrganizationFactory
+from organizations.models import Organization
+
+
+class OrganizationCalculatedFieldsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.year = timezone.now().year
+        cls.journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS,
+            cost_info={"default": 1000},
+            college__acad_field=AcademicFieldFactory(),
+        )
+        cls.parent = OrganizationFactory(name="Parent", acronym="P")
+        cls.child = OrganizationFactory(name="Child", acronym="C", parent=cls.parent)
+        cls.other = OrganizationFactory(name="Other", acronym="O")
+
+        date = datetime.date(cls.year, 1, 15)
+        cls.pub_child = create_publication(cls.journal, 1, [[cls.child]], date)
+        cls.pub_shared = create_publication(
+            cls.journal, 2, [[cls.parent], [cls.other]], date
+        )
+        for pub in (cls.pub_child, cls.pub_shared):
+            pub.recalculate_pubfracs()
+
+        cls.subsidy = Subsidy.objects.create(
+            organization=cls.parent,
+            subsidy_type=SUBSIDY_TYPE_SPONSORSHIPAGREEMENT,
+            description="Test",
+            amount=3000,
+            status=SUBSIDY_RECEIVED,
+            date_from=datetime.date(cls.year, 1, 1),
+            date_until=datetime.date(cls.year, 12, 31),
+        )
+        PubFrac.objects.filter(
+            publication=cls.pub_shared, organization=cls.parent
+        ).update(compensated_by=cls.subsidy)
+
+    def test_associated_publication_ids(self):
+        OrganizationCalculatedFields().update()
+        parent = Organization.objects.get(pk=self.parent.pk)
+        ids = parent.cf_associated_publication_ids
+        self.assertEqual(ids["via_author_affiliation"], [self.pub_shared.id])
+        self.assertEqual(ids["via_child_author_affiliation"], [self.pub_child.id])
+        self.assertEqual(ids["via_grant"], [])
+        self.assertCountEqual(ids["all"], [self.pub_child.id, self.pub_shared.id])
+        self.assertEqual(parent.cf_nr_associated_publications, 2)
+
+    def test_expenditure_for_publication(self):
+        OrganizationCalculatedFields().update()
+        parent = Organization.objects.get(pk=self.parent.pk)
+        self.assertEqual(
+            parent.cf_expenditure_for_publication[self.pub_shared.doi_label],
+            {
+                "millipubfrac": 500,
+                "unitcost": 1000,
+                "expenditure": 500,
+                "message": "",
+            },
+        )
+        self.assertEqual(
+            parent.cf_expenditure_for_publication[self.pub_child.doi_label],
+            {
+                "millipubfrac": 0,
+                "unitcost": 1000,
+                "expenditure": 0,
+                "message": "as parent (ascribed to Child)",
+            },
+        )
+
+    def test_balance_info(self):
+        OrganizationCalculatedFields().update()
+        parent = Organization.objects.get(pk=self.parent.pk)
+        year_info = parent.cf_balance_info[str(self.year)]
+        self.assertEqual(year_info["subsidy_income"], 3000)
+        self.assertEqual(
+            year_info["expenditures"]["per_journal"][self.journal.doi_label],
+            {
+                "costperpaper": 1000,
+                "nap": 2,
+                "pubfracs": 0.5,
+                "expenditures": 500,
+                "self_compensated": 500,
+                "ally_compensated": 0,
+                "uncompensated": 0,
+                "associated_expenditures": 2000,
+                "associated_compensated": 500,
+                "associated_uncompensated": 1500,
+                "bystander_percentage": 75,
+            },
+        )
+        self.assertEqual(year_info["reserved"], 2500)
+        self.assertEqual(parent.cf_balance_info["cumulative"]["nap"], 2)
+
+    def test_totals_per_organization(self):
+        OrganizationCalculatedFields().update()
+        # Child authored the first publication alone, Parent and Other share the
+        # second one, of which the Parent's half is compensated by its subsidy.
+        expected = {
+            self.child.id: {
+                "nap": 1,
+                "pubfracs": 1.0,
+                "expenditures": 1000,
+                "self_compensated": 0,
+                "uncompensated": 1000,
+                "associated_expenditures": 1000,
+                "associated_compensated": 0,
+                "subsidy_income": 0,
+                "reserved": 0,
+            },
+            self.other.id: {
+                "nap": 1,
+                "pubfracs": 0.5,
+                "expenditures": 500,
+                "self_compensated": 0,
+                "uncompensated": 500,
+                "associated_expenditures": 1000,
+                "associated_compensated": 500,
+                "subsidy_income": 0,
+                "reserved": 0,
+            },
+            self.parent.id: {
+                "nap": 2,
+                "pubfracs": 0.5,
+                "expenditures": 500,
+                "self_compensated": 500,
+                "uncompensated": 0,
+                "associated_expenditures": 2000,
+                "associated_compensated": 500,
+                "subsidy_income": 3000,
+                "reserved": 2500,
+            },
+        }
+        for org in Organization.objects.all():
+            year_info = org.cf_balance_info[str(self.year)]
+            totals = year_info["expenditures"]["total"] | {
+                "subsidy_income": year_info["subsidy_income"],
+                "reserved": year_info["reserved"],
+            }
+            for key, value in expected[org.id].items():
+                self.assertEqual(totals[key], value, f"{org}: {key}")
+                self.assertEqual(org.cf_balance_info["cumulative"][key], value)
+            # Nothing happened the year before
+            previous = org.cf_balance_info[str(self.year - 1)]
+            self.assertEqual(previous["expenditures"]["total"]["nap"], 0)
+            self.assertEqual(previous["subsidy_income"], 0)
+            self.assertEqual(org.cf_nr_associated_publications, expected[org.id]["nap"])
+            self.assertEqual(
+                sum(
+                    item["expenditure"]
+                    for item in org.cf_expenditure_for_publication.values()
+                ),
+                expected[org.id]["expenditures"],
+            )
+
+    def test_update_restricted_to_organization_ids(self):
+        nr_updated = OrganizationCalculatedFields([self.child.id]).update()
+        self.assertEqual(nr_updated, 1)
+        self.assertEqual(
+            Organization.objects.get(pk=self.child.pk).cf_nr_associated_publications, 1
+        )
+        self.assertIsNone(
+            Organization.objects.get(pk=self.other.pk).cf_nr_associated_publications
+        )
+
+    def test_query_count_independent_of_organization_number(self):
+        engine = OrganizationCalculatedFields()
+        with self.assertNumQueries(11):
+            engine.update()
+        for i in range(5):
+            OrganizationFactory(name=f"Extra {i}", acronym=f"E{i}", parent=self.other)
+        engine = OrganizationCalculatedFields()
+        with self.assertNumQueries(11):
+            engine.update()
+
+    def test_recently_touched_organization_ids(self):
+        touched = get_recently_touched_organization_ids(
+            timezone.now() - datetime.timedelta(hours=1)
+        )
+        self.assertEqual(touched, {self.parent.id, self.child.id, self.other.id})
+        self.assertEqual(
+            get_recently_touched_organization_ids(
+                timezone.now() + datetime.timedelta(hours=1)
+            ),
+            {self.parent.id},  # holder of a current subsidy
+        )
@@ -0,0 +1,79 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from common.helpers.test import create_publication
+from finances.constants import SUBSIDY_RECEIVED, SUBSIDY_TYPE_SPONSORSHIPAGREEMENT
+from finances.models import PubFrac, Subsidy
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from ontology.factories import AcademicFieldFactory
+from organizations.factories import OrganizationFactory
+
+
+class OrganizationBalanceInfoTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.year = timezone.now().year
+        cls.journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS,
+            cost_info={"default": 1000},
+            college__acad_field=AcademicFieldFactory(),
+        )
+        cls.organization = OrganizationFactory(name="Org", acronym="O")
+        cls.subsidy = Subsidy.objects.create(
+            organization=cls.organization,
+            subsidy_type=SUBSIDY_TYPE_SPONSORSHIPAGREEMENT,
+            description="Test",
+            amount=1000,
+            status=SUBSIDY_RECEIVED,
+            date_from=datetime.date(cls.year, 1, 1),
+            date_until=datetime.date(cls.year, 12, 31),
+        )
+        cls.paper_nr = 0
+
+    def add_publication(self, year):
+        self.paper_nr += 1
+        publication = create_publication(
+            self.journal,
+            self.paper_nr,
+            [[self.organization]],
+            datetime.date(year, 3, 1),
+        )
+        publication.recalculate_pubfracs()
+        self.organization.update_cf_associated_publication_ids()
+        return publication
+
+    def test_balance_info(self):
+        publication = self.add_publication(self.year)
+        PubFrac.objects.filter(publication=publication).update(
+            compensated_by=self.subsidy, cf_value=1000
+        )
+        balance_info = self.organization.get_balance_info()
+        year_info = balance_info[str(self.year)]
+        self.assertEqual(year_info["subsidy_income"], 1000)
+        self.assertEqual(
+            year_info["expenditures"]["per_journal"][self.journal.doi_label][
+                "self_compensated"
+            ],
+            1000,
+        )
+        self.assertEqual(year_info["expenditures"]["total"]["nap"], 1)
+        self.assertEqual(balance_info["cumulative"]["nap"], 1)
+
+    def test_balance_info_number_of_queries(self):
+        """The number of queries does not depend on the publication history."""
+        self.add_publication(self.year)
+        with self.assertNumQueries(6):
+            self.organization.get_balance_info()
+
+        for year in range(self.year - 4, self.year):
+            self.add_publication(year)
+        self.add_publication(self.year)
+        with self.assertNumQueries(6):
+            balance_info = self.organization.get_balance_info()
+        self.assertEqual(balance_info["cumulative"]["nap"], 6)
@@ -0,0 +1,131 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import io
+import json
+import os
+import tempfile
+import zipfile
+from unittest import mock
+
+from django.test import TestCase
+
+from organizations.factories import OrganizationFactory
+from organizations.models import Organization, RORRecord
+from organizations.ror_dump import (
+    iter_json_array,
+    iter_ror_dump,
+    update_organizations_ror_json,
+    update_ror_records,
+)
+from organizations.utils import RORAPIHandler
+
+
+def ror_record(
+    ror_id, name, domain, types=("education",), grid_id=None, status="active"
+):
+    return {
+        "id": f"https://ror.org/{ror_id}",
+        "status": status,
+        "names": [{"value": name, "types": ["ror_display", "label"], "lang": "en"}],
+        "domains": [domain],
+        "links": [{"type": "website", "value": f"https://www.{domain}/en"}],
+        "types": list(types),
+        "external_ids": (
+            [{"type": "grid", "all": [grid_id], "preferred": grid_id}]
+            if grid_id
+            else []
+        ),
+        "locations": [{"geonames_details": {"country_code": "NL", "name": "Town"}}],
+    }
+
+
+RECORDS = [
+    ror_record("04dkp9463", "University of Amsterdam", "uva.nl", grid_id="grid.7177.6"),
+    ror_record("027bh9e22", "Leiden University", "leidenuniv.nl"),
+    ror_record("01bnjb948", "Some Company", "company.nl", types=["company"]),
+]
+
+
+class RORDumpTest(TestCase):
+    def write_dump(self, records):
+        path = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), "ror.zip")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("v1.0-ror-data.json", "[]")
+            archive.writestr("v1.0-ror-data_schema_v2.json", json.dumps(records))
+        return path
+
+    def test_iter_json_array(self):
+        items = [{"id": i, "text": "[{,}]" * i} for i in range(20)]
+        file = io.StringIO(json.dumps(items, indent=2))
+        self.assertEqual(list(iter_json_array(file, chunk_size=7)), items)
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.StringIO('[{"id": 1}, {"id": '), chunk_size=7))
+
+    def test_update_ror_records(self):
+        path = self.write_dump(RECORDS)
+        self.assertEqual(list(iter_ror_dump(path)), RECORDS)
+        self.assertEqual(
+            update_ror_records(iter_ror_dump(path), batch_size=2),
+            {"created": 3, "updated": 0, "unchanged": 0},
+        )
+        record = RORRecord.objects.get(ror_id="04dkp9463")
+        self.assertEqual(record.domains, ["uva.nl"])
+
+        changed = RECORDS[:2] + [ror_record("01bnjb948", "Renamed", "company.com")]
+        with self.assertNumQueries(2):
+            # The existing hashes, then the changed record
+            counts = update_ror_records(changed)
+        self.assertEqual(counts, {"created": 0, "updated": 1, "unchanged": 2})
+        self.assertEqual(
+            RORRecord.objects.get(ror_id="01bnjb948").domains, ["company.com"]
+        )
+
+    def test_update_organizations_ror_json(self):
+        update_ror_records(RECORDS)
+        unchanged = OrganizationFactory(
+            ror_json=RORAPIHandler._map_ror_to_organization(RECORDS[1])
+        )
+        outdated = OrganizationFactory(ror_json={"id": "04dkp9463", "names": []})
+        grid = OrganizationFactory(ror_json={"id": "grid.7177.6"})
+        missing = OrganizationFactory(ror_json={"id": "0000000000"})
+        without_id = OrganizationFactory(ror_json={})
+
+        counts = update_organizations_ror_json(batch_size=2)
+        self.assertEqual(
+            counts, {"updated": 2, "unchanged": 1, "missing": 1, "without_id": 1}
+        )
+        for org in [outdated, grid]:
+            org.refresh_from_db()
+            self.assertEqual(org.ror_json["id"], "04dkp9463")
+            self.assertEqual(org.ror_json["ror_link"], "https://ror.org/04dkp9463")
+        for org in [unchanged, missing, without_id]:
+            self.assertEqual(Organization.objects.get(pk=org.pk).ror_json, org.ror_json)
+
+        fetch_missing = mock.Mock(return_value={"id": "0000000000", "names": []})
+        counts = update_organizations_ror_json(fetch_missing=fetch_missing)
+        fetch_missing.assert_called_once_with("0000000000")
+        self.assertEqual(counts["updated"], 1)
+
+    @mock.patch("organizations.utils.requests")
+    def test_handler_uses_local_index(self, mock_requests):
+        inactive = ror_record(
+            "00f54p054", "Former Institute", "uva.nl", status="inactive"
+        )
+        update_ror_records(RECORDS + [inactive])
+        self.assertEqual(
+            RORAPIHandler.organization_from_ror_id("04dkp9463")["name"],
+            "University of Amsterdam",
+        )
+        self.assertEqual(
+            RORAPIHandler().fetch("grid.7177.6")["ror_link"],
+            "https://ror.org/04dkp9463",
+        )
+        self.assertEqual(
+            RORAPIHandler.query_for_domain("science.uva.nl"),
+            ["https://ror.org/04dkp9463"],
+        )
+        self.assertEqual(
+            RORAPIHandler.query_for_domain("company.nl", exclude_private=True), []
+        )
+        mock_requests.get.assert_not_called()
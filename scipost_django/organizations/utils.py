@@ -26,7 +26,15 @@ class RORAPIHandler:
         """
         Query the ROR API for an organization with the given ROR ID
         and return the JSON result.
+
+        The record is served from the local index of the ROR data dump
+        (see `organizations.ror_dump`) if it is found there.
         """
+        from .models import RORRecord
+
+        if record := RORRecord.objects.get_record(ror_id):
+            return self._map_ror_to_organization(record.data)
+
         # For old grid IDs, use a query instead
         # and only return a result if there is exactly one
         if ror_id.startswith("grid"):
@@ -55,7 +63,20 @@ class RORAPIHandler:
 
         :param domain: The domain to query for.
         :param exclude_private: If True, exclude results of private organizations (e.g., companies) from the results.
+
+        The local index of the ROR data dump is queried instead if it is populated.
         """
+        from .models import RORRecord
+
+        if RORRecord.objects.exists():
+            return list(
+                RORRecord.objects.matching_domain(
+                    domain, exclude_private=exclude_private
+                )
+                .order_by("ror_id")
+                .values_list("data__id", flat=True)
+            )
+
         # URL-encode domain to make it safe for use in a URL
         domain = quote(domain)
 
@@ -4,7 +4,6 @@ from datetime import date, datetime
 from nameparser import HumanName
 
 from django.utils.http import urlencode
-import requests
 
 from .utils import Person, QueryFragment, format_person_name
 from .server import BasePreprintServer, PreprintServer
@@ -64,8 +63,7 @@ class ArxivServer(BasePreprintServer):
 
     @classmethod
     def request(cls, query: str, **kwargs: Any) -> feedparser.FeedParserDict:
-        cls._limit_rate()
-        response = requests.get(f"{cls.api_url}/query?{query}")
+        response = cls.send("GET", f"{cls.api_url}/query?{query}")
         response.raise_for_status()
         return feedparser.parse(response.text)
 
@@ -93,7 +91,7 @@ class ArxivServer(BasePreprintServer):
                     f"submittedDate:[{published_after_str} TO {today_str}]"
                 )
 
-        results = cls.search(str(query))
+        results = cls.search(str(query), max_results=kwargs.get("max_results", 20))
         return [
             parsed_work
             for entry in results.entries
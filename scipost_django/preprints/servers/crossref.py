@@ -1,5 +1,4 @@
 from datetime import date
-import requests
 from nameparser import HumanName
 
 from django.utils.datastructures import MultiValueDict
@@ -53,6 +52,15 @@ class CrossrefQuery(BaseQuery):
         self.url_params.update({"sort": key.lstrip("-"), "order": ordering})
         return self
 
+    def cursor(self, cursor: str = "*", rows: int = 1000):
+        """
+        Deep paging through all results, `rows` at a time, starting with
+        the `*` cursor and continuing with each response's `next-cursor`.
+        """
+        self.url_params["cursor"] = cursor
+        self.url_params["rows"] = rows
+        return self
+
     def __getitem__(self, s: slice):
         offset = s.start or 0
         self.url_params.update({"offset": offset, "rows": s.stop - offset})
@@ -61,7 +69,7 @@ class CrossrefQuery(BaseQuery):
     @property
     def url(self):
         url_params_lists_joined = {
-            key: ",".join(url_param_values)
+            key: ",".join(map(str, url_param_values))
             for key, url_param_values in self.url_params.lists()
         }
         encoded_params = urlencode(url_params_lists_joined)
@@ -73,6 +81,7 @@ class CrossrefServer(BasePreprintServer):
     base_url = "https://www.crossref.org"
     api_url = "https://api.crossref.org"
     query_type = CrossrefQuery
+    headers = {"User-Agent": CROSSREF_USER_AGENT}
 
     @classmethod
     def identifier_to_url(cls, identifier: str) -> str:
@@ -88,6 +97,7 @@ class CrossrefServer(BasePreprintServer):
 
         # Limit query to only information used in parse works
         query = query.select("DOI", "title", "author", "published-online", "deposited")
+        query = query[: kwargs.get("max_results", 20)]
 
         if published_after := kwargs.get("published_after"):
             if isinstance(published_after, str):
@@ -114,10 +124,8 @@ class CrossrefServer(BasePreprintServer):
     @classmethod
     @override
     def request(cls, query: "CrossrefQuery", **kwargs: Any) -> dict[str, Any]:
-        cls._limit_rate()
-        response = requests.get(
-            f"{cls.api_url}/{query.url}&mailto={CROSSREF_MAILTO_ADDRESS}",
-            headers={"User-Agent": CROSSREF_USER_AGENT},
+        response = cls.send(
+            "GET", f"{cls.api_url}/{query.url}&mailto={CROSSREF_MAILTO_ADDRESS}"
         )
         response.raise_for_status()
         return response.json()
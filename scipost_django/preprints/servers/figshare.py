@@ -1,4 +1,3 @@
-import requests
 from nameparser import HumanName
 
 from .utils import QueryFragment, format_person_name, Person
@@ -27,7 +26,7 @@ class FigshareServer(BasePreprintServer):
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
         url = f"{cls.api_url}/{domain}/search"
-        response = requests.post(url, json={"search_for": text, **kwargs})
+        response = cls.send("POST", url, json={"search_for": text, **kwargs})
         if not response.ok:
             return []
 
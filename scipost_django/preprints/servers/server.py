@@ -4,9 +4,17 @@ __license__ = "AGPL v3"
 
 from abc import ABC, abstractmethod
 from enum import Enum
+import logging
 import time
 import requests
 
+from common.utils.http import (
+    RETRY_STATUSES,
+    SharedRateLimiter,
+    pooled_session,
+    retry_delay,
+)
+
 from .utils import JSONResponse, Person
 
 from typing import Any, Self, TYPE_CHECKING
@@ -14,6 +22,8 @@ from typing import Any, Self, TYPE_CHECKING
 if TYPE_CHECKING:
     from ethics.models import CoauthoredWork
 
+logger = logging.getLogger(__name__)
+
 
 class BaseQuery(ABC):
     @abstractmethod
@@ -32,28 +42,102 @@ class BasePreprintServer(ABC):
     query_type: type[BaseQuery]
 
     MAX_REQUESTS_PER_SECOND: float | None = None
-    _last_request_timestamp: float | None = None
+    REQUEST_TIMEOUT: float = 30
+    MAX_RETRIES: int = 3
+    RETRY_BACKOFF_FACTOR: float = 0.5
+    headers: dict[str, str] = {}
 
     @classmethod
     @abstractmethod
     def identifier_to_url(cls, identifier: str) -> str: ...
 
+    @classmethod
+    def rate_limiter(cls) -> SharedRateLimiter:
+        """
+        The rate limiter of the server, shared by all workers through the cache
+        such that parallel tasks do not exceed the server's limits together.
+        """
+        if "_rate_limiter" not in cls.__dict__:
+            cls._rate_limiter = SharedRateLimiter(
+                f"preprint_server:{cls.name}", cls.MAX_REQUESTS_PER_SECOND
+            )
+        return cls._rate_limiter
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """
+        The HTTP session of the server (per process), reusing its connections
+        and retrying failed connections with backoff. Throttled or failing
+        responses are retried by `send`, within the rate limit.
+        """
+        if "_session" not in cls.__dict__:
+            cls._session = pooled_session(headers=cls.headers, retry_statuses=())
+        return cls._session
+
     @classmethod
     def _limit_rate(cls) -> None:
-        if cls.MAX_REQUESTS_PER_SECOND is None:
-            return
+        cls.rate_limiter().acquire()
 
-        now = time.monotonic()
-        if cls._last_request_timestamp is not None:
-            elapsed = now - cls._last_request_timestamp
-            wait_time = max(0, 1 / cls.MAX_REQUESTS_PER_SECOND - elapsed)
-            time.sleep(wait_time)
-        cls._last_request_timestamp = time.monotonic()
+    @classmethod
+    def send(cls, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a rate-limited request to the server over its session,
+        retrying throttled or failing responses with exponential backoff
+        (honouring Retry-After headers), each attempt within the rate limit.
+        """
+        kwargs.setdefault("timeout", cls.REQUEST_TIMEOUT)
+        for attempt in range(cls.MAX_RETRIES):
+            response = cls._send_once(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUSES:
+                return response
+            delay = retry_delay(response, attempt, cls.RETRY_BACKOFF_FACTOR)
+            logger.info(
+                "%s %s %s: %s, retrying in %.1fs",
+                cls.name,
+                method,
+                url,
+                response.status_code,
+                delay,
+            )
+            time.sleep(delay)
+        return cls._send_once(method, url, **kwargs)
 
     @classmethod
-    def request(cls, query: BaseQuery, **kwargs: Any) -> JSONResponse:
+    def _send_once(cls, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a single rate-limited request to the server over its session,
+        recording the number of requests, failures and the latency.
+        """
         cls._limit_rate()
-        response = requests.get(f"{cls.api_url}/{query.url}")
+        start = time.monotonic()
+        try:
+            response = cls.session().request(method, url, **kwargs)
+        except requests.RequestException:
+            cls._record_request(time.monotonic() - start, failed=True)
+            raise
+        latency = time.monotonic() - start
+        cls._record_request(latency, failed=not response.ok)
+        logger.debug(
+            "%s %s %s: %s in %.3fs",
+            cls.name,
+            method,
+            url,
+            response.status_code,
+            latency,
+        )
+        return response
+
+    @classmethod
+    def _record_request(cls, latency: float, failed: bool) -> None:
+        if "request_metrics" not in cls.__dict__:
+            cls.request_metrics = {"nr_requests": 0, "nr_failed": 0, "latency": 0.0}
+        cls.request_metrics["nr_requests"] += 1
+        cls.request_metrics["nr_failed"] += failed
+        cls.request_metrics["latency"] += latency
+
+    @classmethod
+    def request(cls, query: BaseQuery, **kwargs: Any) -> JSONResponse:
+        response = cls.send("GET", f"{cls.api_url}/{query.url}")
         response.raise_for_status()
         return response.json()
 
@@ -67,6 +151,11 @@ class BasePreprintServer(ABC):
     def parse_work(cls, data: dict[str, Any]) -> "CoauthoredWork | None":
         raise NotImplementedError("Subclasses must implement this method")
 
+    @classmethod
+    def find_works_of(cls, person: Person, **kwargs: Any) -> list["CoauthoredWork"]:
+        """Find the works of a single person, most relevant first."""
+        return cls.find_common_works_between(person, **kwargs)
+
     @classmethod
     @abstractmethod
     def find_common_works_between(
@@ -0,0 +1,76 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+from unittest import mock
+
+import requests
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from common.helpers.test import stub_http_server
+from common.utils.http import SharedRateLimiter, retry_delay
+
+from ..servers.crossref import CrossrefQuery, CrossrefServer
+
+
+class SharedRateLimiterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @mock.patch("common.utils.http.time")
+    def test_slots_are_shared(self, mock_time):
+        mock_time.time.return_value = 100.2
+        # Limiters of different workers, sharing the cache
+        limiters = [SharedRateLimiter("test", rate=1) for _ in range(3)]
+        for limiter in limiters:
+            limiter.acquire()
+        # The first call is immediate, the others wait for the next slots
+        self.assertEqual(mock_time.sleep.call_count, 2)
+        self.assertAlmostEqual(mock_time.sleep.call_args_list[0].args[0], 0.8)
+        self.assertAlmostEqual(mock_time.sleep.call_args_list[1].args[0], 1.8)
+
+        # Other keys are limited independently
+        SharedRateLimiter("other", rate=1).acquire()
+        self.assertEqual(mock_time.sleep.call_count, 2)
+
+
+class StubCrossrefServer(CrossrefServer):
+    MAX_REQUESTS_PER_SECOND = None
+
+
+class PreprintServerRequestTest(TestCase):
+    @mock.patch("preprints.servers.server.time.sleep")
+    def test_request_retries(self, mock_sleep):
+        responses = iter(
+            [
+                (429, "Too many requests"),
+                (503, "Service unavailable"),
+                (200, '{"message": {}}'),
+            ]
+        )
+        with (
+            stub_http_server(lambda method, path: next(responses)) as server,
+            mock.patch.object(StubCrossrefServer, "api_url", server.url),
+            mock.patch.object(StubCrossrefServer, "_limit_rate") as mock_limit_rate,
+        ):
+            data = StubCrossrefServer.request(CrossrefQuery().query("test"))
+        self.assertEqual(data, {"message": {}})
+        self.assertEqual(len(server.requests), 3)
+        # Each attempt is rate-limited, backing off in between
+        self.assertEqual(mock_limit_rate.call_count, 3)
+        self.assertEqual(
+            [call.args[0] for call in mock_sleep.call_args_list], [0.5, 1.0]
+        )
+        self.assertEqual(StubCrossrefServer.request_metrics["nr_requests"], 3)
+        self.assertEqual(StubCrossrefServer.request_metrics["nr_failed"], 2)
+        self.assertEqual(
+            StubCrossrefServer.session().headers["User-Agent"],
+            CrossrefServer.headers["User-Agent"],
+        )
+
+    def test_retry_delay(self):
+        response = requests.Response()
+        self.assertEqual(retry_delay(response, attempt=2), 2.0)
+        response.headers["Retry-After"] = "10"
+        self.assertEqual(retry_delay(response, attempt=2), 10)
@@ -5,14 +5,48 @@ __license__ = "AGPL v3"
 from django.core.management.base import BaseCommand
 
 from journals.models import Publication
-from journals.services import update_citedby
+from journals.services import CitedByHarvester
 
 
 class Command(BaseCommand):
-    help = "Updates all Cited-by data for all Publications"
+    help = (
+        "Updates the Cited-by data for all Publications, "
+        "recent and least recently updated Publications first"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Only update the given number of Publications (by priority)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Number of concurrent queries to Crossref",
+        )
+        parser.add_argument(
+            "--max_requests_per_second",
+            type=float,
+            default=10,
+            help="Maximal rate of queries to Crossref",
+        )
 
     def handle(self, *args, **kwargs):
+        harvester = CitedByHarvester(
+            max_workers=kwargs["workers"],
+            max_requests_per_second=kwargs["max_requests_per_second"],
+        )
         publications = Publication.objects.published()
-
-        for publication in publications:
-            update_citedby(publication.doi_label)
+        if kwargs["limit"]:
+            publications = Publication.objects.filter(
+                id__in=harvester.prioritized(publications).values("id")[
+                    : kwargs["limit"]
+                ]
+            )
+        harvester.harvest(publications)
+        self.stdout.write(
+            f"Updated {harvester.nr_updated}, unchanged {harvester.nr_unchanged}, "
+            f"failed {harvester.nr_failed} Publications."
+        )
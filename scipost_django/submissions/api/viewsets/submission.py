@@ -2,10 +2,13 @@ __copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
 __license__ = "AGPL v3"
 
 
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import AllowAny
 
-from api.viewsets.mixins import FilteringOptionsActionMixin
+from api.views.search import FullTextSearchFilter
+from api.viewsets.mixins import CursorPaginationMixin, FilteringOptionsActionMixin
 
 from submissions.models import Submission
 from submissions.api.filtersets import (
@@ -19,7 +22,7 @@ from submissions.api.serializers import (
 
 
 class SubmissionPublicAPIViewSet(
-    FilteringOptionsActionMixin, viewsets.ReadOnlyModelViewSet
+    CursorPaginationMixin, FilteringOptionsActionMixin, viewsets.ReadOnlyModelViewSet
 ):
     queryset = Submission.objects.public()
     permission_classes = [
@@ -28,6 +31,7 @@ class SubmissionPublicAPIViewSet(
     serializer_class = SubmissionPublicSerializer
     search_fields = ["title", "author_list", "abstract"]
     ordering_fields = ["submission_date", "latest_activity"]
+    cursor_ordering = ("-submission_date", "-id")
     filterset_class = SubmissionPublicAPIFilterSet
     default_filtering_fields = [
         "title__icontains",
@@ -85,6 +89,7 @@ class SubmissionPublicSearchAPIViewSet(
         AllowAny,
     ]
     serializer_class = SubmissionPublicSearchSerializer
+    filter_backends = [FullTextSearchFilter, OrderingFilter, DjangoFilterBackend]
     search_fields = ["title", "author_list", "abstract"]
     ordering_fields = ["submission_date", "latest_activity"]
     filterset_class = SubmissionPublicSearchAPIFilterSet
@@ -3,7 +3,66 @@ __license__ = "AGPL v3"
 
 
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 
 
 class SubmissionsConfig(AppConfig):
     name = "submissions"
+
+    def ready(self):
+        super().ready()
+
+        from . import signals
+        from comments.models import Comment
+        from ethics.models import ConflictOfInterest
+        from submissions.models import (
+            EditorialAssignment,
+            EICRecommendation,
+            RefereeInvitation,
+            Report,
+            Submission,
+            SubmissionAuthorProfile,
+        )
+
+        m2m_changed.connect(
+            signals.m2m_changed_refresh_pool_visibility_of_fellows,
+            sender=Submission.fellows.through,
+        )
+        for authors in [
+            Submission.authors,
+            Submission.authors_claims,
+            Submission.authors_false_claims,
+        ]:
+            m2m_changed.connect(
+                signals.m2m_changed_refresh_pool_visibility_of_authors,
+                sender=authors.through,
+            )
+        pre_save.connect(signals.detect_author_list_change, sender=Submission)
+        post_save.connect(
+            signals.refresh_pool_visibility_of_author_list, sender=Submission
+        )
+        for signal in [post_save, post_delete]:
+            signal.connect(
+                signals.refresh_pool_visibility_of_author_profile,
+                sender=SubmissionAuthorProfile,
+            )
+            signal.connect(
+                signals.refresh_pool_visibility_of_conflict_of_interest,
+                sender=ConflictOfInterest,
+            )
+
+        post_save.connect(
+            signals.refresh_required_actions_of_submission, sender=Submission
+        )
+        for signal in [post_save, post_delete]:
+            for model in [
+                EditorialAssignment,
+                EICRecommendation,
+                RefereeInvitation,
+                Report,
+            ]:
+                signal.connect(
+                    signals.refresh_required_actions_of_submission_object,
+                    sender=model,
+                )
+            signal.connect(signals.refresh_required_actions_of_comment, sender=Comment)
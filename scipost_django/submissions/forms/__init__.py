@@ -204,9 +204,9 @@ class PortalSubmissionSearchForm(CrispyFormMixin, SearchForm[Submission]):
         if proceedings := self.cleaned_data.get("proceedings"):
             queryset = queryset.filter(proceedings=proceedings)
         if author := self.cleaned_data.get("author"):
-            queryset = queryset.filter(author_list__icontains=author)
+            queryset = queryset.search(author, fields=["author_list"])
         if title := self.cleaned_data.get("title"):
-            queryset = queryset.filter(title__icontains=title)
+            queryset = queryset.search(title, fields=["title"])
         if identifier := self.cleaned_data.get("identifier"):
             queryset = queryset.filter(
                 preprint__identifier_w_vn_nr__icontains=identifier
@@ -550,9 +550,9 @@ class SubmissionPoolSearchForm(CrispyFormMixin, SearchForm[Submission]):
         if proceedings := self.cleaned_data.get("proceedings"):
             queryset = queryset.filter(proceedings=proceedings)
         if author := self.cleaned_data.get("author"):
-            queryset = queryset.filter(author_list__unaccent__icontains=author)
+            queryset = queryset.search(author, fields=["author_list"])
         if title := self.cleaned_data.get("title"):
-            queryset = queryset.filter(title__unaccent__icontains=title)
+            queryset = queryset.search(title, fields=["title"])
         if identifier := self.cleaned_data.get("identifier"):
             queryset = queryset.filter(
                 preprint__identifier_w_vn_nr__icontains=identifier
@@ -0,0 +1,20 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.core.management.base import BaseCommand
+
+from ...models import PoolVisibility
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the visibility of all Submissions in the pools of the Fellowships, "
+        "e.g. for conflicts of interest which expired since the last update."
+    )
+
+    def handle(self, *args, **kwargs):
+        nr_visible = PoolVisibility.objects.refresh()
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed pools: {nr_visible} visible Submissions.")
+        )
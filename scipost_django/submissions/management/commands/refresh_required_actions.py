@@ -0,0 +1,20 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.core.management.base import BaseCommand
+
+from ...models import SubmissionRequiredAction
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the required actions of the Submissions under consideration, "
+        "e.g. for those which became required as time passed since the last update."
+    )
+
+    def handle(self, *args, **kwargs):
+        nr_actions = SubmissionRequiredAction.objects.refresh()
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed required actions: {nr_actions} actions.")
+        )
@@ -8,6 +8,8 @@ from .communication import EditorialCommunicationQuerySet
 
 from .decision import EditorialDecisionQuerySet
 
+from .pool_visibility import PoolVisibilityQuerySet
+
 from .qualification import QualificationQuerySet
 
 from .readiness import ReadinessQuerySet
@@ -18,4 +20,6 @@ from .referee_invitation import RefereeInvitationQuerySet
 
 from .report import ReportQuerySet
 
+from .required_action import SubmissionRequiredActionQuerySet
+
 from .submission import SubmissionQuerySet, SubmissionEventQuerySet
@@ -73,8 +73,16 @@ class EditorialAssignmentQuerySet(QuerySet):
         return self.filter(status=self.model.STATUS_ACCEPTED)
 
     def with_required_actions(self):
-        ids = [o.id for o in self if o.submission.cycle.has_required_actions]
-        return self.filter(id__in=ids)
+        """Filter for the EditorialAssignments whose Submission has required actions."""
+        from submissions.models import SubmissionRequiredAction
+
+        return self.filter(
+            Exists(
+                SubmissionRequiredAction.objects.filter(
+                    submission=OuterRef("submission")
+                )
+            )
+        )
 
     def accepted(self):
         return self.filter(
@@ -0,0 +1,59 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from collections import defaultdict
+
+from django.db import models, transaction
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from submissions.models import PoolVisibility
+
+
+class PoolVisibilityQuerySet(models.QuerySet["PoolVisibility"]):
+    def refresh(self, submissions: Iterable | None = None, fellowships=None) -> int:
+        """
+        Recompute the visibility of the given Submissions and/or Fellowships
+        (by default: all of them), returning the number of visible pairs.
+        """
+        from scipost.models import Contributor
+        from submissions.models import Submission
+
+        scope = models.Q()
+        if submissions is not None:
+            scope &= models.Q(submission__in=submissions)
+        if fellowships is not None:
+            scope &= models.Q(fellowship__in=fellowships)
+
+        # The (fellowship, submission) pairs to consider, per Contributor
+        pairs = defaultdict(list)
+        for contributor_id, fellowship_id, submission_id in (
+            Submission.fellows.through.objects.filter(scope)
+            .values_list("fellowship__contributor_id", "fellowship_id", "submission_id")
+            .order_by()
+        ):
+            pairs[contributor_id].append((fellowship_id, submission_id))
+
+        visibilities = []
+        for contributor in Contributor.objects.filter(id__in=pairs).select_related(
+            "profile"
+        ):
+            visible_ids = set(
+                Submission.objects.filter(
+                    id__in={submission_id for _, submission_id in pairs[contributor.id]}
+                )
+                .exclude_conflicted(contributor)
+                .values_list("id", flat=True)
+            )
+            visibilities += [
+                self.model(fellowship_id=fellowship_id, submission_id=submission_id)
+                for fellowship_id, submission_id in pairs[contributor.id]
+                if submission_id in visible_ids
+            ]
+
+        with transaction.atomic():
+            self.model.objects.filter(scope).delete()
+            self.model.objects.bulk_create(visibilities, ignore_conflicts=True)
+        return len(visibilities)
@@ -0,0 +1,50 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.db import models, transaction
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from submissions.models import SubmissionRequiredAction
+
+
+class SubmissionRequiredActionQuerySet(models.QuerySet["SubmissionRequiredAction"]):
+    def refresh(self, submissions: Iterable | None = None) -> int:
+        """
+        Recompute the required actions of the given Submissions (as a queryset
+        or ids; by default: all of them), returning the number of actions.
+
+        Only the Submissions in the thread of an ongoing EditorialAssignment
+        have their actions stored; those of the others are removed.
+        """
+        from submissions.models import EditorialAssignment, Submission
+
+        scope = models.Q()
+        if submissions is not None:
+            scope = models.Q(submission__in=submissions)
+
+        in_progress = Submission.objects.filter(
+            thread_hash__in=EditorialAssignment.objects.ongoing().values(
+                "submission__thread_hash"
+            )
+        ).select_related("submitted_to", "proceedings", "preprint")
+        if submissions is not None:
+            in_progress = in_progress.filter(id__in=submissions)
+
+        required_actions = [
+            self.model(
+                submission=submission,
+                kind=action.kind,
+                target=action.target,
+                due_date=action.due_date,
+            )
+            for submission in in_progress
+            for action in submission.cycle.required_actions
+        ]
+
+        with transaction.atomic():
+            self.model.objects.filter(scope).delete()
+            self.model.objects.bulk_create(required_actions, ignore_conflicts=True)
+        return len(required_actions)
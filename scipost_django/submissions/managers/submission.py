@@ -14,6 +14,7 @@ from django.utils import timezone
 from comments.models import Comment
 from common.utils.db import SplitString
 from common.utils.models import queryset_annotation
+from common.utils.search import FullTextSearchQuerySetMixin
 from common.utils.text import initialize
 from submissions.models.qualification import Qualification
 from submissions.models.readiness import Readiness
@@ -29,7 +30,7 @@ if TYPE_CHECKING:
     from submissions.models import Submission
 
 
-class SubmissionQuerySet(models.QuerySet["Submission"]):
+class SubmissionQuerySet(FullTextSearchQuerySetMixin, models.QuerySet["Submission"]):
     ##################################
     # Shortcuts for status filtering #
     ##################################
@@ -191,6 +192,28 @@ class SubmissionQuerySet(models.QuerySet["Submission"]):
 
         return qs
 
+    def exclude_conflicted(self, contributor: "Contributor"):
+        """
+        Exclude Submissions for which the contributor has a conflict of interest
+        with the authors, or is (possibly) an author.
+        """
+        # Exclude Submissions where the contributor is a real author, claims authorship,
+        # or their name could be in the author list but also has not claimed the association is false.
+        # (Without a profile, only the authorships and claims can be excluded.)
+        qs = self
+        authorship = Q(authors_claims=contributor) | Q(authors=contributor)
+
+        if profile := contributor.profile:
+            # remove Submissions for which a conflict of interest exists:
+            qs = qs.annot_authors_have_nonexpired_coi_with_profile(profile).exclude(
+                authors_have_nonexpired_coi_with_profile=True
+            )
+            authorship |= self.Q_profile_possibly_in_author_list(profile) & ~Q(
+                authors_false_claims=contributor
+            )
+
+        return qs.exclude(authorship)
+
     def in_pool(
         self,
         user: "AbstractBaseUser",
@@ -210,7 +233,7 @@ class SubmissionQuerySet(models.QuerySet["Submission"]):
         For Senior Fellows, exclude INCOMING status;
         for other Fellows, also exclude PREASSIGNMENT.
         """
-        from submissions.models.submission import Submission
+        from submissions.models import PoolVisibility
 
         contributor: Contributor | None = getattr(user, "contributor", None)
         if contributor is None:
@@ -221,44 +244,35 @@ class SubmissionQuerySet(models.QuerySet["Submission"]):
 
         qs = self.all()
 
-        # remove Submissions for which a conflict of interest exists:
-        qs = (
-            qs.all()
-            .annot_authors_have_nonexpired_coi_with_profile(contributor.profile)
-            .exclude(authors_have_nonexpired_coi_with_profile=True)
-        )
-
-        # Exclude Submissions where the contributor is a real author, claims authorship,
-        # or their name could be in the author list but also has not claimed the association is false.
-        qs = qs.exclude(
-            Q(authors_claims=contributor)
-            | Q(authors=contributor)
-            | (
-                self.Q_profile_possibly_in_author_list(contributor.profile)
-                & ~Q(authors_false_claims=contributor)
+        if contributor.is_ed_admin:
+            qs = qs.exclude_conflicted(contributor)
+        elif PoolVisibility.objects.exists():
+            # for non-EdAdmin, filter: in Submission's Fellowship (without conflicts),
+            # as materialized in the PoolVisibility table
+            qs = qs.filter(
+                Exists(
+                    PoolVisibility.objects.filter(
+                        submission_id=models.OuterRef("pk"),
+                        fellowship_id__in=contributor.fellowships.active(),
+                    )
+                )
+            )
+        else:
+            # the PoolVisibility table is not populated yet: compute it on the fly
+            qs = qs.exclude_conflicted(contributor).filter(
+                Exists(
+                    self.model.fellows.through.objects.filter(
+                        submission_id=models.OuterRef("pk"),
+                        fellowship_id__in=contributor.fellowships.active(),
+                    )
+                )
             )
-        )
 
         if latest:
             qs = qs.latest()
         if not historical:
             qs = qs.filter(status__in=self.model.UNDER_CONSIDERATION)
 
-        # for non-EdAdmin, filter: in Submission's Fellowship
-        if not user.contributor.is_ed_admin:
-            qs = (
-                qs.all()
-                .annotate(
-                    fellowship_in_submission_fellowships=Exists(
-                        Submission.fellows.through.objects.filter(
-                            submission_id=models.OuterRef("pk"),
-                            fellowship_id__in=contributor.fellowships.active(),
-                        )
-                    )
-                )
-                .filter(fellowship_in_submission_fellowships=True)
-            )
-
         if user.contributor.is_scipost_admin:
             pass
         # Fellows can't see incoming and (non-Senior) preassignment
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:44
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("journals", "0142_alter_publicationresource_options"),
+        ("submissions", "0176_remove_submission_needs_coauthorships_update_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NearDuplicateSignature",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "band_hashes",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), default=list, size=None
+                    ),
+                ),
+                ("indexed_on", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "publication",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="near_duplicate_signature",
+                        to="journals.publication",
+                    ),
+                ),
+                (
+                    "submission",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="near_duplicate_signature",
+                        to="submissions.submission",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["band_hashes"], name="submissions_band_ha_ae70df_gin"
+                    )
+                ],
+            },
+        ),
+    ]
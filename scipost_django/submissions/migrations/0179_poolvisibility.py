@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("colleges", "0049_alter_fellowshipnominationevent_by_and_more"),
+        ("submissions", "0178_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PoolVisibility",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "fellowship",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pool_visibilities",
+                        to="colleges.fellowship",
+                    ),
+                ),
+                (
+                    "submission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pool_visibilities",
+                        to="submissions.submission",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("fellowship", "submission"),
+                        name="unique_together_fellowship_submission",
+                    )
+                ],
+            },
+        ),
+    ]
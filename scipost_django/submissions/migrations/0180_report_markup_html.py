@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0179_poolvisibility"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="report",
+            name="report_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="report",
+            name="requested_changes_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="report",
+            name="strengths_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="report",
+            name="weaknesses_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0180_report_markup_html"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["submission_date", "id"], name="submissions_submiss_d25dca_idx"
+            ),
+        ),
+    ]
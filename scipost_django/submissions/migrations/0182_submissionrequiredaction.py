@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0181_submission_date_id_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubmissionRequiredAction",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=64)),
+                ("target", models.CharField(blank=True, max_length=64)),
+                ("due_date", models.DateField(blank=True, null=True)),
+                (
+                    "submission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="required_actions",
+                        to="submissions.submission",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["due_date"], name="submissions_due_dat_0441cf_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("submission", "kind", "target"),
+                        name="unique_together_submission_kind_target",
+                    )
+                ],
+            },
+        ),
+    ]
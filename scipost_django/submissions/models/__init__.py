@@ -17,10 +17,14 @@ from .plagiarism_assessment import (
 
 from .iThenticate_report import iThenticateReport
 
+from .near_duplicate_signature import NearDuplicateSignature
+
 from .assignment import EditorialAssignment, ConditionalAssignmentOffer
 
 from .communication import EditorialCommunication
 
+from .pool_visibility import PoolVisibility
+
 from .preprint_server import PreprintServer
 
 from .qualification import Qualification
@@ -29,6 +33,8 @@ from .readiness import Readiness
 
 from .referee_invitation import RefereeInvitation
 
+from .required_action import SubmissionRequiredAction
+
 from .report import Report
 
 from .recommendation import EICRecommendation, AlternativeRecommendation
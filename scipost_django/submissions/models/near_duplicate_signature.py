@@ -0,0 +1,113 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+from django.db.models import F, Q
+from django.utils import timezone
+
+from common.utils.minhash import lsh_band_hashes, minhash_signature, shingles
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from journals.models import Publication
+    from submissions.models import Submission
+
+
+class NearDuplicateSignature(models.Model):
+    """
+    Locality-sensitive hashes of the title and abstract of a Submission or Publication.
+
+    The title (character shingles) and abstract (word shingles) are MinHashed,
+    and the signatures are split into bands which are hashed. Submissions or
+    Publications sharing a band hash are candidate near-duplicates, to be confirmed
+    by a direct comparison of the texts (see the internal plagiarism tasks).
+    """
+
+    NUM_BANDS = 40
+    BAND_SIZE = 3
+    # field: (shingle size, word shingles)
+    SHINGLING = {
+        "title": (4, False),
+        "abstract": (2, True),
+    }
+
+    submission = models.OneToOneField["Submission"](
+        "submissions.Submission",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="near_duplicate_signature",
+    )
+    publication = models.OneToOneField["Publication"](
+        "journals.Publication",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="near_duplicate_signature",
+    )
+    band_hashes = ArrayField(models.BigIntegerField(), default=list)
+    indexed_on = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [GinIndex(fields=["band_hashes"])]
+
+    def __str__(self):
+        return f"Near-duplicate signature of {self.submission or self.publication}"
+
+    @classmethod
+    def compute_band_hashes(cls, obj: "Submission | Publication") -> list[int]:
+        band_hashes = []
+        for field, (size, words) in cls.SHINGLING.items():
+            if shingle_set := shingles(getattr(obj, field) or "", size, words=words):
+                signature = minhash_signature(
+                    shingle_set, cls.NUM_BANDS * cls.BAND_SIZE
+                )
+                band_hashes += lsh_band_hashes(signature, cls.BAND_SIZE, prefix=field)
+        return band_hashes
+
+    @classmethod
+    def update_index(cls, batch_size: int = 500) -> int:
+        """
+        Create or refresh the signatures of all Submissions and Publications
+        which are not yet indexed, or which were modified since their indexing.
+        Returns the number of signatures created or updated.
+        """
+        from journals.models import Publication
+        from submissions.models import Submission
+
+        nr_indexed = 0
+        for model, field in ((Submission, "submission"), (Publication, "publication")):
+            to_index = model.objects.filter(
+                Q(near_duplicate_signature__isnull=True)
+                | Q(latest_activity__gt=F("near_duplicate_signature__indexed_on"))
+            ).only("id", "title", "abstract")
+            existing = dict(
+                cls.objects.filter(**{f"{field}__in": to_index.values("id")})
+                .values_list(f"{field}_id", "id")
+                .order_by()
+            )
+            now = timezone.now()
+            signatures = [
+                cls(
+                    id=existing.get(obj.id),
+                    band_hashes=cls.compute_band_hashes(obj),
+                    indexed_on=now,
+                    **{field: obj},
+                )
+                for obj in to_index.order_by().iterator()
+            ]
+            cls.objects.bulk_create(
+                [signature for signature in signatures if signature.id is None],
+                batch_size=batch_size,
+            )
+            cls.objects.bulk_update(
+                [signature for signature in signatures if signature.id is not None],
+                ["band_hashes", "indexed_on"],
+                batch_size=batch_size,
+            )
+            nr_indexed += len(signatures)
+        return nr_indexed
@@ -0,0 +1,51 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.db import models
+
+from ..managers import PoolVisibilityQuerySet
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from colleges.models import Fellowship
+    from submissions.models import Submission
+
+
+class PoolVisibility(models.Model):
+    """
+    Materialized visibility of a Submission in the pool of a Fellowship.
+
+    A row exists if the Fellowship is among the Submission's fellows, and its
+    Contributor has neither a conflict of interest with the authors nor is
+    (possibly) an author. Rows are refreshed from signals when these change,
+    and in full by the `refresh_pool_visibilities` command (e.g. for expired
+    conflicts of interest), which also populates the table after its creation;
+    until then, `in_pool` computes the visibility on the fly.
+    Status-based restrictions are applied by `in_pool`.
+    """
+
+    fellowship = models.ForeignKey["Fellowship"](
+        "colleges.Fellowship",
+        on_delete=models.CASCADE,
+        related_name="pool_visibilities",
+    )
+    submission = models.ForeignKey["Submission"](
+        "submissions.Submission",
+        on_delete=models.CASCADE,
+        related_name="pool_visibilities",
+    )
+
+    objects = PoolVisibilityQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["fellowship", "submission"],
+                name="unique_together_fellowship_submission",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.submission} in pool of {self.fellowship}"
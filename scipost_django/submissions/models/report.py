@@ -13,6 +13,7 @@ from django.urls import reverse
 from django.utils.datastructures import OrderedSet
 from django.utils.functional import cached_property
 
+from markup.mixins import MarkupHTMLFieldsMixin
 from scipost.models import Contributor
 from scipost.storage import SecureFileStorage
 from comments.behaviors import validate_file_extension, validate_max_file_size
@@ -45,7 +46,7 @@ if TYPE_CHECKING:
     from ethics.models import GenAIDisclosure
 
 
-class Report(SubmissionRelatedObjectMixin, models.Model):
+class Report(MarkupHTMLFieldsMixin, SubmissionRelatedObjectMixin, models.Model):
     """Report on a Submission, written by a Contributor."""
 
     status = models.CharField(
@@ -93,6 +94,17 @@ class Report(SubmissionRelatedObjectMixin, models.Model):
     weaknesses = models.TextField(blank=True)
     report = models.TextField(blank=True)
     requested_changes = models.TextField(verbose_name="requested changes", blank=True)
+    # Processed markup of the above
+    strengths_html = models.TextField(blank=True, editable=False)
+    weaknesses_html = models.TextField(blank=True, editable=False)
+    report_html = models.TextField(blank=True, editable=False)
+    requested_changes_html = models.TextField(blank=True, editable=False)
+    markup_html_fields = {
+        "strengths": "strengths_html",
+        "weaknesses": "weaknesses_html",
+        "report": "report_html",
+        "requested_changes": "requested_changes_html",
+    }
 
     # Comments can be added to a Submission
     comments = GenericRelation("comments.Comment", related_query_name="reports")
@@ -0,0 +1,48 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from django.db import models
+
+from ..managers import SubmissionRequiredActionQuerySet
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from submissions.models import Submission
+
+
+class SubmissionRequiredAction(models.Model):
+    """
+    Materialized required action in the refereeing cycle of a Submission.
+
+    Rows mirror the actions of `submission.cycle.required_actions`, for the
+    Submissions in the thread of an ongoing EditorialAssignment. They are refreshed
+    from signals on the objects the actions depend on, and in full by the
+    `refresh_required_actions` command (e.g. for actions which become required
+    as time passes), which also populates the table after its creation.
+    The texts of the actions are still rendered from the cycle.
+    """
+
+    submission = models.ForeignKey["Submission"](
+        "submissions.Submission",
+        on_delete=models.CASCADE,
+        related_name="required_actions",
+    )
+    kind = models.CharField(max_length=64)
+    target = models.CharField(max_length=64, blank=True)
+    due_date = models.DateField(blank=True, null=True)
+
+    objects = SubmissionRequiredActionQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["submission", "kind", "target"],
+                name="unique_together_submission_kind_target",
+            ),
+        ]
+        indexes = [models.Index(fields=["due_date"])]
+
+    def __str__(self):
+        return f"{self.kind} ({self.target or '-'}) for {self.submission}"
@@ -6,6 +6,8 @@ import datetime
 import uuid
 
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.db.models import F, Q, Func, OuterRef, QuerySet, Subquery
 from django.db.models.functions import Cast, Coalesce, Lower
@@ -19,6 +21,7 @@ from guardian.models import UserObjectPermissionBase, GroupObjectPermissionBase
 from guardian.shortcuts import assign_perm, remove_perm
 
 from common.utils.db import SplitString, GetElement
+from common.utils.search import weighted_search_vector
 from scipost.behaviors import TimeStampedModel
 from scipost.constants import SCIPOST_APPROACHES
 from scipost.fields import ChoiceArrayField
@@ -294,6 +297,13 @@ class Submission(models.Model):
         (COAUTHORSHIPS_FAILED, "Failed"),
     )
 
+    SEARCH_VECTOR_WEIGHTS = {
+        "title": "A",
+        "author_list": "B",
+        "abstract": "C",
+    }
+    SEARCH_TRIGRAM_FIELDS = ["title", "author_list"]
+
     # Related managers
     if TYPE_CHECKING:
         referee_invitations: "RelatedManager[RefereeInvitation]"
@@ -490,6 +500,13 @@ class Submission(models.Model):
     latest_activity = models.DateTimeField(auto_now=True)
     update_search_index = models.BooleanField(default=True)
 
+    # Full text search, maintained by the database
+    search_vector = models.GeneratedField(
+        expression=weighted_search_vector(SEARCH_VECTOR_WEIGHTS),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     objects = SubmissionQuerySet.as_manager()
 
     # Temporary
@@ -512,6 +529,19 @@ class Submission(models.Model):
     class Meta:
         app_label = "submissions"
         ordering = ["-submission_date"]
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            # Trigram indexes for the word similarity fallback of the search
+            GinIndex(
+                OpClass("title", name="gin_trgm_ops"),
+                name="submissions_title_trgm_idx",
+            ),
+            GinIndex(
+                OpClass("author_list", name="gin_trgm_ops"),
+                name="submissions_authors_trgm_idx",
+            ),
+            models.Index(fields=["submission_date", "id"]),
+        ]
         permissions = [
             ("take_edadmin_actions", "Take editorial admin actions"),
             ("view_edadmin_info", "View editorial admin information"),
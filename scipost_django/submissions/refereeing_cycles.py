@@ -48,6 +48,20 @@ class BaseAction:
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.id)
 
+    @property
+    def kind(self):
+        return self.__class__.__name__
+
+    @property
+    def target(self):
+        """The `Model.id` of the object requiring the action, if any."""
+        return self.id if self._objects else ""
+
+    @property
+    def due_date(self) -> datetime.date | None:
+        """The deadline the action relates to, if any."""
+        return None
+
     def _format_text(self, text, obj=None):
         if obj is None and self._objects:
             obj = self._objects[0]
@@ -126,8 +140,16 @@ class DeadlineAction(BaseAction):
         "(with {deadline} days left), but not yet delivered it. Consider sending a reminder."
     )
 
+    @property
+    def due_date(self):
+        invitation = self._objects[0]
+        if invitation.intended_delivery_date:
+            return invitation.intended_delivery_date
+        if invitation.submission.reporting_deadline:
+            return invitation.submission.reporting_deadline.date()
+
 
-class OverdueAction(BaseAction):
+class OverdueAction(DeadlineAction):
     txt = (
         "Referee {referee} has accepted to send a Report "
         "({deadline_min} days overdue), but not yet delivered it. Consider sending a reminder."
@@ -160,6 +182,10 @@ class InvalidCycleWithoutRecAction(BaseAction):
 class NoEICRecommendationAction(BaseAction):
     needs_referees = False
 
+    @property
+    def due_date(self):
+        return self.submission.reporting_deadline.date()
+
     @property
     def txt(self):
         if self.needs_referees:
@@ -0,0 +1,145 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+
+from submissions.models import PoolVisibility, Submission, SubmissionRequiredAction
+
+M2M_CHANGED_ACTIONS = ["post_add", "post_remove", "post_clear"]
+
+# The Submission fields which the required actions depend on
+REQUIRED_ACTIONS_SUBMISSION_FIELDS = {
+    "status",
+    "reporting_deadline",
+    "refereeing_cycle",
+}
+
+
+def m2m_changed_refresh_pool_visibility_of_fellows(
+    sender, instance, action, reverse, **kwargs
+):
+    """
+    When the fellows of a Submission change, refresh its pool visibility
+    (or that of the Fellowship, if changed from the Fellowship's side).
+    """
+    if action not in M2M_CHANGED_ACTIONS:
+        return
+    if reverse:
+        PoolVisibility.objects.refresh(fellowships=[instance])
+    else:
+        PoolVisibility.objects.refresh(submissions=[instance])
+
+
+def m2m_changed_refresh_pool_visibility_of_authors(
+    sender, instance, action, reverse, **kwargs
+):
+    """
+    When the (claimed) authors of a Submission change, refresh its pool visibility
+    (or that of the Contributor's Fellowships, if changed from the Contributor's side).
+    """
+    if action not in M2M_CHANGED_ACTIONS:
+        return
+    if reverse:
+        PoolVisibility.objects.refresh(fellowships=instance.fellowships.all())
+    else:
+        PoolVisibility.objects.refresh(submissions=[instance])
+
+
+def detect_author_list_change(sender, instance, **kwargs):
+    """
+    Before a Submission is saved, flag it for a pool visibility refresh
+    if its author list is edited, since the possible authorships may change.
+    """
+    if kwargs.get("raw") or instance.pk is None:
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields and "author_list" not in update_fields:
+        return
+    instance._author_list_changed = not Submission.objects.filter(
+        pk=instance.pk, author_list=instance.author_list
+    ).exists()
+
+
+def refresh_pool_visibility_of_author_list(sender, instance, **kwargs):
+    """When the author list of a Submission was edited, refresh its pool visibility."""
+    if getattr(instance, "_author_list_changed", False):
+        instance._author_list_changed = False
+        PoolVisibility.objects.refresh(submissions=[instance])
+
+
+def refresh_pool_visibility_of_author_profile(sender, instance, **kwargs):
+    """
+    When an author Profile of a Submission is (un)linked, refresh the Submission's
+    pool visibility, since the conflicts of interest with its authors may change.
+    """
+    PoolVisibility.objects.refresh(submissions=[instance.submission_id])
+
+
+def refresh_pool_visibility_of_conflict_of_interest(sender, instance, **kwargs):
+    """
+    When a ConflictOfInterest is saved or deleted, refresh the pool visibility
+    of the Fellowships of both Profiles involved.
+    """
+    from colleges.models import Fellowship
+
+    PoolVisibility.objects.refresh(
+        fellowships=Fellowship.objects.filter(
+            contributor__profile_id__in=[
+                instance.profile_id,
+                instance.related_profile_id,
+            ]
+        )
+    )
+
+
+def refresh_required_actions_of_thread(submission_id):
+    """
+    Refresh the required actions of the Submissions in the thread of the given one,
+    since these also depend on the other versions (e.g. their vetted Reports).
+    """
+    SubmissionRequiredAction.objects.refresh(
+        Submission.objects.filter(
+            thread_hash__in=Submission.objects.filter(id=submission_id).values(
+                "thread_hash"
+            )
+        )
+    )
+
+
+def refresh_required_actions_of_submission(sender, instance, **kwargs):
+    """
+    When a Submission is saved (unless none of the fields the required actions
+    depend on is), refresh the required actions of its thread.
+    """
+    if kwargs.get("raw"):
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not REQUIRED_ACTIONS_SUBMISSION_FIELDS & set(update_fields):
+        return
+    refresh_required_actions_of_thread(instance.id)
+
+
+def refresh_required_actions_of_submission_object(sender, instance, **kwargs):
+    """
+    When an object of a Submission which the required actions depend on
+    (e.g. a Report or a RefereeInvitation) is saved or deleted,
+    refresh the required actions of the Submission's thread.
+    """
+    if kwargs.get("raw"):
+        return
+    refresh_required_actions_of_thread(instance.submission_id)
+
+
+def refresh_required_actions_of_comment(sender, instance, **kwargs):
+    """
+    When a Comment is saved or deleted, refresh the required actions of the thread
+    of the Submission it (possibly indirectly) relates to, if any.
+    """
+    if kwargs.get("raw"):
+        return
+    try:
+        submission = instance.core_content_object
+    except Exception:
+        # The object commented on is deleted or not supported
+        return
+    if isinstance(submission, Submission):
+        refresh_required_actions_of_thread(submission.id)
@@ -8,7 +8,13 @@ from django.utils import timezone
 
 from SciPost_v1.celery import app
 
-from .models import Submission, EditorialAssignment, RefereeInvitation, Report
+from .models import (
+    Submission,
+    EditorialAssignment,
+    NearDuplicateSignature,
+    RefereeInvitation,
+    Report,
+)
 
 from journals.models import Publication
 
@@ -32,43 +38,63 @@ def submit_submission_document_for_plagiarism(self):
         # do it...
 
 
+def _plagiarism_ratios(sub_to_check, other):
+    return {
+        "ratio_title": SequenceMatcher(None, sub_to_check.title, other.title).ratio(),
+        "ratio_authors": SequenceMatcher(
+            None, sub_to_check.author_list, other.author_list
+        ).ratio(),
+        "ratio_abstract": SequenceMatcher(
+            None, sub_to_check.abstract, other.abstract
+        ).ratio(),
+    }
+
+
+def _signature_band_hashes(submission):
+    try:
+        return submission.near_duplicate_signature.band_hashes
+    except NearDuplicateSignature.DoesNotExist:
+        return NearDuplicateSignature.compute_band_hashes(submission)
+
+
 @app.task(bind=True)
 def check_for_internal_plagiarism_submission_matches(self, ratio_threshold=0.7):
     """
     Check Submissions for internal plagiarism with preexisting Submissions.
+
+    Only the Submissions sharing a band hash of their NearDuplicateSignature
+    with the Submission to check are compared.
     """
+    NearDuplicateSignature.update_index()
 
     submissions_to_check = Submission.objects.exclude(
         internal_plagiarism_matches__has_key="submission_matches"
-    )
+    ).select_related("near_duplicate_signature")
 
-    # Check in small batches to not overwhelm the server
-    for sub_to_check in submissions_to_check.all()[:5]:
+    for sub_to_check in submissions_to_check.iterator():
         submission_matches = []
-        # check all Submissions which predate, and are not in the thread of the sub
-        for sub in Submission.objects.exclude(
-            thread_hash=sub_to_check.thread_hash
-        ).filter(submission_date__lt=sub_to_check.submission_date):
-            sub_title_sm = SequenceMatcher(None, sub_to_check.title, sub.title)
-            ratio_title = sub_title_sm.ratio()
-            ratio_authors = SequenceMatcher(
-                None, sub_to_check.author_list, sub.author_list
-            ).ratio()
-            ratio_abstract = SequenceMatcher(
-                None, sub_to_check.abstract, sub.abstract
-            ).ratio()
-            if ratio_title > ratio_threshold or ratio_abstract > ratio_threshold:
+        # check all candidate Submissions which predate, and are not in the thread of the sub
+        for sub in (
+            Submission.objects.filter(
+                near_duplicate_signature__band_hashes__overlap=_signature_band_hashes(
+                    sub_to_check
+                )
+            )
+            .exclude(thread_hash=sub_to_check.thread_hash)
+            .filter(submission_date__lt=sub_to_check.submission_date)
+            .select_related("preprint")
+        ):
+            ratios = _plagiarism_ratios(sub_to_check, sub)
+            if (
+                ratios["ratio_title"] > ratio_threshold
+                or ratios["ratio_abstract"] > ratio_threshold
+            ):
                 submission_matches.append(
-                    {
-                        "identifier_w_vn_nr": sub.preprint.identifier_w_vn_nr,
-                        "ratio_title": ratio_title,
-                        "ratio_authors": ratio_authors,
-                        "ratio_abstract": ratio_abstract,
-                    }
+                    {"identifier_w_vn_nr": sub.preprint.identifier_w_vn_nr, **ratios}
                 )
-        sub_to_check.internal_plagiarism_matches[
-            "submission_matches"
-        ] = submission_matches
+        sub_to_check.internal_plagiarism_matches["submission_matches"] = (
+            submission_matches
+        )
         sub_to_check.save()
 
 
@@ -76,35 +102,31 @@ def check_for_internal_plagiarism_submission_matches(self, ratio_threshold=0.7):
 def check_for_internal_plagiarism_publication_matches(self, ratio_threshold=0.7):
     """
     Check Submissions for internal plagiarism with existing Publications.
+
+    Only the Publications sharing a band hash of their NearDuplicateSignature
+    with the Submission to check are compared.
     """
+    NearDuplicateSignature.update_index()
 
     submissions_to_check = Submission.objects.exclude(
         internal_plagiarism_matches__has_key="publication_matches"
-    )
+    ).select_related("near_duplicate_signature")
 
-    # Check in small batches to not overwhelm the server
-    for sub_to_check in submissions_to_check.all()[:5]:
+    for sub_to_check in submissions_to_check.iterator():
         publication_matches = []
         for pub in Publication.objects.filter(
-            publication_date__lt=sub_to_check.submission_date
+            near_duplicate_signature__band_hashes__overlap=_signature_band_hashes(
+                sub_to_check
+            ),
+            publication_date__lt=sub_to_check.submission_date,
         ):
-            ratio_title = SequenceMatcher(None, sub_to_check.title, pub.title).ratio()
-            ratio_authors = SequenceMatcher(
-                None, sub_to_check.author_list, pub.author_list
-            ).ratio()
-            ratio_abstract = SequenceMatcher(
-                None, sub_to_check.abstract, pub.abstract
-            ).ratio()
-            if ratio_title > ratio_threshold or ratio_abstract > ratio_threshold:
-                publication_matches.append(
-                    {
-                        "doi_label": pub.doi_label,
-                        "ratio_title": ratio_title,
-                        "ratio_authors": ratio_authors,
-                        "ratio_abstract": ratio_abstract,
-                    }
-                )
-        sub_to_check.internal_plagiarism_matches[
-            "publication_matches"
-        ] = publication_matches
+            ratios = _plagiarism_ratios(sub_to_check, pub)
+            if (
+                ratios["ratio_title"] > ratio_threshold
+                or ratios["ratio_abstract"] > ratio_threshold
+            ):
+                publication_matches.append({"doi_label": pub.doi_label, **ratios})
+        sub_to_check.internal_plagiarism_matches["publication_matches"] = (
+            publication_matches
+        )
         sub_to_check.save()
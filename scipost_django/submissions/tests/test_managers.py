@@ -0,0 +1,201 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from colleges.models import Fellowship
+from ethics.models import ConflictOfInterest
+from journals.factories import JournalFactory
+from ontology.factories import AcademicFieldFactory
+from preprints.factories import PreprintFactory
+from profiles.factories import ProfileFactory
+from scipost.models import Contributor
+
+from ..constants import CYCLE_DEFAULT
+from ..models import (
+    EditorialAssignment,
+    PoolVisibility,
+    RefereeInvitation,
+    Submission,
+    SubmissionAuthorProfile,
+    SubmissionRequiredAction,
+)
+
+
+class SubmissionPoolTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = JournalFactory(college__acad_field=AcademicFieldFactory())
+        cls.frank = cls.create_fellow("Frank", "Fellow")
+        cls.grace = cls.create_fellow("Grace", "Greene")
+        cls.author = ProfileFactory(first_name="Alice", last_name="Anderson")
+
+        cls.submission = cls.create_submission("Alice Anderson")
+        SubmissionAuthorProfile.objects.create(
+            submission=cls.submission, profile=cls.author, order=1
+        )
+        cls.submission.fellows.add(*Fellowship.objects.all())
+        # Frank is possibly an author of this one
+        cls.authored_submission = cls.create_submission("Alice Anderson, F. Fellow")
+        cls.authored_submission.fellows.add(*Fellowship.objects.all())
+        # Grace is not among the fellows of this one
+        cls.other_submission = cls.create_submission("Alice Anderson")
+        cls.other_submission.fellows.add(cls.frank.fellowships.get())
+
+    @classmethod
+    def create_fellow(cls, first_name, last_name):
+        contributor = Contributor.objects.create(
+            dbuser=get_user_model().objects.create_user(username=last_name),
+            profile=ProfileFactory(first_name=first_name, last_name=last_name),
+        )
+        Fellowship.objects.create(college=cls.journal.college, contributor=contributor)
+        return contributor
+
+    @classmethod
+    def create_submission(cls, author_list):
+        return Submission.objects.create(
+            preprint=PreprintFactory(),
+            author_list=author_list,
+            acad_field=cls.journal.college.acad_field,
+            submitted_by=Contributor.objects.create(),
+            submitted_to=cls.journal,
+            title="Title",
+            abstract="Abstract",
+            status=Submission.SEEKING_ASSIGNMENT,
+        )
+
+    def assertPool(self, fellow, submissions):
+        self.assertCountEqual(Submission.objects.in_pool(fellow.dbuser), submissions)
+
+    def test_in_pool(self):
+        self.assertPool(self.frank, [self.submission, self.other_submission])
+        self.assertPool(self.grace, [self.submission, self.authored_submission])
+        # Materialized in the PoolVisibility table, as recomputed in full
+        self.assertEqual(PoolVisibility.objects.count(), 4)
+        self.assertEqual(PoolVisibility.objects.refresh(), 4)
+
+    def test_in_pool_updates(self):
+        coi = ConflictOfInterest.objects.create(
+            nature=ConflictOfInterest.COAUTHOR,
+            date_from=timezone.now().date(),
+            profile=self.grace.profile,
+            related_profile=self.author,
+            declared_by=self.grace,
+        )
+        self.assertPool(self.grace, [self.authored_submission])
+        coi.delete()
+        self.assertPool(self.grace, [self.submission, self.authored_submission])
+
+        self.authored_submission.authors_false_claims.add(self.frank)
+        self.other_submission.fellows.clear()
+        self.assertPool(self.frank, [self.submission, self.authored_submission])
+
+        self.submission.author_list = "Alice Anderson, G. Greene"
+        self.submission.save()
+        self.assertPool(self.grace, [self.authored_submission])
+        self.submission.author_list = "Alice Anderson"
+        self.submission.save(update_fields=["author_list"])
+        self.assertPool(self.grace, [self.submission, self.authored_submission])
+
+    def test_in_pool_before_populated(self):
+        PoolVisibility.objects.all().delete()
+        self.assertPool(self.frank, [self.submission, self.other_submission])
+        self.assertPool(self.grace, [self.submission, self.authored_submission])
+
+    def test_in_pool_fellow_without_profile(self):
+        contributor = Contributor.objects.create(
+            dbuser=get_user_model().objects.create_user(username="Noprofile")
+        )
+        fellowship = Fellowship.objects.create(
+            college=self.journal.college, contributor=contributor
+        )
+        self.submission.fellows.add(fellowship)
+        self.authored_submission.fellows.add(fellowship)
+        self.authored_submission.authors.add(contributor)
+        # Only the actual authorships can be excluded
+        self.assertPool(contributor, [self.submission])
+        self.assertEqual(PoolVisibility.objects.refresh(), 5)
+
+
+class SubmissionRequiredActionTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = JournalFactory(college__acad_field=AcademicFieldFactory())
+        cls.submission = Submission.objects.create(
+            preprint=PreprintFactory(),
+            author_list="Alice Anderson",
+            acad_field=cls.journal.college.acad_field,
+            submitted_by=Contributor.objects.create(),
+            submitted_to=cls.journal,
+            title="Title",
+            abstract="Abstract",
+            status=Submission.IN_REFEREEING,
+            refereeing_cycle=CYCLE_DEFAULT,
+            reporting_deadline=timezone.now() + datetime.timedelta(days=20),
+        )
+        cls.fellow = Contributor.objects.create(
+            dbuser=get_user_model().objects.create_user(username="fellow"),
+            profile=ProfileFactory(),
+        )
+
+    def assertActions(self, actions):
+        self.assertCountEqual(
+            self.submission.required_actions.values_list("kind", "target", "due_date"),
+            actions,
+        )
+
+    def test_required_actions_updates(self):
+        # Only stored for the Submissions under consideration
+        self.assertActions([])
+        assignment = EditorialAssignment.objects.create(
+            submission=self.submission,
+            to=self.fellow,
+            status=EditorialAssignment.STATUS_ACCEPTED,
+        )
+        self.assertActions([("NeedRefereesAction", "", None)])
+
+        invitation = RefereeInvitation.objects.create(
+            submission=self.submission,
+            referee=ProfileFactory(),
+            email_address="referee@example.org",
+            date_invited=timezone.now() - datetime.timedelta(days=8),
+            date_last_reminded=timezone.now() - datetime.timedelta(days=4),
+        )
+        self.assertActions(
+            [
+                ("NeedRefereesAction", "", None),
+                ("NoRefereeResponseAction", f"RefereeInvitation.{invitation.id}", None),
+            ]
+        )
+
+        invitation.cancelled = True
+        invitation.save()
+        self.submission.reporting_deadline = timezone.now() - datetime.timedelta(days=1)
+        self.submission.save()
+        self.assertActions(
+            [
+                (
+                    "NoEICRecommendationAction",
+                    "",
+                    self.submission.reporting_deadline.date(),
+                ),
+                ("NeedRefereesAction", "", None),
+            ]
+        )
+        # The same as recomputed in full
+        self.assertEqual(SubmissionRequiredAction.objects.refresh(), 2)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(EditorialAssignment.objects.with_required_actions()),
+                [assignment],
+            )
+
+        assignment.status = EditorialAssignment.STATUS_COMPLETED
+        assignment.save()
+        self.assertActions([])
+        self.assertFalse(EditorialAssignment.objects.with_required_actions().exists())
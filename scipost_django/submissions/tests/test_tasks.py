@@ -0,0 +1,121 @@
+__copyright__ = "Copyright © Stichting SciPost (SciPost Foundation)"
+__license__ = "AGPL v3"
+
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from common.helpers.test import create_publication
+from journals.constants import INDIVIDUAL_PUBLICATIONS
+from journals.factories import JournalFactory
+from journals.models import Publication
+from ontology.factories import AcademicFieldFactory
+from preprints.factories import PreprintFactory
+from scipost.models import Contributor
+
+from ..models import NearDuplicateSignature, Submission
+from ..tasks import (
+    check_for_internal_plagiarism_publication_matches,
+    check_for_internal_plagiarism_submission_matches,
+)
+
+TITLE = "Topological phases of strongly interacting fermions in one dimension"
+ABSTRACT = (
+    "We study the ground state phase diagram of a chain of spinless fermions "
+    "with nearest-neighbour interactions, using the density matrix renormalization "
+    "group. We identify a symmetry protected topological phase whose edge modes "
+    "survive in the presence of strong interactions, and characterize the "
+    "transitions to the neighbouring charge density wave and superfluid phases."
+)
+
+
+class InternalPlagiarismTasksTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journal = JournalFactory(
+            structure=INDIVIDUAL_PUBLICATIONS,
+            college__acad_field=AcademicFieldFactory(),
+        )
+        cls.today = timezone.now().date()
+        last_year = cls.today - datetime.timedelta(days=365)
+        cls.publication = create_publication(cls.journal, 1, [], last_year)
+        cls.unrelated_publication = create_publication(cls.journal, 2, [], last_year)
+        Publication.objects.filter(id=cls.publication.id).update(
+            title=TITLE, abstract=ABSTRACT
+        )
+        Publication.objects.filter(id=cls.unrelated_publication.id).update(
+            title="Measurement of the muon anomalous magnetic moment",
+            abstract="We report a new measurement with improved precision.",
+        )
+
+        cls.earlier_submission = cls.create_submission(
+            TITLE.replace("one dimension", "1D"),
+            ABSTRACT.replace("We study", "We investigate"),
+            cls.today - datetime.timedelta(days=30),
+        )
+        cls.submission = cls.create_submission(
+            TITLE.replace("strongly", "strongly and weakly"),
+            ABSTRACT.replace("spinless fermions", "spinless lattice fermions"),
+            cls.today,
+        )
+
+    @classmethod
+    def create_submission(cls, title, abstract, submission_date):
+        submission = Submission.objects.create(
+            preprint=PreprintFactory(),
+            author_list="A. Uthor",
+            acad_field=cls.journal.college.acad_field,
+            submitted_by=Contributor.objects.create(),
+            submitted_to=cls.journal,
+            title=title,
+            abstract=abstract,
+        )
+        Submission.objects.filter(id=submission.id).update(
+            submission_date=submission_date
+        )
+        submission.refresh_from_db()
+        return submission
+
+    def test_update_index(self):
+        self.assertEqual(NearDuplicateSignature.update_index(), 6)
+        self.assertEqual(NearDuplicateSignature.update_index(), 0)
+
+        band_hashes = self.submission.near_duplicate_signature.band_hashes
+        self.assertEqual(
+            list(
+                Publication.objects.filter(
+                    near_duplicate_signature__band_hashes__overlap=band_hashes
+                )
+            ),
+            [self.publication],
+        )
+
+        # Modified objects are reindexed
+        self.publication.refresh_from_db()
+        self.publication.save()
+        self.assertEqual(NearDuplicateSignature.update_index(), 1)
+
+    def test_check_for_internal_plagiarism_publication_matches(self):
+        check_for_internal_plagiarism_publication_matches.apply()
+        self.submission.refresh_from_db()
+        matches = self.submission.internal_plagiarism_matches["publication_matches"]
+        self.assertEqual(
+            [match["doi_label"] for match in matches], [self.publication.doi_label]
+        )
+        self.assertGreater(matches[0]["ratio_abstract"], 0.9)
+
+    def test_check_for_internal_plagiarism_submission_matches(self):
+        check_for_internal_plagiarism_submission_matches.apply()
+        self.submission.refresh_from_db()
+        matches = self.submission.internal_plagiarism_matches["submission_matches"]
+        self.assertEqual(
+            [match["identifier_w_vn_nr"] for match in matches],
+            [self.earlier_submission.preprint.identifier_w_vn_nr],
+        )
+        # All Submissions are checked in a single run
+        self.assertFalse(
+            Submission.objects.exclude(
+                internal_plagiarism_matches__has_key="submission_matches"
+            ).exists()
+        )
@@ -18,6 +18,7 @@ from django.db.models import (
 from django.db.models.functions import Cast, Coalesce, ExtractDay, ExtractIsoYear, Now
 from django.urls import reverse_lazy
 from django.utils import timezone
+from common.utils.search import search_query
 from finances.constants import SUBSIDY_RECEIVED, SUBSIDY_WITHDRAWN
 from organizations.constants import ORGANIZATION_EVENT_EMAIL_SENT
 from scipost.templatetags.user_groups import (
@@ -424,9 +425,8 @@ class TreatOngoingAssignmentsTask(TaskKind):
     @staticmethod
     def search_query(text: str) -> Q:
         return (
-            Q(submission__title__icontains=text)
+            Q(submission__search_vector=search_query(text))
             | Q(submission__preprint__identifier_w_vn_nr__icontains=text)
-            | Q(submission__author_list__unaccent__icontains=text)
         )
 
 
@@ -512,9 +512,8 @@ class VetReportTask(TaskKind):
     @staticmethod
     def search_query(text: str) -> Q:
         return (
-            Q(submission__title__icontains=text)
+            Q(submission__search_vector=search_query(text))
             | Q(submission__preprint__identifier_w_vn_nr__icontains=text)
-            | Q(submission__author_list__unaccent__icontains=text)
         )
 
 
@@ -555,7 +554,6 @@ class SelectRefereeingCycleTask(TaskKind):
     @staticmethod
     def search_query(text: str) -> Q:
         return (
-            Q(title__icontains=text)
+            Q(search_vector=search_query(text))
             | Q(preprint__identifier_w_vn_nr__icontains=text)
-            | Q(author_list__unaccent__icontains=text)
         )